@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+# measures the per-call overhead of element-wise binary operations on small arrays, comparing the fast path for
+# scalars and equally distributed arrays to the general path all operands took before, e.g.
+# python binary_op_overhead.py
+# mpirun -np <procs> python binary_op_overhead.py
+
+import timeit
+
+import numpy as np
+import torch
+
+import heat as ht
+from heat.core import operations
+from heat.core import stride_tricks
+
+REPEAT = 5
+NUMBER = 10000
+
+binary_op = getattr(operations, "__binary_op")
+align_operands = getattr(operations, "__align_operands")
+binary_op_result = getattr(operations, "__binary_op_result")
+
+
+def general_path(operation, t1, t2):
+    """
+    The general path of __binary_op without the fast path: scalars are wrapped into arrays, the broadcast shape is
+    determined and the operands are aligned to a common split axis before they are combined.
+    """
+    reference = t1 if isinstance(t1, ht.DNDarray) else t2
+    t1, t2 = (
+        ht.array([t], dtype=reference.dtype, device=reference.device) if np.isscalar(t) else t
+        for t in (t1, t2)
+    )
+    output_shape = stride_tricks.broadcast_shape(t1.shape, t2.shape)
+    t1, t2, output_split = align_operands(t1, t2, output_shape, None)
+
+    return binary_op_result(
+        operation, t1, t2, reference.dtype.torch_type(), output_shape, output_split, None
+    )
+
+
+def main():
+    a = ht.arange(10, dtype=ht.float32)
+    b = ht.arange(10, dtype=ht.float32)
+    c = ht.arange(10, dtype=ht.float64)
+    s = ht.arange(10 * ht.MPI_WORLD.size, dtype=ht.float32, split=0)
+
+    cases = [
+        ("array + scalar", torch.add, a, 2.0),
+        ("scalar - array", torch.sub, 2.0, a),
+        ("array * array", torch.mul, a, b),
+        ("float32 + float64", torch.add, a, c),
+        ("split + scalar", torch.add, s, 2.0),
+        ("array < scalar", torch.lt, a, 2.0),
+    ]
+
+    if ht.MPI_WORLD.rank == 0:
+        header = ("operation", "general us/call", "fast us/call", "speedup")
+        print("{:<20}{:>18}{:>18}{:>10}".format(*header))
+    for name, operation, t1, t2 in cases:
+        timings = []
+        for path in (general_path, binary_op):
+            ht.MPI_WORLD.Barrier()
+            timings.append(
+                min(timeit.repeat(lambda: path(operation, t1, t2), repeat=REPEAT, number=NUMBER))
+                / NUMBER
+            )
+        if ht.MPI_WORLD.rank == 0:
+            general, fast = (timing * 1e6 for timing in timings)
+            print("{:<20}{:>18.1f}{:>18.1f}{:>10.2f}".format(name, general, fast, general / fast))
+
+
+if __name__ == "__main__":
+    main()
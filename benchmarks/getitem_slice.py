@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+# measures slicing along the split axis of a large array, comparing the arithmetic intersection of the slice with the
+# local chunk to the previous intersection of index sets, e.g.
+# python getitem_slice.py
+# mpirun -np <procs> python getitem_slice.py
+
+import timeit
+
+import heat as ht
+
+LENGTH = 10 ** 7
+REPEAT = 3
+NUMBER = 1
+
+
+def set_local_slice(key, chunk_start, chunk_end, length):
+    """
+    The previous intersection of a slice along the split axis with the local chunk, materializing both index sets.
+    """
+    stop = key.stop
+    if stop is not None and stop < 0:
+        stop = length + stop
+    key_set = set(
+        range(
+            key.start if key.start is not None else 0,
+            stop if stop is not None else length,
+            key.step if key.step else 1,
+        )
+    )
+    overlap = list(key_set & set(range(chunk_start, chunk_end)))
+    if not overlap:
+        return None
+    overlap.sort()
+    hold = [x - chunk_start for x in overlap]
+
+    return slice(min(hold), max(hold) + 1, key.step)
+
+
+def main():
+    a = ht.zeros((LENGTH,), dtype=ht.uint8, split=0)
+    _, _, chunk_slice = a.comm.chunk(a.shape, a.split)
+    chunk_start, chunk_end = chunk_slice[0].start, chunk_slice[0].stop
+
+    keys = [
+        ("[:]", slice(None)),
+        ("[10:-10:3]", slice(10, -10, 3)),
+        ("[len/2:]", slice(LENGTH // 2, None)),
+    ]
+
+    if ht.MPI_WORLD.rank == 0:
+        print("length {}, {} processes".format(LENGTH, ht.MPI_WORLD.size))
+        print("{:<16}{:>16}{:>16}{:>16}".format("key", "sets ms", "arithmetic ms", "getitem ms"))
+    for name, key in keys:
+        timings = []
+        for operation in (
+            lambda: set_local_slice(key, chunk_start, chunk_end, LENGTH),
+            lambda: ht.DNDarray._DNDarray__local_slice(key, chunk_start, chunk_end, LENGTH),
+            lambda: a[key],
+        ):
+            ht.MPI_WORLD.Barrier()
+            timings.append(min(timeit.repeat(operation, repeat=REPEAT, number=NUMBER)) / NUMBER)
+        if ht.MPI_WORLD.rank == 0:
+            print("{:<16}{:>16.3f}{:>16.3f}{:>16.3f}".format(name, *(t * 1e3 for t in timings)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+# measures the throughput of ht.load_csv in MB/s per process on a generated file, e.g.
+# python load_csv_throughput.py
+# mpirun -np <procs> python load_csv_throughput.py
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import heat as ht
+
+ROWS = 10 ** 6
+COLUMNS = 8
+REPEAT = 3
+
+
+def main():
+    comm = ht.MPI_WORLD
+    path = os.path.join(tempfile.gettempdir(), "heat_load_csv_throughput.csv")
+    if comm.rank == 0:
+        data = np.random.RandomState(0).randn(ROWS, COLUMNS)
+        np.savetxt(path, data, fmt="%.8f", delimiter=",")
+    comm.Barrier()
+    megabytes = os.stat(path).st_size / 1e6
+
+    try:
+        if comm.rank == 0:
+            print("{:.1f} MB, {} processes".format(megabytes, comm.size))
+            print("{:<8}{:>12}{:>16}".format("split", "seconds", "MB/s per proc"))
+        for split in (0, None, 1):
+            best = float("inf")
+            for _ in range(REPEAT):
+                comm.Barrier()
+                start = time.perf_counter()
+                ht.load_csv(path, sep=",", split=split)
+                comm.Barrier()
+                best = min(best, time.perf_counter() - start)
+            if comm.rank == 0:
+                throughput = megabytes / best / comm.size
+                print("{:<8}{:>12.3f}{:>16.1f}".format(str(split), best, throughput))
+    finally:
+        comm.Barrier()
+        if comm.rank == 0:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
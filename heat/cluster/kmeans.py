@@ -247,6 +247,11 @@ class KMeans:
             # determine the centroids
             matching_centroids = self._fit_to_cluster(X)
 
+            # count the points of all clusters at once
+            cluster_sizes = ht.bincount(
+                ht.squeeze(matching_centroids, axis=1), minlength=self.n_clusters
+            ).clip(1.0, ht.iinfo(ht.int64).max)
+
             # update the centroids
             for i in range(self.n_clusters):
                 # points in current cluster
@@ -254,9 +259,7 @@ class KMeans:
 
                 # accumulate points and total number of points in cluster
                 assigned_points = (X * selection).sum(axis=0, keepdim=True)
-                points_in_cluster = selection.sum(axis=0, keepdim=True).clip(
-                    1.0, ht.iinfo(ht.int64).max
-                )
+                points_in_cluster = cluster_sizes[i : i + 1]
 
                 # compute the new centroids
                 new_cluster_centers[i : i + 1, :] = assigned_points / points_in_cluster
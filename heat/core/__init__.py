@@ -4,6 +4,7 @@ from .constants import *
 from .devices import *
 from .exponential import *
 from .factories import *
+from .fusion import *
 from .indexing import *
 from .io import *
 from .logical import *
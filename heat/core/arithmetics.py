@@ -12,6 +12,8 @@ __all__ = [
     "bitwise_not",
     "bitwise_or",
     "bitwise_xor",
+    "cumprod",
+    "cumsum",
     "diff",
     "div",
     "divide",
@@ -34,7 +36,7 @@ __all__ = [
 ]
 
 
-def add(t1, t2):
+def add(t1, t2, out=None):
     """
     Element-wise addition of values from two operands, commutative.
     Takes the first and second operand (scalar or tensor) whose elements are to be added as argument.
@@ -45,6 +47,8 @@ def add(t1, t2):
         The first operand involved in the addition
     t2: tensor or scalar
         The second operand involved in the addition
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -69,10 +73,10 @@ def add(t1, t2):
             [5., 6.]])
 
     """
-    return operations.__binary_op(torch.add, t1, t2)
+    return operations.__binary_op(torch.add, t1, t2, out)
 
 
-def bitwise_and(t1, t2):
+def bitwise_and(t1, t2, out=None):
     """
     Compute the bit-wise AND of two arrays element-wise.
 
@@ -80,6 +84,8 @@ def bitwise_and(t1, t2):
     ----------
     t1, t2: tensor or scalar
         Only integer and boolean types are handled. If x1.shape != x2.shape, they must be broadcastable to a common shape (which becomes the shape of the output).
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -111,10 +117,10 @@ def bitwise_and(t1, t2):
         if types.heat_type_is_inexact(dtype):
             raise TypeError("Operation is not supported for float types")
 
-    return operations.__binary_op(torch.Tensor.__and__, t1, t2)
+    return operations.__binary_op(torch.Tensor.__and__, t1, t2, out)
 
 
-def bitwise_or(t1, t2):
+def bitwise_or(t1, t2, out=None):
     """
     Compute the bit-wise OR of two arrays element-wise.
 
@@ -122,6 +128,8 @@ def bitwise_or(t1, t2):
     ----------
     t1, t2: tensor or scalar
        Only integer and boolean types are handled. If x1.shape != x2.shape, they must be broadcastable to a common shape (which becomes the shape of the output).
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -155,10 +163,10 @@ def bitwise_or(t1, t2):
         if types.heat_type_is_inexact(dtype):
             raise TypeError("Operation is not supported for float types")
 
-    return operations.__binary_op(torch.Tensor.__or__, t1, t2)
+    return operations.__binary_op(torch.Tensor.__or__, t1, t2, out)
 
 
-def bitwise_xor(t1, t2):
+def bitwise_xor(t1, t2, out=None):
     """
     Compute the bit-wise XOR of two arrays element-wise.
 
@@ -166,6 +174,8 @@ def bitwise_xor(t1, t2):
     ----------
     t1, t2: tensor or scalar
        Only integer and boolean types are handled. If x1.shape != x2.shape, they must be broadcastable to a common shape (which becomes the shape of the output).
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -194,7 +204,75 @@ def bitwise_xor(t1, t2):
         if types.heat_type_is_inexact(dtype):
             raise TypeError("Operation is not supported for float types")
 
-    return operations.__binary_op(torch.Tensor.__xor__, t1, t2)
+    return operations.__binary_op(torch.Tensor.__xor__, t1, t2, out)
+
+
+def cumprod(x, axis, dtype=None, out=None):
+    """
+    Return the cumulative product of the elements along a given axis. If the tensor is split along axis, each process
+    computes the cumulative product of its local data, and the products of the preceding processes are obtained in a
+    single exclusive scan of the last local slices.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        Input data.
+    axis : int
+        Axis along which the cumulative product is computed.
+    dtype : ht.dtype, optional
+        Type of the returned tensor and of the products. Defaults to the type of x, integer types of lower precision
+        are promoted to int64.
+    out : ht.DNDarray, optional
+        Alternative output tensor in which to place the result. It must have the same shape as x.
+
+    Returns
+    -------
+    cumprod_along_axis : ht.DNDarray
+        A tensor of the shape and split axis of x. Returns a reference to out if specified.
+
+    Examples
+    --------
+    >>> a = ht.full((3, 3), 2, split=0)
+    >>> ht.cumprod(a, 0)
+    tensor([[2., 2., 2.],
+            [4., 4., 4.],
+            [8., 8., 8.]])
+    """
+    return operations.__cum_op(x, torch.cumprod, MPI.PROD, torch.mul, 1, axis, dtype, out)
+
+
+def cumsum(x, axis, dtype=None, out=None):
+    """
+    Return the cumulative sum of the elements along a given axis. If the tensor is split along axis, each process
+    computes the cumulative sum of its local data, and the sums of the preceding processes are obtained in a single
+    exclusive scan of the last local slices.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        Input data.
+    axis : int
+        Axis along which the cumulative sum is computed.
+    dtype : ht.dtype, optional
+        Type of the returned tensor and of the sums. Defaults to the type of x, integer types of lower precision are
+        promoted to int64.
+    out : ht.DNDarray, optional
+        Alternative output tensor in which to place the result. It must have the same shape as x.
+
+    Returns
+    -------
+    cumsum_along_axis : ht.DNDarray
+        A tensor of the shape and split axis of x. Returns a reference to out if specified.
+
+    Examples
+    --------
+    >>> a = ht.ones((3, 3), split=0)
+    >>> ht.cumsum(a, 0)
+    tensor([[1., 1., 1.],
+            [2., 2., 2.],
+            [3., 3., 3.]])
+    """
+    return operations.__cum_op(x, torch.cumsum, MPI.SUM, torch.add, 0, axis, dtype, out)
 
 
 def diff(a, n=1, axis=-1):
@@ -286,7 +364,7 @@ def diff(a, n=1, axis=-1):
     return ret
 
 
-def div(t1, t2):
+def div(t1, t2, out=None):
     """
     Element-wise true division of values of operand t1 by values of operands t2 (i.e t1 / t2), not commutative.
     Takes the two operands (scalar or tensor) whose elements are to be divided (operand 1 by operand 2)
@@ -298,6 +376,8 @@ def div(t1, t2):
         The first operand whose values are divided
     t2: tensor or scalar
         The second operand by whose values is divided
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -321,14 +401,14 @@ def div(t1, t2):
     tensor([[2.0000, 1.0000],
             [0.6667, 0.5000]])
     """
-    return operations.__binary_op(torch.div, t1, t2)
+    return operations.__binary_op(torch.div, t1, t2, out)
 
 
 # Alias in compliance with numpy API
 divide = div
 
 
-def fmod(t1, t2):
+def fmod(t1, t2, out=None):
     """
     Element-wise division remainder of values of operand t1 by values of operand t2 (i.e. C Library function fmod), not commutative.
     Takes the two operands (scalar or tensor, both may contain floating point number) whose elements are to be
@@ -340,6 +420,8 @@ def fmod(t1, t2):
         The first operand whose values are divided (may be floats)
     t2: tensor or scalar
         The second operand by whose values is divided (may be floats)
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -364,10 +446,10 @@ def fmod(t1, t2):
     tensor([[0., 0.]
             [2., 2.]])
     """
-    return operations.__binary_op(torch.fmod, t1, t2)
+    return operations.__binary_op(torch.fmod, t1, t2, out)
 
 
-def floordiv(t1, t2):
+def floordiv(t1, t2, out=None):
     """
     Element-wise floor division of value of operand t1 by values of operands t2 (i.e. t1 // t2), not commutative.
     Takes the two operands (scalar or tensor) whose elements are to be divided (operand 1 by operand 2) as argument.
@@ -378,6 +460,8 @@ def floordiv(t1, t2):
         The first operand whose values are divided
     t2: tensor or scalar
         The second operand by whose values is divided
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Return
     ------
@@ -396,7 +480,7 @@ def floordiv(t1, t2):
     tensor([[1., 0.],
             [1., 1.]])
     """
-    return operations.__binary_op(lambda a, b: torch.div(a, b).floor(), t1, t2)
+    return operations.__binary_op(lambda a, b: torch.div(a, b).floor(), t1, t2, out)
 
 
 # Alias in compliance with numpy API
@@ -432,7 +516,7 @@ def invert(t, out=None):
 bitwise_not = invert
 
 
-def left_shift(t1, t2):
+def left_shift(t1, t2, out=None):
     """
     Shift the bits of an integer to the left.
 
@@ -442,6 +526,8 @@ def left_shift(t1, t2):
 
     t2: scalar or tensor
         integer number of zero bits to add
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -459,10 +545,10 @@ def left_shift(t1, t2):
         if not types.heat_type_is_exact(dtype):
             raise TypeError("Operation is supported for integer types only")
 
-    return operations.__binary_op(torch.Tensor.__lshift__, t1, t2)
+    return operations.__binary_op(torch.Tensor.__lshift__, t1, t2, out)
 
 
-def mod(t1, t2):
+def mod(t1, t2, out=None):
     """
     Element-wise division remainder of values of operand t1 by values of operand t2 (i.e. t1 % t2), not commutative.
     Takes the two operands (scalar or tensor) whose elements are to be divided (operand 1 by operand 2) as arguments.
@@ -475,6 +561,8 @@ def mod(t1, t2):
         The first operand whose values are divided
     t2: tensor or scalar
         The second operand by whose values is divided
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -499,10 +587,10 @@ def mod(t1, t2):
     tensor([[0, 0]
             [2, 2]], dtype=torch.int32)
     """
-    return remainder(t1, t2)
+    return remainder(t1, t2, out)
 
 
-def mul(t1, t2):
+def mul(t1, t2, out=None):
     """
     Element-wise multiplication (NOT matrix multiplication) of values from two operands, commutative.
     Takes the first and second operand (scalar or tensor) whose elements are to be multiplied as argument.
@@ -513,6 +601,8 @@ def mul(t1, t2):
         The first operand involved in the multiplication
     t2: tensor or scalar
         The second operand involved in the multiplication
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -541,14 +631,14 @@ def mul(t1, t2):
     tensor([[2., 4.],
             [6., 8.]])
     """
-    return operations.__binary_op(torch.mul, t1, t2)
+    return operations.__binary_op(torch.mul, t1, t2, out)
 
 
 # Alias in compliance with numpy API
 multiply = mul
 
 
-def pow(t1, t2):
+def pow(t1, t2, out=None):
     """
     Element-wise exponential function of values of operand t1 to the power of values of operand t2 (i.e t1 ** t2),
     not commutative. Takes the two operands (scalar or tensor) whose elements are to be involved in the exponential
@@ -561,6 +651,8 @@ def pow(t1, t2):
         The first operand whose values represent the base
     t2: tensor or scalar
         The second operand by whose values represent the exponent
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -583,14 +675,14 @@ def pow(t1, t2):
     tensor([[1., 8.],
             [27., 64.]])
     """
-    return operations.__binary_op(torch.pow, t1, t2)
+    return operations.__binary_op(torch.pow, t1, t2, out)
 
 
 # Alias in compliance with numpy API
 power = pow
 
 
-def remainder(t1, t2):
+def remainder(t1, t2, out=None):
     """
     Element-wise division remainder of values of operand t1 by values of operand t2 (i.e. t1 % t2), not commutative.
     Takes the two operands (scalar or tensor) whose elements are to be divided (operand 1 by operand 2) as arguments.
@@ -601,6 +693,8 @@ def remainder(t1, t2):
         The first operand whose values are divided
     t2: tensor or scalar
         The second operand by whose values is divided
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -625,10 +719,10 @@ def remainder(t1, t2):
     tensor([[0, 0]
             [2, 2]], dtype=torch.int32)
     """
-    return operations.__binary_op(torch.remainder, t1, t2)
+    return operations.__binary_op(torch.remainder, t1, t2, out)
 
 
-def right_shift(t1, t2):
+def right_shift(t1, t2, out=None):
     """
     Shift the bits of an integer to the right.
 
@@ -638,6 +732,8 @@ def right_shift(t1, t2):
 
     t2: scalar or tensor
         integer number of bits to remove
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -655,7 +751,7 @@ def right_shift(t1, t2):
         if not types.heat_type_is_exact(dtype):
             raise TypeError("Operation is supported for integer types only")
 
-    return operations.__binary_op(torch.Tensor.__rshift__, t1, t2)
+    return operations.__binary_op(torch.Tensor.__rshift__, t1, t2, out)
 
 
 def prod(x, axis=None, out=None, keepdim=None):
@@ -707,7 +803,7 @@ def prod(x, axis=None, out=None, keepdim=None):
     )
 
 
-def sub(t1, t2):
+def sub(t1, t2, out=None):
     """
     Element-wise subtraction of values of operand t2 from values of operands t1 (i.e t1 - t2), not commutative.
     Takes the two operands (scalar or tensor) whose elements are to be subtracted (operand 2 from operand 1)
@@ -719,6 +815,8 @@ def sub(t1, t2):
         The first operand from which values are subtracted
     t2: tensor or scalar
         The second operand whose values are subtracted
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -742,7 +840,7 @@ def sub(t1, t2):
     tensor([[ 1.,  0.],
             [-1., -2.]])
     """
-    return operations.__binary_op(torch.sub, t1, t2)
+    return operations.__binary_op(torch.sub, t1, t2, out)
 
 
 # Alias in compliance with numpy API
@@ -1,8 +1,12 @@
 from mpi4py import MPI
 
+import atexit
+import collections
+import functools
 import numpy as np
 import os
 import subprocess
+import threading
 import torch
 
 from .stride_tricks import sanitize_axis
@@ -63,10 +67,39 @@ class MPICommunication(Communication):
         torch.float64: MPI.DOUBLE,
     }
 
-    def __init__(self, handle=MPI.COMM_WORLD):
+    # least recently used cache of committed derived MPI data types for non-contiguous buffers, keyed on the torch type,
+    # shape and strides of the buffer, guarded by a lock as asynchronous saves communicate on a background thread
+    __derived_types = collections.OrderedDict()
+    __derived_types_lock = threading.Lock()
+    __derived_types_hits = 0
+    __derived_types_misses = 0
+    derived_types_capacity = 128
+
+    # shared memory windows of all communicators using hierarchical collectives, in order of allocation
+    __shared_windows = []
+
+    def __init__(self, handle=MPI.COMM_WORLD, hierarchical=False):
+        """
+        Parameters
+        ----------
+        handle : MPI.Comm, optional
+            The wrapped MPI communicator, defaults to MPI.COMM_WORLD.
+        hierarchical : bool, optional
+            If True, Allreduce and Allgatherv of host tensors are performed hierarchically. The processes of each node
+            exchange their data through shared memory and only one process per node communicates across nodes. Hence,
+            resplit_(None) gathers hierarchically, redistributing between split axes still uses a flat Alltoallv.
+        """
         self.handle = handle
         self.rank = handle.Get_rank()
         self.size = handle.Get_size()
+        self.hierarchical = hierarchical
+
+        # node-local and node leader communicators and the shared memory window, created on first use
+        self.__node = None
+        self.__leaders = None
+        self.__node_ranks = None
+        self.__window = None
+        self.__window_size = 0
 
     def is_distributed(self):
         """
@@ -79,6 +112,118 @@ class MPICommunication(Communication):
         """
         return self.size > 1
 
+    @property
+    def node(self):
+        """
+        The communicator of the processes that share memory with this process, i.e. that run on the same node.
+        """
+        if self.__node is None:
+            self.__split_nodes()
+        return self.__node
+
+    @property
+    def leaders(self):
+        """
+        The communicator of the first process on each node, None on all other processes.
+        """
+        if self.__node is None:
+            self.__split_nodes()
+        return self.__leaders
+
+    def __split_nodes(self):
+        """
+        Splits the communicator into node-local communicators and the communicator of the node leaders. The global
+        ranks of the processes on each node are gathered, ordered by the rank of their leader.
+        """
+        node = self.handle.Split_type(MPI.COMM_TYPE_SHARED, key=self.rank)
+        leaders = self.handle.Split(0 if node.Get_rank() == 0 else MPI.UNDEFINED, key=self.rank)
+
+        self.__node = MPICommunication(node)
+        self.__leaders = MPICommunication(leaders) if leaders != MPI.COMM_NULL else None
+
+        node_ranks = node.allgather(self.rank)
+        if self.__leaders is not None:
+            node_ranks = leaders.allgather(node_ranks)
+        self.__node_ranks = node.bcast(node_ranks, root=0)
+
+    def __shared_tensor(self, shape, dtype):
+        """
+        Returns a contiguous tensor in the memory window shared by the processes of the node. The window is kept
+        between calls and only reallocated, with at least twice its previous size, if it is too small.
+        """
+        numpy_type = torch.empty(0, dtype=dtype).numpy().dtype
+        nbytes = int(np.prod(shape)) * numpy_type.itemsize
+
+        if self.__window_size < nbytes:
+            if self.__window is not None:
+                self.__free_window(self.__window)
+            size = max(nbytes, 2 * self.__window_size)
+            self.__window = MPI.Win.Allocate_shared(
+                size if self.node.rank == 0 else 0, 1, comm=self.node.handle
+            )
+            self.__window.Lock_all()
+            self.__window_size = size
+            self.__shared_windows.append(self.__window)
+
+        memory, _ = self.__window.Shared_query(0)
+        array = np.frombuffer(memory, dtype=np.uint8, count=nbytes).view(numpy_type)
+
+        return torch.from_numpy(array).reshape(shape)
+
+    def __node_barrier(self):
+        """
+        Synchronizes the processes of the node and their view of the shared memory window.
+        """
+        self.__window.Sync()
+        self.node.handle.Barrier()
+        self.__window.Sync()
+
+    @classmethod
+    def __free_window(cls, window):
+        window.Unlock_all()
+        window.Free()
+        cls.__shared_windows.remove(window)
+
+    @classmethod
+    def free_shared_windows(cls):
+        """
+        Ends the access to the shared memory windows of all communicators using hierarchical collectives, called at
+        exit. The windows are left to be released by MPI, as freeing them is collective and would block if another
+        process exited abnormally.
+        """
+        while cls.__shared_windows:
+            cls.__shared_windows.pop().Unlock_all()
+
+    def Free(self):
+        """
+        Frees the communicator along with the node-local and node leader communicators and the shared memory window
+        of the hierarchical collectives. Collective on all processes of the communicator.
+        """
+        if self.__window is not None:
+            self.__free_window(self.__window)
+            self.__window = None
+            self.__window_size = 0
+        if self.__node is not None:
+            if self.__leaders is not None:
+                self.__leaders.Free()
+            self.__node.Free()
+            self.__node = self.__leaders = self.__node_ranks = None
+        self.handle.Free()
+
+    def __use_hierarchical(self, sendbuf, recvbuf):
+        """
+        Determines whether a collective on the passed buffers is performed hierarchically. The decision depends only
+        on properties shared by all processes, i.e. the receive buffer shape and the buffer devices.
+        """
+        return (
+            self.hierarchical
+            and isinstance(sendbuf, torch.Tensor)
+            and isinstance(recvbuf, torch.Tensor)
+            and not sendbuf.is_cuda
+            and not recvbuf.is_cuda
+            and recvbuf.numel() > 0
+        )
+
     def chunk(self, shape, split, rank=None, w_size=None):
         """
         Calculates the chunk of data that will be assigned to this compute node given a global data shape and a split
@@ -200,7 +345,7 @@ class MPICommunication(Communication):
             if counts is None:
                 return mpi_type, elements
             else:
-                factor = np.prod(obj.shape[1:])
+                factor = int(np.prod(obj.shape[1:]))
                 return (
                     mpi_type,
                     (
@@ -212,21 +357,89 @@ class MPICommunication(Communication):
         # non-continuous memory, e.g. after a transpose, has to be packed in derived MPI types
         elements = obj.shape[0]
         shape = obj.shape[1:]
-        strides = [1] * len(shape)
-        strides[0] = obj.stride()[-1]
-        strides = strides[::-1]
-        offsets = [obj.element_size() * stride for stride in obj.stride()[:-1]]
-
-        # chain the types based on the
-        for i in range(len(shape) - 1, -1, -1):
-            mpi_type = mpi_type.Create_vector(shape[i], 1, strides[i]).Create_resized(0, offsets[i])
-            mpi_type.Commit()
+        if len(shape) > 0:
+            mpi_type = cls.__derived_type_of(obj, mpi_type)
 
         if counts is not None:
             return mpi_type, (counts, displs)
 
         return mpi_type, elements
 
+    @classmethod
+    def __derived_type_of(cls, obj, mpi_type):
+        """
+        Looks up the committed derived MPI data type for the non-contiguous tensor obj in the cache or constructs it by
+        chaining resized vector types of the base type mpi_type. The least recently used type is freed if the cache
+        exceeds its capacity.
+        """
+        with cls.__derived_types_lock:
+            key = (obj.dtype, tuple(obj.shape[1:]), tuple(obj.stride()))
+            derived_type = cls.__derived_types.get(key)
+            if derived_type is not None:
+                cls.__derived_types_hits += 1
+                cls.__derived_types.move_to_end(key)
+                return derived_type
+            cls.__derived_types_misses += 1
+
+            shape = obj.shape[1:]
+            strides = [1] * len(shape)
+            strides[0] = obj.stride()[-1]
+            strides = strides[::-1]
+            offsets = [obj.element_size() * stride for stride in obj.stride()[:-1]]
+
+            # chain the types based on the strides, intermediate types are not needed after the next one is created
+            derived_type = mpi_type
+            for i in range(len(shape) - 1, -1, -1):
+                vector_type = derived_type.Create_vector(shape[i], 1, strides[i])
+                resized_type = vector_type.Create_resized(0, offsets[i])
+                vector_type.Free()
+                if derived_type is not mpi_type:
+                    derived_type.Free()
+                derived_type = resized_type
+            derived_type.Commit()
+
+            cls.__derived_types[key] = derived_type
+            while len(cls.__derived_types) > max(cls.derived_types_capacity, 1):
+                _, evicted_type = cls.__derived_types.popitem(last=False)
+                evicted_type.Free()
+
+            return derived_type
+
+    @classmethod
+    def derived_types_info(cls):
+        """
+        Reports the usage of the cache of derived MPI data types for non-contiguous buffers.
+
+        Returns
+        -------
+        info : dict
+            The number of cache hits and misses, the hit rate, the number of currently cached types and the capacity
+        """
+        with cls.__derived_types_lock:
+            lookups = cls.__derived_types_hits + cls.__derived_types_misses
+
+            return {
+                "hits": cls.__derived_types_hits,
+                "misses": cls.__derived_types_misses,
+                "hit_rate": cls.__derived_types_hits / lookups if lookups else 0.0,
+                "size": len(cls.__derived_types),
+                "capacity": cls.derived_types_capacity,
+            }
+
+    @classmethod
+    def free_derived_types(cls):
+        """
+        Frees all cached derived MPI data types and resets the cache statistics. Called automatically at interpreter
+        exit, before MPI is finalized.
+        """
+        with cls.__derived_types_lock:
+            while cls.__derived_types:
+                _, derived_type = cls.__derived_types.popitem()
+                if not MPI.Is_finalized():
+                    derived_type.Free()
+            cls.__derived_types_hits = 0
+            cls.__derived_types_misses = 0
+
     @classmethod
     def as_mpi_memory(cls, obj):
         """
@@ -473,6 +686,46 @@ class MPICommunication(Communication):
 
     Ibcast.__doc__ = MPI.Comm.Ibcast.__doc__
 
+    def Bcast_init(self, buf, root=0):
+        """
+        Sets up a persistent broadcast of buf from the root process. The buffer is converted only once, the returned
+        request can then be started and waited for repeatedly, e.g. once per iteration of an iterative algorithm. The
+        content of buf is read resp. written on every start, its shape and storage must not change in between.
+
+        Parameters
+        ----------
+        buf : DNDarray or torch.Tensor
+            The buffer to be broadcast from root and received into on all other processes.
+        root : int, optional
+            The rank of the broadcasting process, defaults to 0.
+
+        Returns
+        -------
+        request : MPIPersistentRequest
+            The inactive persistent request, activated with start().
+        """
+        if isinstance(buf, dndarray.DNDarray):
+            buf = buf._DNDarray__array
+        init = self.__persistent_init("Bcast")
+        ret, sbuf, rbuf, buf = self.__broadcast_like(init, buf, root)
+        if self.rank != root:
+            return MPIPersistentRequest(ret, sbuf, rbuf, buf)
+
+        return MPIPersistentRequest(ret, sbuf, rbuf, buf, source=buf, staging=sbuf)
+
+    def __persistent_init(self, name):
+        """
+        Returns the function creating the persistent request of the collective name. Falls back to reissuing the
+        nonblocking variant of the collective on the once converted buffers if persistent collectives (MPI-4) are not
+        available.
+        """
+        init = getattr(self.handle, name + "_init", None)
+        if init is not None:
+            return init
+        nonblocking = getattr(self.handle, "I" + name.lower())
+
+        return lambda *args: functools.partial(nonblocking, *args)
+
     def __reduce_like(self, func, sendbuf, recvbuf, *args, **kwargs):
         sbuf = None
         rbuf = None
@@ -514,6 +767,14 @@ class MPICommunication(Communication):
         return func(sendbuf, recvbuf, *args, **kwargs), sbuf, rbuf, buf
 
     def Allreduce(self, sendbuf, recvbuf, op=MPI.SUM):
+        if isinstance(sendbuf, dndarray.DNDarray):
+            sendbuf = sendbuf._DNDarray__array
+        if isinstance(recvbuf, dndarray.DNDarray):
+            recvbuf = recvbuf._DNDarray__array
+        source = recvbuf if sendbuf is MPI.IN_PLACE else sendbuf
+        if op.Is_commutative() and self.__use_hierarchical(source, recvbuf):
+            return self.__hierarchical_allreduce(source, recvbuf, op)
+
         ret, sbuf, rbuf, buf = self.__reduce_like(self.handle.Allreduce, sendbuf, recvbuf, op)
         if buf is not None and isinstance(buf, torch.Tensor) and buf.is_cuda and not CUDA_AWARE_MPI:
             buf.copy_(rbuf)
@@ -521,6 +782,69 @@ class MPICommunication(Communication):
 
     Allreduce.__doc__ = MPI.Comm.Allreduce.__doc__
 
+    def __hierarchical_allreduce(self, sendbuf, recvbuf, op):
+        """
+        Reduces sendbuf into recvbuf in three stages: a reduction into the shared memory of the node leader, an
+        allreduce among the node leaders and a copy out of the shared memory on every process of the node.
+        """
+        shared = self.__shared_tensor(recvbuf.shape, recvbuf.dtype)
+        sendbuf = sendbuf.contiguous()
+        node = self.node
+
+        node.handle.Reduce(
+            self.as_buffer(sendbuf), self.as_buffer(shared) if node.rank == 0 else None, op, root=0
+        )
+        if self.leaders is not None and self.leaders.size > 1:
+            self.leaders.handle.Allreduce(MPI.IN_PLACE, self.as_buffer(shared), op)
+        self.__node_barrier()
+        recvbuf.copy_(shared)
+        # the window may only be reused once all processes of the node have read the result
+        self.__node_barrier()
+
+    def Allreduce_init(self, sendbuf, recvbuf, op=MPI.SUM):
+        """
+        Sets up a persistent reduction of sendbuf into recvbuf on all processes. The buffers are converted only once,
+        the returned request can then be started and waited for repeatedly, e.g. once per iteration of an iterative
+        algorithm. The contents of the buffers are read resp. written on every start, their shape and storage must not
+        change in between.
+
+        Parameters
+        ----------
+        sendbuf : DNDarray, torch.Tensor or MPI.IN_PLACE
+            The buffer holding the local operands.
+        recvbuf : DNDarray or torch.Tensor
+            The buffer the reduced result is written to, the local operands if sendbuf is MPI.IN_PLACE.
+        op : MPI.Op, optional
+            The reduction operation, defaults to MPI.SUM.
+
+        Returns
+        -------
+        request : MPIPersistentRequest
+            The inactive persistent request, activated with start().
+
+        Examples
+        --------
+        >>> buf = torch.ones(4)
+        >>> request = ht.MPI_WORLD.Allreduce_init(ht.MPI.IN_PLACE, buf)
+        >>> for _ in range(3):
+        ...     buf.fill_(1.0)
+        ...     request.start()
+        ...     request.wait()
+        >>> request.Free()
+        """
+        if isinstance(sendbuf, dndarray.DNDarray):
+            sendbuf = sendbuf._DNDarray__array
+        if isinstance(recvbuf, dndarray.DNDarray):
+            recvbuf = recvbuf._DNDarray__array
+        init = self.__persistent_init("Allreduce")
+        ret, sbuf, rbuf, buf = self.__reduce_like(init, sendbuf, recvbuf, op)
+        if sendbuf is MPI.IN_PLACE:
+            return MPIPersistentRequest(ret, sbuf, rbuf, buf, source=buf, staging=rbuf)
+
+        return MPIPersistentRequest(ret, sbuf, rbuf, buf, source=sendbuf, staging=sbuf)
+
+    allreduce_init = Allreduce_init
+
     def Exscan(self, sendbuf, recvbuf, op=MPI.SUM):
         ret, sbuf, rbuf, buf = self.__reduce_like(self.handle.Exscan, sendbuf, recvbuf, op)
         if buf is not None and isinstance(buf, torch.Tensor) and buf.is_cuda and not CUDA_AWARE_MPI:
@@ -670,6 +994,19 @@ class MPICommunication(Communication):
         recvbuf: Input Receivebuffer
         recv_axis: concatenation axis: The axis among which sendbuffer is distributed before allgather is performed
         """
+        if self.hierarchical:
+            send, recv, counts, displs = sendbuf, recvbuf, None, None
+            if isinstance(send, tuple):
+                send = send[0]
+            if isinstance(recv, tuple):
+                recv, counts, displs = recv
+            if isinstance(send, dndarray.DNDarray):
+                send = send._DNDarray__array
+            if isinstance(recv, dndarray.DNDarray):
+                recv = recv._DNDarray__array
+            if self.__use_hierarchical(send, recv):
+                return self.__hierarchical_allgatherv(send, recv, counts, displs, recv_axis)
+
         ret, sbuf, rbuf, buf, permutation = self.__allgather_like(
             self.handle.Allgatherv, sendbuf, recvbuf, recv_axis
         )
@@ -681,6 +1018,51 @@ class MPICommunication(Communication):
 
     Allgatherv.__doc__ = MPI.Comm.Allgatherv.__doc__
 
+    def __hierarchical_allgatherv(self, sendbuf, recvbuf, counts, displs, axis):
+        """
+        Gathers the sendbufs of all processes along axis into recvbuf. Every process writes its block into the memory
+        shared on its node, the node leaders exchange the blocks of their nodes and every process copies the result
+        out of the shared memory.
+        """
+        # the result is assembled with the concatenation axis first, making the block of each process contiguous
+        permutation = [axis] + [i for i in range(recvbuf.dim()) if i != axis]
+        shape = tuple(recvbuf.shape[i] for i in permutation)
+        if counts is None:
+            counts = (shape[0] // self.size,) * self.size
+            displs = tuple(rank * counts[0] for rank in range(self.size))
+
+        shared = self.__shared_tensor(shape, recvbuf.dtype)
+        begin, end = displs[self.rank], displs[self.rank] + counts[self.rank]
+        shared[begin:end] = sendbuf.permute(*permutation)
+        self.__node_barrier()
+
+        leaders = self.leaders
+        if leaders is not None and leaders.size > 1:
+            rows = shared.reshape(shape[0], -1)
+            node_counts = [int(sum(counts[rank] for rank in ranks)) for ranks in self.__node_ranks]
+            node_displs = [0] + np.cumsum(node_counts[:-1]).tolist()
+
+            blocks = [slice(displs[rank], displs[rank] + counts[rank]) for rank in range(self.size)]
+            local = torch.cat([rows[blocks[rank]] for rank in self.__node_ranks[leaders.rank]])
+            gathered = torch.empty((sum(node_counts), rows.shape[1]), dtype=rows.dtype)
+            leaders.handle.Allgatherv(
+                self.as_buffer(local), self.as_buffer(gathered, node_counts, node_displs)
+            )
+
+            # scatter the blocks of the other nodes to their positions in the result
+            for node, ranks in enumerate(self.__node_ranks):
+                if node == leaders.rank:
+                    continue
+                offset = node_displs[node]
+                for rank in ranks:
+                    rows[blocks[rank]] = gathered[offset : offset + counts[rank]]
+                    offset += counts[rank]
+        self.__node_barrier()
+
+        recvbuf.copy_(shared.permute(*np.argsort(permutation).tolist()))
+        # the window may only be reused once all processes of the node have read the result
+        self.__node_barrier()
+
     def Iallgather(self, sendbuf, recvbuf, recv_axis=0):
         """
         Parameters
@@ -1093,27 +1475,44 @@ class MPIRequest:
 
     def Wait(self, status=None):
         self.handle.Wait(status)
-        if (
-            self.tensor is not None
-            and isinstance(self.tensor, torch.Tensor)
-            and self.tensor.is_cuda
-            and not CUDA_AWARE_MPI
-        ):
-            if self.permutation is not None:
-                self.recvbuf = self.recvbuf.permute(self.permutation)
-            self.tensor.copy_(self.recvbuf)
+        self.__copy_back()
 
     def wait(self, status=None):
         self.handle.wait(status)
+        self.__copy_back()
+
+    def __copy_back(self):
+        """
+        Copies the received data from the host buffer back into the device tensor, if MPI is not CUDA-aware.
+        """
         if (
             self.tensor is not None
             and isinstance(self.tensor, torch.Tensor)
             and self.tensor.is_cuda
             and not CUDA_AWARE_MPI
         ):
+            recvbuf = self.recvbuf
             if self.permutation is not None:
-                self.recvbuf = self.recvbuf.permute(self.permutation)
-            self.tensor.copy_(self.recvbuf)
+                recvbuf = recvbuf.permute(self.permutation)
+            self.tensor.copy_(recvbuf)
+
+    @classmethod
+    def Waitall(cls, requests, statuses=None):
+        """
+        Waits for the completion of all the passed requests with a single MPI call.
+
+        Parameters
+        ----------
+        requests : list of MPIRequest
+            The requests to be completed.
+        statuses : list of MPI.Status, optional
+            The statuses of the completed requests.
+        """
+        MPI.Request.Waitall([request.handle for request in requests], statuses)
+        for request in requests:
+            request.__copy_back()
+
+    waitall = Waitall
 
     def __getattr__(self, name):
         """
@@ -1132,6 +1531,95 @@ class MPIRequest:
         return getattr(self.handle, name)
 
 
+class MPIPersistentRequest(MPIRequest):
+    """
+    A reusable request of a collective operation whose buffers have been converted once, see e.g.
+    MPICommunication.Allreduce_init. Each start() activates the collective on the current buffer contents, each
+    wait() completes it. If the communicator does not offer persistent collectives, every start() reissues the
+    nonblocking collective on the prepared buffers.
+
+    Parameters
+    ----------
+    init : MPI.Prequest or callable
+        The persistent request or the function issuing the nonblocking collective.
+    sendbuf : torch.Tensor, optional
+        The send buffer as passed to MPI.
+    recvbuf : torch.Tensor, optional
+        The receive buffer as passed to MPI.
+    tensor : torch.Tensor, optional
+        The tensor the received data is copied into, if it is not recvbuf itself.
+    source : torch.Tensor, optional
+        The tensor holding the data to be sent.
+    staging : torch.Tensor, optional
+        The host copy of source passed to MPI, refreshed on each start if it differs from source.
+    """
+
+    def __init__(self, init, sendbuf=None, recvbuf=None, tensor=None, source=None, staging=None):
+        if isinstance(init, MPI.Request):
+            super().__init__(init, sendbuf, recvbuf, tensor)
+            self.init = None
+        else:
+            super().__init__(MPI.REQUEST_NULL, sendbuf, recvbuf, tensor)
+            self.init = init
+        self.source = source
+        self.staging = staging
+
+    def __stage(self):
+        """
+        Copies the data to be sent into the host buffer, if MPI is not CUDA-aware.
+        """
+        if self.staging is not None and self.staging is not self.source:
+            self.staging.copy_(self.source)
+
+    def Start(self):
+        """
+        Activates the collective operation on the current contents of the buffers.
+        """
+        self.__stage()
+        if self.init is None:
+            self.handle.Start()
+        else:
+            self.handle = self.init()
+
+    start = Start
+
+    @classmethod
+    def Startall(cls, requests):
+        """
+        Activates all the passed persistent requests, the native ones with a single MPI call.
+
+        Parameters
+        ----------
+        requests : list of MPIPersistentRequest
+            The requests to be started.
+        """
+        for request in requests:
+            request.__stage()
+        native = [request.handle for request in requests if request.init is None]
+        if native:
+            MPI.Prequest.Startall(native)
+        for request in requests:
+            if request.init is not None:
+                request.handle = request.init()
+
+    startall = Startall
+
+    def Free(self):
+        """
+        Frees the persistent request. It must not be active, i.e. the last start() has to be waited for.
+        """
+        if self.init is None and self.handle != MPI.REQUEST_NULL:
+            self.handle.Free()
+        self.init = None
+        self.handle = MPI.REQUEST_NULL
+
+    free = Free
+
+
+# free the cached derived data types and end the access to the shared windows at exit, i.e. before mpi4py finalizes MPI
+atexit.register(MPICommunication.free_derived_types)
+atexit.register(MPICommunication.free_shared_windows)
+
 MPI_WORLD = MPICommunication()
 MPI_SELF = MPICommunication(MPI.COMM_SELF)
 
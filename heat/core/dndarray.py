@@ -6,6 +6,7 @@ from . import arithmetics
 from . import devices
 from . import exponential
 from . import factories
+from . import fusion
 from . import indexing
 from . import io
 from . import linalg
@@ -61,6 +62,19 @@ class DNDarray:
         ):
             self.__array = self.__array.to(devices.sanitize_device(self.__device).torch_device)
 
+    @property
+    def __array(self):
+        # deferred element-wise expressions are evaluated on first access of the local data
+        if isinstance(self.__buffer, fusion.DeferredTensor):
+            self.__buffer = self.__buffer.evaluate()
+        return self.__buffer
+
+    @__array.setter
+    def __array(self, array):
+        self.__buffer = array
+        if isinstance(array, fusion.DeferredTensor):
+            fusion.track(self)
+
     @property
     def comm(self):
         return self.__comm
@@ -109,7 +123,7 @@ class DNDarray:
         -------
         int: number of elements of the tensor on each node
         """
-        return np.prod(self.__array.shape)
+        return np.prod(self.__buffer.shape)
 
     @property
     def lloc(self):
@@ -156,7 +170,7 @@ class DNDarray:
         -------
         tuple : the shape of the data on each node
         """
-        return tuple(self.__array.shape)
+        return tuple(self.__buffer.shape)
 
     @property
     def shape(self):
@@ -287,6 +301,22 @@ class DNDarray:
         """
         return arithmetics.add(self, other)
 
+    def __iadd__(self, other):
+        """
+        In-place element-wise addition of another tensor or a scalar to the tensor (i.e. +=).
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand, it must be broadcastable to the shape of the tensor
+
+        Returns
+        -------
+        result: ht.DNDarray
+            A reference to the tensor
+        """
+        return arithmetics.add(self, other, out=self)
+
     def all(self, axis=None, out=None, keepdim=None):
         """
         Test whether all array elements along a given axis evaluate to True.
@@ -411,6 +441,22 @@ class DNDarray:
         """
         return arithmetics.bitwise_and(self, other)
 
+    def __iand__(self, other):
+        """
+        In-place element-wise bit-wise AND of the tensor with another tensor or a scalar (i.e. &=).
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand, it must be broadcastable to the shape of the tensor
+
+        Returns
+        -------
+        result: ht.DNDarray
+            A reference to the tensor
+        """
+        return arithmetics.bitwise_and(self, other, out=self)
+
     def any(self, axis=None, out=None, keepdim=False):
         """
         Test whether any array element along a given axis evaluates to True.
@@ -882,6 +928,62 @@ class DNDarray:
             self, tiles_per_proc=tiles_per_proc
         )  # type: tiling.SquareDiagTiles
 
+    def cumprod(self, axis, dtype=None, out=None):
+        """
+        Return the cumulative product of the elements along a given axis.
+
+        Parameters
+        ----------
+        axis : int
+            Axis along which the cumulative product is computed.
+        dtype : ht.dtype, optional
+            Type of the returned tensor and of the products. Defaults to the type of the tensor, integer types of
+            lower precision are promoted to int64.
+        out : ht.DNDarray, optional
+            Alternative output tensor in which to place the result. It must have the same shape as the tensor.
+
+        Returns
+        -------
+        cumprod_along_axis : ht.DNDarray
+            A tensor of the same shape and split axis. Returns a reference to out if specified.
+
+        Examples
+        --------
+        >>> ht.full((3, 3), 2, split=0).cumprod(0)
+        tensor([[2., 2., 2.],
+                [4., 4., 4.],
+                [8., 8., 8.]])
+        """
+        return arithmetics.cumprod(self, axis, dtype, out)
+
+    def cumsum(self, axis, dtype=None, out=None):
+        """
+        Return the cumulative sum of the elements along a given axis.
+
+        Parameters
+        ----------
+        axis : int
+            Axis along which the cumulative sum is computed.
+        dtype : ht.dtype, optional
+            Type of the returned tensor and of the sums. Defaults to the type of the tensor, integer types of lower
+            precision are promoted to int64.
+        out : ht.DNDarray, optional
+            Alternative output tensor in which to place the result. It must have the same shape as the tensor.
+
+        Returns
+        -------
+        cumsum_along_axis : ht.DNDarray
+            A tensor of the same shape and split axis. Returns a reference to out if specified.
+
+        Examples
+        --------
+        >>> ht.ones((3, 3), split=0).cumsum(0)
+        tensor([[1., 1., 1.],
+                [2., 2., 2.],
+                [3., 3., 3.]])
+        """
+        return arithmetics.cumsum(self, axis, dtype, out)
+
     def __eq__(self, other):
         """
         Element-wise rich comparison of equality with values from second operand (scalar or tensor)
@@ -1113,6 +1215,22 @@ class DNDarray:
         """
         return arithmetics.floordiv(self, other)
 
+    def __ifloordiv__(self, other):
+        """
+        In-place element-wise floor division of the tensor by another tensor or a scalar (i.e. //=).
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand, it must be broadcastable to the shape of the tensor
+
+        Returns
+        -------
+        result: ht.DNDarray
+            A reference to the tensor
+        """
+        return arithmetics.floordiv(self, other, out=self)
+
     def fabs(self, out=None):
         """
         Calculate the absolute value element-wise and return floating-point tensor.
@@ -1168,8 +1286,9 @@ class DNDarray:
 
         Parameters
         ----------
-        key : int, slice, tuple, list
-            indices to get from the tensor.
+        key : int, slice, tuple, list, ht.DNDarray
+            indices to get from the tensor. One-dimensional integer or boolean DNDarrays select along a single axis,
+            like numpy's advanced indexing, regardless of their split axis.
 
         Returns
         -------
@@ -1200,6 +1319,9 @@ class DNDarray:
         """
 
         l_dtype = self.dtype.torch_type()
+        advanced_axis = self.__advanced_axis(key)
+        if advanced_axis is not None:
+            return self.__advanced_getitem(key, advanced_axis)
         if isinstance(key, DNDarray) and key.gshape[-1] != len(self.gshape):
             key = tuple(x.item() for x in key)
 
@@ -1213,13 +1335,9 @@ class DNDarray:
                         arr, tuple(arr.shape), self.dtype, self.split, self.device, self.comm
                     )
                 else:
+                    arr = self.__local_getitem(key)
                     return DNDarray(
-                        self.__array[key],
-                        tuple(self.__array[key].shape),
-                        self.dtype,
-                        self.split,
-                        self.device,
-                        self.comm,
+                        arr, tuple(arr.shape), self.dtype, self.split, self.device, self.comm
                     )
             else:
                 if isinstance(key, DNDarray) and key.gshape[-1] == len(self.gshape):
@@ -1228,22 +1346,22 @@ class DNDarray:
                     return DNDarray(arr, tuple(arr.shape), self.dtype, 0, self.device, self.comm)
 
                 else:
-                    gout = tuple(self.__array[key].shape)
+                    arr = self.__local_getitem(key)
+                    gout = tuple(arr.shape)
                     if self.split is not None and self.split >= len(gout):
                         new_split = len(gout) - 1 if len(gout) - 1 >= 0 else None
                     else:
                         new_split = self.split
 
-                    return DNDarray(
-                        self.__array[key], gout, self.dtype, new_split, self.device, self.comm
-                    )
+                    return DNDarray(arr, gout, self.dtype, new_split, self.device, self.comm)
 
         else:
 
             _, _, chunk_slice = self.comm.chunk(self.shape, self.split)
             chunk_start = chunk_slice[self.split].start
             chunk_end = chunk_slice[self.split].stop
-            chunk_set = set(range(chunk_start, chunk_end))
+            # whether the result has to be reversed along the split axis across the processes, i.e. for negative steps
+            reverse_split = False
 
             arr = torch.Tensor()
 
@@ -1296,23 +1414,14 @@ class DNDarray:
                 # if a slice is given in the split direction
                 # below allows for the split given to contain Nones
                 elif isinstance(key[self.split], slice):
-                    key_stop = key[self.split].stop
-                    if key_stop is not None and key_stop < 0:
-                        key_stop = self.gshape[self.split] + key[self.split].stop
-                    key_set = set(
-                        range(
-                            key[self.split].start if key[self.split].start is not None else 0,
-                            key_stop if key_stop is not None else self.gshape[self.split],
-                            key[self.split].step if key[self.split].step else 1,
-                        )
-                    )
                     key = list(key)
-                    overlap = list(key_set & chunk_set)
-                    if overlap:  # if the slice is requesting data on the nodes
-                        overlap.sort()
-                        hold = [x - chunk_start for x in overlap]
-                        key[self.split] = slice(min(hold), max(hold) + 1, key[self.split].step)
-                        arr = self.__array[tuple(key)]
+                    local_slice, reverse_split = self.__local_slice(
+                        key[self.split], chunk_start, chunk_end, self.gshape[self.split]
+                    )
+                    # if the slice is requesting data on the nodes, chunks that are exchanged need their proper shape
+                    if local_slice is not None or reverse_split:
+                        key[self.split] = slice(0, 0) if local_slice is None else local_slice
+                        arr = self.__local_getitem(tuple(key))
                         gout = list(arr.shape)
                 else:
                     # if the given axes are not splits (must be ints OR LISTS for python)
@@ -1347,7 +1456,7 @@ class DNDarray:
                         )
                         if key[self.split] in range(chunk_start, chunk_end):
                             key[self.split] = key[self.split] - chunk_start
-                            arr = self.__array[tuple(key)]
+                            arr = self.__local_getitem(tuple(key))
                             gout = list(arr.shape)
                     if 0 in arr.shape:
                         # arr is empty
@@ -1362,24 +1471,18 @@ class DNDarray:
             # if the given axes are only a slice
             elif isinstance(key, slice) and self.split == 0:
                 gout = [0] * len(self.gshape)
-                # reduce the dims if the slices are only one element in length
-                start = key.start if key.start is not None else 0
-                stop = key.stop if key.stop is not None else self.gshape[0]
-                step = key.step if key.step is not None else 1
 
                 if self.split >= len(gout):
                     new_split = len(gout) - 1 if len(gout) - 1 > 0 else 0
                 else:
                     new_split = self.split
-                key_set = set(range(start, stop, step))
-                overlap = list(key_set & chunk_set)
-                if overlap:
-                    overlap.sort()
-                    hold = [x - chunk_start for x in overlap]
-                    key = slice(min(hold), max(hold) + 1, step)
-                    arr = self.__array[key]
+                local_slice, reverse_split = self.__local_slice(
+                    key, chunk_start, chunk_end, self.gshape[0]
+                )
+                if local_slice is not None or reverse_split:
+                    arr = self.__array[slice(0, 0) if local_slice is None else local_slice]
                     gout = list(arr.shape)
-                else:
+                if local_slice is None:
                     warnings.warn(
                         "This process (rank: {}) is without data after slicing, "
                         "running the .balance_() function is recommended".format(self.comm.rank),
@@ -1405,8 +1508,8 @@ class DNDarray:
                 else:
                     new_split = self.split
 
-                gout = list(self.__array[key].shape)
-                arr = self.__array[key]
+                arr = self.__local_getitem(key)
+                gout = list(arr.shape)
 
             for e, _ in enumerate(gout):
                 if e == new_split:
@@ -1414,7 +1517,7 @@ class DNDarray:
                 else:
                     gout[e] = self.comm.allreduce(gout[e], MPI.MAX)
 
-            return DNDarray(
+            result = DNDarray(
                 arr.type(l_dtype),
                 gout if isinstance(gout, tuple) else tuple(gout),
                 self.dtype,
@@ -1422,6 +1525,378 @@ class DNDarray:
                 self.device,
                 self.comm,
             )
+            if reverse_split:
+                # the elements were selected in ascending order, reversing them involves exchanging the chunks between
+                # mirrored processes
+                result = manipulations.flip(result, new_split)
+
+            return result
+
+    def __local_getitem(self, key):
+        """
+        Indexes the process-local data. Slices with negative steps, which torch does not support, select the same
+        elements in ascending order first, the result is then reversed along the respective dimensions.
+
+        Parameters
+        ----------
+        key : int, slice, tuple, list
+            The key for the process-local data
+
+        Returns
+        -------
+        result : torch.Tensor
+            The selected process-local data
+        """
+        entries = key if isinstance(key, tuple) else (key,)
+        if not any(isinstance(entry, slice) and (entry.step or 1) < 0 for entry in entries):
+            return self.__array[key]
+
+        # expand the ellipsis to determine the axis of each entry
+        if any(entry is Ellipsis for entry in entries):
+            position = next(i for i, entry in enumerate(entries) if entry is Ellipsis)
+            used = len([entry for entry in entries if entry is not None and entry is not Ellipsis])
+            fill = (slice(None),) * (len(self.lshape) - used)
+            entries = entries[:position] + fill + entries[position + 1 :]
+
+        ascending = []
+        flip_dims = []
+        dim = 0
+        out_dim = 0
+        for entry in entries:
+            if entry is None:
+                ascending.append(entry)
+                out_dim += 1
+                continue
+            if isinstance(entry, slice) and (entry.step or 1) < 0:
+                length = self.lshape[dim]
+                local_slice, _ = self.__local_slice(entry, 0, length, length)
+                entry = slice(0, 0) if local_slice is None else local_slice
+                flip_dims.append(out_dim)
+            if not isinstance(entry, int):
+                out_dim += 1
+            ascending.append(entry)
+            dim += 1
+
+        return self.__array[tuple(ascending)].flip(flip_dims)
+
+    @staticmethod
+    def __local_slice(key, chunk_start, chunk_end, length):
+        """
+        Intersects a global slice along the split axis with the process-local chunk arithmetically, i.e. in constant
+        time independent of the length of the axis.
+
+        Parameters
+        ----------
+        key : slice
+            The global slice along the split axis, may have negative start, stop and step values
+        chunk_start : int
+            The global index of the first element of the process-local chunk
+        chunk_end : int
+            The global index after the last element of the process-local chunk
+        length : int
+            The global length of the split axis
+
+        Returns
+        -------
+        local_slice : slice or None
+            The slice of the process-local data with positive step selecting the requested elements in ascending
+            order, None if the process holds none of them
+        reverse : bool
+            Whether the step of the slice is negative, i.e. the selected elements have to be reversed
+        """
+        start, stop, step = key.indices(length)
+        reverse = step < 0
+        if reverse:
+            # select the same elements in ascending order
+            count = len(range(start, stop, step))
+            if count == 0:
+                return None, reverse
+            start, stop, step = start + (count - 1) * step, start + 1, -step
+
+        # first selected element within the chunk, i.e. start plus the smallest multiple of step reaching the chunk
+        first = start + max(0, -(-(chunk_start - start) // step)) * step
+        last = min(stop, chunk_end)
+        if first >= last:
+            return None, reverse
+
+        return slice(first - chunk_start, last - chunk_start, step), reverse
+
+    def __advanced_axis(self, key):
+        """
+        Determines whether the key requests advanced indexing, i.e. it is a one-dimensional integer or boolean DNDarray,
+        optionally combined with slices for the other axes in a tuple. Like in numpy, the integers are indices along
+        one axis, independent of the split axis of the key.
+
+        Parameters
+        ----------
+        key : any
+            The key passed to __getitem__ or __setitem__
+
+        Returns
+        -------
+        axis : int or None
+            The axis indexed by the DNDarray, None if the key does not request advanced indexing
+        """
+        entries = key if isinstance(key, tuple) else (key,)
+        axis = None
+        for i, entry in enumerate(entries):
+            if (
+                isinstance(entry, DNDarray)
+                and entry.numdims == 1
+                and (types.heat_type_is_exact(entry.dtype) or entry.dtype is types.bool)
+            ):
+                if axis is not None:
+                    return None
+                axis = i
+            elif not isinstance(entry, slice):
+                return None
+
+        return axis if axis is not None and len(entries) <= self.numdims else None
+
+    def __advanced_key(self, key, axis):
+        """
+        Splits the key for advanced indexing along axis into the process-local global indices and a local key for
+        the remaining axes.
+
+        Parameters
+        ----------
+        key : DNDarray or tuple
+            The key, see __advanced_axis
+        axis : int
+            The axis indexed by the DNDarray in the key
+
+        Returns
+        -------
+        indices : torch.Tensor
+            The global indices along axis requested by this process
+        local_key : tuple
+            The key for the process-local data, selecting everything along axis
+
+        Raises
+        ------
+        IndexError
+            If a boolean mask does not match the length of the axis or an index is out of bounds
+        NotImplementedError
+            If the split axis is sliced while advanced indexing another axis
+        """
+        local_key = list(key) if isinstance(key, tuple) else [key]
+        index = local_key[axis]
+        local_key[axis] = slice(None)
+        if (
+            self.is_distributed()
+            and axis != self.split
+            and self.split < len(local_key)
+            and local_key[self.split] != slice(None)
+        ):
+            raise NotImplementedError(
+                "Slicing the split axis while advanced indexing another axis is not supported"
+            )
+
+        length = self.gshape[axis]
+        if index.dtype is types.bool:
+            if index.gshape[0] != length:
+                raise IndexError(
+                    "boolean index of length {} does not match axis {} of length {}".format(
+                        index.gshape[0], axis, length
+                    )
+                )
+            indices = torch.nonzero(index._DNDarray__array).flatten()
+            if index.split is not None:
+                offset = index.comm.exscan(index.lshape[0])
+                indices += offset if offset is not None else 0
+        else:
+            indices = index._DNDarray__array.to(torch.int64)
+            indices = torch.where(indices < 0, indices + length, indices)
+            out_of_bounds = bool(((indices < 0) | (indices >= length)).any())
+            if index.comm.allreduce(out_of_bounds, MPI.LOR):
+                raise IndexError("index out of bounds for axis {} with size {}".format(axis, length))
+
+        # the indices are either requested by all processes or every process requests its chunk of them
+        if axis != self.split or not self.is_distributed():
+            if index.split is not None and index.comm.is_distributed():
+                counts = tuple(index.comm.allgather(indices.shape[0]))
+                gathered = torch.empty(
+                    (sum(counts),), dtype=indices.dtype, device=indices.device
+                )
+                index.comm.Allgatherv(
+                    indices, (gathered, counts, tuple(np.cumsum((0,) + counts[:-1]).tolist()))
+                )
+                indices = gathered
+        elif index.split is None:
+            _, _, chunk = self.comm.chunk(indices.shape, 0)
+            indices = indices[chunk]
+
+        return indices.to(self.device.torch_device), tuple(local_key)
+
+    def __routing_plan(self, indices):
+        """
+        Creates the communication plan for distributed advanced indexing along the split axis. Each process sends the
+        global indices it requests to the processes owning them.
+
+        Parameters
+        ----------
+        indices : torch.Tensor
+            The global indices along the split axis requested by this process
+
+        Returns
+        -------
+        order : torch.Tensor
+            The permutation sorting the requested indices by their owning process
+        send_counts : tuple of ints
+            The number of indices requested from each process
+        recv_counts : tuple of ints
+            The number of indices each process requests from this process
+        requests : torch.Tensor
+            The local indices requested from this process, ordered by requesting process
+        """
+        displs = np.cumsum([0] + self.create_lshape_map()[:, self.split].tolist())
+        owners = torch.from_numpy(
+            np.searchsorted(displs[1:], indices.cpu().numpy(), side="right")
+        ).to(indices.device)
+        order = torch.argsort(owners)
+
+        send_counts = torch.bincount(owners, minlength=self.comm.size)
+        recv_counts = torch.empty_like(send_counts)
+        self.comm.Alltoall(send_counts, recv_counts)
+        send_counts = tuple(send_counts.tolist())
+        recv_counts = tuple(recv_counts.tolist())
+
+        requests = torch.empty((sum(recv_counts),), dtype=indices.dtype, device=indices.device)
+        self.comm.Alltoallv(
+            (indices[order], send_counts, tuple(np.cumsum((0,) + send_counts[:-1]).tolist())),
+            (requests, recv_counts, tuple(np.cumsum((0,) + recv_counts[:-1]).tolist())),
+        )
+
+        return order, send_counts, recv_counts, requests - int(displs[self.comm.rank])
+
+    def __advanced_getitem(self, key, axis):
+        """
+        Distributed advanced indexing, i.e. gathers the elements along axis selected by an integer or boolean DNDarray.
+        Along the split axis, the requested indices are routed to the owning processes, which reply with the
+        respective elements, both in a single Alltoallv. The result is distributed like the requested indices.
+
+        Parameters
+        ----------
+        key : DNDarray or tuple
+            The key, see __advanced_axis
+        axis : int
+            The axis indexed by the DNDarray in the key
+
+        Returns
+        -------
+        result : ht.DNDarray
+            The selected elements
+        """
+        indices, local_key = self.__advanced_key(key, axis)
+        local_data = self.__array[local_key]
+        gshape = list(local_data.shape)
+
+        if axis != self.split or not self.is_distributed():
+            if self.is_distributed():
+                gshape[self.split] = self.gshape[self.split]
+            gshape[axis] = indices.shape[0]
+            return DNDarray(
+                local_data.index_select(axis, indices),
+                tuple(gshape),
+                self.dtype,
+                self.split,
+                self.device,
+                self.comm,
+            )
+
+        order, send_counts, recv_counts, requests = self.__routing_plan(indices)
+
+        # the elements are exchanged with the split axis in front
+        replies = local_data.index_select(axis, requests).transpose(0, axis).contiguous()
+        received = torch.empty(
+            (indices.shape[0],) + tuple(replies.shape[1:]),
+            dtype=replies.dtype,
+            device=replies.device,
+        )
+        self.comm.Alltoallv(
+            (replies, recv_counts, tuple(np.cumsum((0,) + recv_counts[:-1]).tolist())),
+            (received, send_counts, tuple(np.cumsum((0,) + send_counts[:-1]).tolist())),
+        )
+        gathered = torch.empty_like(received)
+        gathered[order] = received
+
+        gshape[axis] = self.comm.allreduce(indices.shape[0], MPI.SUM)
+        return DNDarray(
+            gathered.transpose(0, axis).contiguous(),
+            tuple(gshape),
+            self.dtype,
+            self.split,
+            self.device,
+            self.comm,
+        )
+
+    def __advanced_setitem(self, key, axis, value):
+        """
+        Distributed advanced index assignment, i.e. scatters values to the elements along axis selected by an integer
+        or boolean DNDarray. Along the split axis, the requested indices and the respective values are routed to the
+        owning processes in a single Alltoallv each.
+
+        Parameters
+        ----------
+        key : DNDarray or tuple
+            The key, see __advanced_axis
+        axis : int
+            The axis indexed by the DNDarray in the key
+        value : scalar, ht.DNDarray, torch.Tensor, np.ndarray, list or tuple
+            The values to be set, either broadcastable or distributed along axis like the indices
+        """
+        indices, local_key = self.__advanced_key(key, axis)
+        target = self.__array[local_key]
+        position = (slice(None),) * axis
+
+        if axis != self.split or not self.is_distributed():
+            self.__setter(tuple(local_key[:axis]) + (indices,) + tuple(local_key[axis + 1 :]), value)
+            return
+
+        order, send_counts, recv_counts, requests = self.__routing_plan(indices)
+        if np.isscalar(value):
+            target[position + (requests,)] = value
+            return
+
+        # align the values with the indices requested by this process, i.e. slice the replicated ones or redistribute
+        # the split ones, and move the split axis to the front
+        selected_shape = list(target.shape)
+        selected_shape[axis] = indices.shape[0]
+        offset = self.comm.exscan(indices.shape[0])
+        offset = offset if offset is not None else 0
+        if isinstance(value, DNDarray) and value.is_distributed():
+            if value.split != axis or value.numdims != target.dim():
+                raise RuntimeError("split axis of array and the target value are not equal")
+            if value.lshape[axis] != indices.shape[0]:
+                target_map = value.create_lshape_map()
+                target_map[:, axis] = torch.tensor(
+                    self.comm.allgather(indices.shape[0]), device=target_map.device
+                )
+                value = value.copy()
+                value.redistribute_(target_map=target_map)
+            values = value._DNDarray__array
+        else:
+            if isinstance(value, DNDarray):
+                values = value._DNDarray__array
+            elif isinstance(value, torch.Tensor):
+                values = value
+            else:
+                values = torch.as_tensor(np.asarray(value))
+            if values.dim() == target.dim() and values.shape[axis] > 1:
+                values = values.narrow(axis, offset, indices.shape[0])
+        values = values.to(dtype=target.dtype, device=target.device).expand(selected_shape)
+        values = values.transpose(0, axis).contiguous()
+
+        received = torch.empty(
+            (requests.shape[0],) + tuple(values.shape[1:]),
+            dtype=values.dtype,
+            device=values.device,
+        )
+        self.comm.Alltoallv(
+            (values[order], send_counts, tuple(np.cumsum((0,) + send_counts[:-1]).tolist())),
+            (received, recv_counts, tuple(np.cumsum((0,) + recv_counts[:-1]).tolist())),
+        )
+        target[position + (requests,)] = received.transpose(0, axis)
 
     if torch.cuda.device_count() > 0:
 
@@ -1699,6 +2174,22 @@ class DNDarray:
         """
         return arithmetics.left_shift(self, other)
 
+    def __ilshift__(self, other):
+        """
+        In-place element-wise left shift of the tensor's bits by another tensor or a scalar (i.e. <<=).
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand, it must be broadcastable to the shape of the tensor
+
+        Returns
+        -------
+        result: ht.DNDarray
+            A reference to the tensor
+        """
+        return arithmetics.left_shift(self, other, out=self)
+
     def __lt__(self, other):
         """
         Element-wise rich comparison of relation "less than" with values from second operand (scalar or tensor)
@@ -1914,6 +2405,22 @@ class DNDarray:
         """
         return arithmetics.mod(self, other)
 
+    def __imod__(self, other):
+        """
+        In-place element-wise division remainder of the tensor by another tensor or a scalar (i.e. %=).
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand, it must be broadcastable to the shape of the tensor
+
+        Returns
+        -------
+        result: ht.DNDarray
+            A reference to the tensor
+        """
+        return arithmetics.mod(self, other, out=self)
+
     def modf(self, out=None):
         """
         Return the fractional and integral parts of an array, element-wise.
@@ -1970,6 +2477,22 @@ class DNDarray:
         """
         return arithmetics.mul(self, other)
 
+    def __imul__(self, other):
+        """
+        In-place element-wise multiplication of the tensor by another tensor or a scalar (i.e. *=).
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand, it must be broadcastable to the shape of the tensor
+
+        Returns
+        -------
+        result: ht.DNDarray
+            A reference to the tensor
+        """
+        return arithmetics.mul(self, other, out=self)
+
     def __ne__(self, other):
         """
         Element-wise rich comparison of non-equality with values from second operand (scalar or tensor)
@@ -2104,6 +2627,22 @@ class DNDarray:
         """
         return arithmetics.bitwise_or(self, other)
 
+    def __ior__(self, other):
+        """
+        In-place element-wise bit-wise OR of the tensor with another tensor or a scalar (i.e. |=).
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand, it must be broadcastable to the shape of the tensor
+
+        Returns
+        -------
+        result: ht.DNDarray
+            A reference to the tensor
+        """
+        return arithmetics.bitwise_or(self, other, out=self)
+
     def __pow__(self, other):
         """
         Element-wise exponential function with values from second operand (scalar or tensor)
@@ -2136,6 +2675,22 @@ class DNDarray:
         """
         return arithmetics.pow(self, other)
 
+    def __ipow__(self, other):
+        """
+        In-place element-wise exponentiation of the tensor with another tensor or a scalar (i.e. **=).
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand, it must be broadcastable to the shape of the tensor
+
+        Returns
+        -------
+        result: ht.DNDarray
+            A reference to the tensor
+        """
+        return arithmetics.pow(self, other, out=self)
+
     def prod(self, axis=None, out=None, keepdim=None):
         """
         Return the product of array elements over a given axis.
@@ -2275,7 +2830,6 @@ class DNDarray:
         """
         if not self.is_distributed():
             return
-        snd_dtype = self.dtype.torch_type()
         # units -> {pr, 1st index, 2nd index}
         if lshape_map is None:
             # NOTE: giving an lshape map which is incorrect will result in an incorrect distribution
@@ -2317,113 +2871,66 @@ class DNDarray:
                     )
                 )
 
-        lshape_cumsum = torch.cumsum(lshape_map[..., self.split], dim=0)
-        chunk_cumsum = torch.cat(
-            (
-                torch.tensor([0], device=self.device.torch_device),
-                torch.cumsum(target_map[..., self.split], dim=0),
-            ),
-            dim=0,
+        current_counts = lshape_map[..., self.split].tolist()
+        target_counts = target_map[..., self.split].tolist()
+        if current_counts == target_counts:
+            return
+
+        # the complete exchange plan follows from the global offsets of the current and the targeted chunks, each
+        # process sends the overlap of its current chunk with the targeted chunk of every process
+        current_displs = np.cumsum([0] + current_counts)
+        target_displs = np.cumsum([0] + target_counts)
+        rank = self.comm.rank
+        send_counts = self.__chunk_overlaps(
+            current_displs[rank], current_displs[rank + 1], target_displs
+        )
+        recv_counts = self.__chunk_overlaps(
+            target_displs[rank], target_displs[rank + 1], current_displs
+        )
+
+        # the blocks are consecutive along the split axis, hence the data is exchanged in a single Alltoallv directly
+        # from the local data into the output buffer, the split axis is moved to the front for non-zero split axes
+        send_buffer = self.__array.transpose(0, self.split).contiguous()
+        recv_shape = list(send_buffer.shape)
+        recv_shape[0] = target_counts[rank]
+        recv_buffer = torch.empty(
+            recv_shape, dtype=self.dtype.torch_type(), device=self.device.torch_device
+        )
+        self.comm.Alltoallv(
+            (send_buffer, send_counts, tuple(np.cumsum((0,) + send_counts[:-1]).tolist())),
+            (recv_buffer, recv_counts, tuple(np.cumsum((0,) + recv_counts[:-1]).tolist())),
         )
-        # need the data start as well for process 0
-        for rcv_pr in range(self.comm.size - 1):
-            st = chunk_cumsum[rcv_pr].item()
-            sp = chunk_cumsum[rcv_pr + 1].item()
-            # start pr should be the next process with data
-            if lshape_map[rcv_pr, self.split] >= target_map[rcv_pr, self.split]:
-                # if there is more data on the process than the start process than start == stop
-                st_pr = rcv_pr
-                sp_pr = rcv_pr
-            else:
-                # if there is less data on the process than need to get the data from the next data
-                # with data
-                # need processes > rcv_pr with lshape > 0
-                st_pr = torch.nonzero(lshape_map[rcv_pr:, self.split] > 0)[0].item() + rcv_pr
-                hld = torch.nonzero(sp <= lshape_cumsum[rcv_pr:]).flatten() + rcv_pr
-                sp_pr = hld[0].item() if hld.numel() > 0 else self.comm.size
-
-            # st_pr and sp_pr are the processes on which the data sits at the beginning
-            # need to loop from st_pr to sp_pr + 1 and send the pr
-            for snd_pr in range(st_pr, sp_pr + 1):
-                if snd_pr == self.comm.size:
-                    break
-                data_required = abs(sp - st - lshape_map[rcv_pr, self.split].item())
-                send_amt = (
-                    data_required
-                    if data_required <= lshape_map[snd_pr, self.split]
-                    else lshape_map[snd_pr, self.split]
-                )
-                if (sp - st) <= lshape_map[rcv_pr, self.split].item() or snd_pr == rcv_pr:
-                    send_amt = 0
-                # send amount is the data still needed by recv if that is available on the snd
-                if send_amt != 0:
-                    self.__redistribute_shuffle(
-                        snd_pr=snd_pr, send_amt=send_amt, rcv_pr=rcv_pr, snd_dtype=snd_dtype
-                    )
-                lshape_cumsum[snd_pr] -= send_amt
-                lshape_cumsum[rcv_pr] += send_amt
-                lshape_map[rcv_pr, self.split] += send_amt
-                lshape_map[snd_pr, self.split] -= send_amt
-            if lshape_map[rcv_pr, self.split] > target_map[rcv_pr, self.split]:
-                # if there is any data left on the process then send it to the next one
-                send_amt = lshape_map[rcv_pr, self.split] - target_map[rcv_pr, self.split]
-                self.__redistribute_shuffle(
-                    snd_pr=rcv_pr, send_amt=send_amt.item(), rcv_pr=rcv_pr + 1, snd_dtype=snd_dtype
-                )
-                lshape_cumsum[rcv_pr] -= send_amt
-                lshape_cumsum[rcv_pr + 1] += send_amt
-                lshape_map[rcv_pr, self.split] -= send_amt
-                lshape_map[rcv_pr + 1, self.split] += send_amt
 
-        if any(lshape_map[..., self.split] != target_map[..., self.split]):
-            # sometimes need to call the redistribute once more,
-            # (in the case that the second to last processes needs to get data from +1 and -1)
-            self.redistribute_(lshape_map=lshape_map, target_map=target_map)
+        if self.split == 0:
+            self.__array = recv_buffer
+        else:
+            self.__array = recv_buffer.transpose(0, self.split).contiguous()
+        lshape_map[..., self.split] = target_map[..., self.split]
 
-    def __redistribute_shuffle(self, snd_pr, send_amt, rcv_pr, snd_dtype):
+    @staticmethod
+    def __chunk_overlaps(start, end, displs):
         """
-        Function to abstract the function used during redistribute for shuffling data between
-        processes along the split axis
+        Calculates the number of elements along the split axis that the global range [start, end) shares with each of
+        the chunks delimited by the displacements displs.
 
         Parameters
         ----------
-        snd_pr : int, single element torch.Tensor
-            Sending process
-        send_amt : int, single element torch.Tensor
-            Amount of data to be sent by the sending process
-        rcv_pr : int, single element torch.Tensor
-            Recieving process
-        snd_dtype : torch.type
-            Torch type of the data in question
+        start : int
+            Global start index of the range
+        end : int
+            Global end index of the range
+        displs : np.ndarray
+            The global start indices of all chunks followed by the total length
 
         Returns
         -------
-        None
+        counts : tuple of ints
+            The overlap with each chunk
         """
-        rank = self.comm.rank
-        send_slice = [slice(None)] * self.numdims
-        keep_slice = [slice(None)] * self.numdims
-        if rank == snd_pr:
-            if snd_pr < rcv_pr:  # data passed to a higher rank (off the bottom)
-                send_slice[self.split] = slice(
-                    self.lshape[self.split] - send_amt, self.lshape[self.split]
-                )
-                keep_slice[self.split] = slice(0, self.lshape[self.split] - send_amt)
-            if snd_pr > rcv_pr:  # data passed to a lower rank (off the top)
-                send_slice[self.split] = slice(0, send_amt)
-                keep_slice[self.split] = slice(send_amt, self.lshape[self.split])
-            data = self.__array[send_slice].clone()
-            self.comm.Send(data, dest=rcv_pr, tag=685)
-            self.__array = self.__array[keep_slice]
-        if rank == rcv_pr:
-            shp = list(self.gshape)
-            shp[self.split] = send_amt
-            data = torch.zeros(shp, dtype=snd_dtype, device=self.device.torch_device)
-            self.comm.Recv(data, source=snd_pr, tag=685)
-            if snd_pr < rcv_pr:  # data passed from a lower rank (append to top)
-                self.__array = torch.cat((data, self.__array), dim=self.split)
-            if snd_pr > rcv_pr:  # data passed from a higher rank (append to bottom)
-                self.__array = torch.cat((self.__array, data), dim=self.split)
+        return tuple(
+            int(max(0, min(end, displs[i + 1]) - max(start, displs[i])))
+            for i in range(len(displs) - 1)
+        )
 
     def resplit_(self, axis=None):
         """
@@ -2499,21 +3006,35 @@ class DNDarray:
 
         # entirely new split axis, need to redistribute
         else:
-            _, output_shape, _ = self.comm.chunk(self.shape, axis)
-            redistributed = torch.empty(
-                output_shape, dtype=self.dtype.torch_type(), device=self.device.torch_device
+            # each block exchanged between two processes is packed contiguously, which keeps the message layout
+            # independent of how unevenly the old and the new split axis are chunked
+            new_counts, _, _ = self.comm.counts_displs_shape(self.shape, axis)
+            old_counts, _, _ = self.comm.counts_displs_shape(self.shape, self.split)
+            send_blocks = torch.split(self.__array, [int(count) for count in new_counts], dim=axis)
+            send_buffer = torch.cat([block.reshape(-1) for block in send_blocks])
+
+            block_shape = list(self.shape)
+            block_shape[axis] = new_counts[self.comm.rank]
+            recv_shapes = []
+            for count in old_counts:
+                block_shape[self.split] = int(count)
+                recv_shapes.append(tuple(block_shape))
+            recv_counts = tuple(int(np.prod(shape)) for shape in recv_shapes)
+            recv_buffer = torch.empty(
+                (sum(recv_counts),), dtype=self.dtype.torch_type(), device=self.device.torch_device
             )
 
-            send_counts, send_displs, _ = self.comm.counts_displs_shape(self.lshape, axis)
-            recv_counts, recv_displs, _ = self.comm.counts_displs_shape(self.shape, self.split)
+            send_counts = tuple(block.numel() for block in send_blocks)
             self.comm.Alltoallv(
-                (self.__array, send_counts, send_displs),
-                (redistributed, recv_counts, recv_displs),
-                send_axis=axis,
-                recv_axis=self.split,
+                (send_buffer, send_counts, tuple(np.cumsum((0,) + send_counts[:-1]))),
+                (recv_buffer, recv_counts, tuple(np.cumsum((0,) + recv_counts[:-1]))),
             )
 
-            self.__array = redistributed
+            recv_blocks = torch.split(recv_buffer, recv_counts)
+            self.__array = torch.cat(
+                [block.reshape(shape) for block, shape in zip(recv_blocks, recv_shapes)],
+                dim=self.split,
+            )
             self.__split = axis
 
         return self
@@ -2644,6 +3165,22 @@ class DNDarray:
         """
         return arithmetics.right_shift(self, other)
 
+    def __irshift__(self, other):
+        """
+        In-place element-wise right shift of the tensor's bits by another tensor or a scalar (i.e. >>=).
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand, it must be broadcastable to the shape of the tensor
+
+        Returns
+        -------
+        result: ht.DNDarray
+            A reference to the tensor
+        """
+        return arithmetics.right_shift(self, other, out=self)
+
     def __rsub__(self, other):
         """
         Element-wise subtraction of another tensor or a scalar from the tensor.
@@ -2706,7 +3243,12 @@ class DNDarray:
         path : str
             Path to the file to be stored.
         args/kwargs : list/dict
-            additional options passed to the particular functions.
+            additional options passed to the particular functions, see ht.save for asynchronous saving.
+
+        Returns
+        -------
+        request : ht.io.SaveRequest or None
+            Handle to wait for the completion of an asynchronous save, None otherwise.
 
         Raises
         -------
@@ -2718,12 +3260,13 @@ class DNDarray:
         >>> a = ht.arange(100, split=0)
         >>> a.save('data.h5', 'DATA', mode='a')
         >>> a.save('data.nc', 'DATA', mode='w')
+        >>> a.save('checkpoint.npy', async_=True).wait()
         """
         return io.save(self, path, *args, **kwargs)
 
     if io.supports_hdf5():
 
-        def save_hdf5(self, path, dataset, mode="w", **kwargs):
+        def save_hdf5(self, path, dataset, mode="w", aggregators=None, **kwargs):
             """
             Saves data to an HDF5 file. Attempts to utilize parallel I/O if possible.
 
@@ -2735,6 +3278,9 @@ class DNDarray:
                 Name of the dataset the data is saved to.
             mode : str, one of 'w', 'a', 'r+'
                 File access mode
+            aggregators : int, optional
+                Without parallel I/O, the chunks of split data are gathered on this number of processes, which write
+                them one after another. Default: None, every process writes its own chunk one after another.
             kwargs : dict
                 additional arguments passed to the created dataset.
 
@@ -2743,17 +3289,17 @@ class DNDarray:
             TypeError
                 If any of the input parameters are not of correct type.
             ValueError
-                If the access mode is not understood.
+                If the access mode or the number of aggregators is not understood.
 
             Examples
             --------
             >>> ht.arange(100, split=0).save_hdf5('data.h5', dataset='DATA')
             """
-            return io.save_hdf5(self, path, dataset, mode, **kwargs)
+            return io.save_hdf5(self, path, dataset, mode, aggregators, **kwargs)
 
     if io.supports_netcdf():
 
-        def save_netcdf(self, path, variable, mode="w", **kwargs):
+        def save_netcdf(self, path, variable, mode="w", aggregators=None, **kwargs):
             """
             Saves data to a netCDF4 file. Attempts to utilize parallel I/O if possible.
 
@@ -2765,6 +3311,9 @@ class DNDarray:
                 Name of the variable the data is saved to.
             mode : str, one of 'w', 'a', 'r+'
                 File access mode
+            aggregators : int, optional
+                Without parallel I/O, the chunks of split data are gathered on this number of processes, which write
+                them one after another. Default: None, every process writes its own chunk one after another.
             kwargs : dict
                 additional arguments passed to the created dataset.
 
@@ -2773,13 +3322,13 @@ class DNDarray:
             TypeError
                 If any of the input parameters are not of correct type.
             ValueError
-                If the access mode is not understood.
+                If the access mode or the number of aggregators is not understood.
 
             Examples
             --------
             >>> ht.arange(100, split=0).save_netcdf('data.nc', dataset='DATA')
             """
-            return io.save_netcdf(self, path, variable, mode, **kwargs)
+            return io.save_netcdf(self, path, variable, mode, aggregators, **kwargs)
 
     def __setitem__(self, key, value):
         """
@@ -2812,6 +3361,10 @@ class DNDarray:
         (2/2) >>> tensor([[0., 1., 0., 0., 0.],
                           [0., 1., 0., 0., 0.]])
         """
+        fusion.evaluate_readers(self.__array)
+        advanced_axis = self.__advanced_axis(key)
+        if advanced_axis is not None:
+            return self.__advanced_setitem(key, advanced_axis, value)
         if isinstance(key, DNDarray) and key.gshape[-1] != len(self.gshape):
             key = tuple(x.item() for x in key)
         if not self.is_distributed():
@@ -3124,6 +3677,22 @@ class DNDarray:
         """
         return arithmetics.sub(self, other)
 
+    def __isub__(self, other):
+        """
+        In-place element-wise subtraction of another tensor or a scalar from the tensor (i.e. -=).
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand, it must be broadcastable to the shape of the tensor
+
+        Returns
+        -------
+        result: ht.DNDarray
+            A reference to the tensor
+        """
+        return arithmetics.sub(self, other, out=self)
+
     def sum(self, axis=None, out=None, keepdim=None):
         """
         Sum of array elements over a given axis.
@@ -3316,6 +3885,22 @@ class DNDarray:
         """
         return arithmetics.div(self, other)
 
+    def __itruediv__(self, other):
+        """
+        In-place element-wise true division of the tensor by another tensor or a scalar (i.e. /=).
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand, it must be broadcastable to the shape of the tensor
+
+        Returns
+        -------
+        result: ht.DNDarray
+            A reference to the tensor
+        """
+        return arithmetics.div(self, other, out=self)
+
     def trunc(self, out=None):
         """
         Return the trunc of the input, element-wise.
@@ -3348,7 +3933,15 @@ class DNDarray:
         """
         return rounding.trunc(self, out)
 
-    def unique(self, sorted=False, return_inverse=False, axis=None):
+    def unique(
+        self,
+        sorted=False,
+        return_inverse=False,
+        axis=None,
+        distributed_inverse=False,
+        partitioned=False,
+        return_counts=False,
+    ):
         """
         Finds and returns the unique elements of the tensor.
 
@@ -3364,13 +3957,23 @@ class DNDarray:
         axis : int
             Axis along which unique elements should be found. Default to None, which will return a one dimensional list of
             unique values.
+        distributed_inverse : bool
+            Whether the inverse indices are returned as DNDarray distributed along the split axis instead of being
+            replicated on all processes.
+        partitioned : bool
+            Whether the unique elements are assigned to owner processes by hashing their values and returned
+            distributed along axis 0 instead of being gathered on all processes.
+        return_counts : bool
+            Whether to also return the number of occurrences of each unique element, requires partitioned.
 
         Returns
         -------
         res : ht.DNDarray
             Output array. The unique elements. Elements are distributed the same way as the input tensor.
-        inverse_indices : torch.tensor (optional)
+        inverse_indices : torch.tensor or ht.DNDarray (optional)
             If return_inverse is True, this tensor will hold the list of inverse indices
+        counts : ht.DNDarray (optional)
+            If return_counts is True, this tensor will hold the number of occurrences of each unique element
 
         Examples
         --------
@@ -3386,7 +3989,9 @@ class DNDarray:
         array([[2, 3],
                [3, 1]])
         """
-        return manipulations.unique(self, sorted, return_inverse, axis)
+        return manipulations.unique(
+            self, sorted, return_inverse, axis, distributed_inverse, partitioned, return_counts
+        )
 
     def var(self, axis=None, ddof=0, **kwargs):
         """
@@ -3474,6 +4079,22 @@ class DNDarray:
         """
         return arithmetics.bitwise_xor(self, other)
 
+    def __ixor__(self, other):
+        """
+        In-place element-wise bit-wise XOR of the tensor with another tensor or a scalar (i.e. ^=).
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand, it must be broadcastable to the shape of the tensor
+
+        Returns
+        -------
+        result: ht.DNDarray
+            A reference to the tensor
+        """
+        return arithmetics.bitwise_xor(self, other, out=self)
+
     """
     This ensures that commutative arithmetic operations work no matter on which side the heat-tensor is placed.
 
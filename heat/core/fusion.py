@@ -0,0 +1,244 @@
+import contextlib
+import torch
+import weakref
+
+from . import stride_tricks
+
+__all__ = ["is_lazy", "lazy"]
+
+# number of elements of the result that are evaluated at once during a fused pass
+CHUNK_SIZE = 2 ** 18
+
+# nesting depth of the currently active lazy contexts
+__lazy_depth = 0
+# heat arrays holding deferred local data, evaluated when the outermost lazy context is left
+__pending = weakref.WeakValueDictionary()
+
+
+class DeferredTensor:
+    """
+    Node of an element-wise expression graph, recorded instead of a torch tensor while in lazy mode. A node knows the
+    shape, dtype and device of its result without evaluating it. When the value is requested, the whole sub-graph is
+    evaluated in a single fused pass over chunks of the result, i.e. intermediate results are only ever allocated for
+    one chunk at a time.
+
+    Parameters
+    ----------
+    operation : function
+        The element-wise torch operation, e.g. torch.add
+    operands : tuple of torch.Tensor or DeferredTensor
+        The operands of the operation
+    cast : torch.dtype
+        The type the operands are cast to before the operation is applied
+    dtype : torch.dtype
+        The type of the operation's result
+    kwargs : dict
+        Additional keyword arguments passed to the operation
+    """
+
+    def __init__(self, operation, operands, cast, dtype, **kwargs):
+        self.operation = operation
+        self.operands = operands
+        self.cast = cast
+        self.kwargs = kwargs
+        self.dtype = dtype
+        self.device = operands[0].device
+        self.value = None
+
+        shape = tuple(operands[0].shape)
+        for operand in operands[1:]:
+            shape = stride_tricks.broadcast_shape(shape, tuple(operand.shape))
+        self.shape = torch.Size(shape)
+
+    def evaluate(self):
+        """
+        Evaluates the expression graph rooted in this node. The result is cached and the references to the operands
+        are released.
+
+        Returns
+        -------
+        value : torch.Tensor
+            The local result of the expression
+        """
+        if self.value is None:
+            self.value = self.__fuse()
+            self.operation, self.operands, self.kwargs = None, None, None
+
+        return self.value
+
+    def __fuse(self):
+        """
+        Evaluates the graph chunk-wise along the first dimension of the result and writes into a preallocated buffer.
+        """
+        rows = self.shape[0] if len(self.shape) > 0 else 0
+        row_size = max(1, self.shape[1:].numel())
+        chunk_rows = max(1, CHUNK_SIZE // row_size)
+
+        # small or 0-dimensional results are computed in one go
+        if rows <= chunk_rows:
+            return self.__evaluate_chunk(self, None, {})
+
+        result = torch.empty(self.shape, dtype=self.dtype, device=self.device)
+        for start in range(0, rows, chunk_rows):
+            chunk = slice(start, min(start + chunk_rows, rows))
+            result[chunk] = self.__evaluate_chunk(self, chunk, {})
+
+        return result
+
+    def __evaluate_chunk(self, node, chunk, memo):
+        """
+        Recursively evaluates the rows denoted by chunk of the given node. Operands that are broadcast along the
+        chunked dimension are not sliced, sub-graphs of a different shape than the result are evaluated fully upfront.
+        """
+        if isinstance(node, DeferredTensor):
+            if node.value is not None:
+                node = node.value
+            elif chunk is not None and node.shape != self.shape:
+                node = node.evaluate()
+            elif id(node) in memo:
+                return memo[id(node)]
+            else:
+                operands = (
+                    self.__evaluate_chunk(operand, chunk, memo).type(node.cast)
+                    for operand in node.operands
+                )
+                memo[id(node)] = node.operation(*operands, **node.kwargs)
+                return memo[id(node)]
+
+        if chunk is None or node.dim() != len(self.shape) or node.shape[0] == 1:
+            return node
+        return node[chunk]
+
+
+def defer(operation, operands, cast, **kwargs):
+    """
+    Records an element-wise operation in the expression graph if lazy mode is enabled.
+
+    Parameters
+    ----------
+    operation : function
+        The element-wise torch operation, e.g. torch.add
+    operands : tuple of torch.Tensor or DeferredTensor
+        The process-local operands of the operation
+    cast : torch.dtype
+        The type the operands are cast to before the operation is applied
+    kwargs : dict
+        Additional keyword arguments passed to the operation
+
+    Returns
+    -------
+    deferred : DeferredTensor or None
+        The graph node of the operation. None, if lazy mode is disabled or the operation is not element-wise, in which
+        case the caller has to evaluate the operation eagerly.
+    """
+    if not __lazy_depth:
+        return None
+
+    # probe the operation on single elements to determine the result type, non-element-wise operations (e.g.
+    # torch.equal) and invalid type combinations are left to the eager evaluation
+    try:
+        probe = operation(*(torch.ones((), dtype=cast) for _ in operands), **kwargs)
+    except (RuntimeError, TypeError, ValueError):
+        return None
+    if not isinstance(probe, torch.Tensor) or probe.dim() != 0:
+        return None
+
+    return DeferredTensor(operation, tuple(operands), cast, probe.dtype, **kwargs)
+
+
+def evaluate_readers(tensor):
+    """
+    Evaluates the deferred local data of all tracked heat arrays that read the memory of a tensor, before the tensor is
+    modified in-place.
+
+    Parameters
+    ----------
+    tensor : torch.Tensor
+        The process-local data about to be modified
+    """
+    if not __pending:
+        return
+
+    storage = tensor.storage().data_ptr()
+    for key, x in list(__pending.items()):
+        buffer = x._DNDarray__buffer
+        if not isinstance(buffer, DeferredTensor):
+            __pending.pop(key, None)
+        elif __reads(buffer, storage, set()):
+            x._DNDarray__array
+            __pending.pop(key, None)
+
+
+def __reads(node, storage, visited):
+    """
+    Determines whether the expression graph rooted in node reads the memory at the address storage. Evaluated nodes
+    are represented by their cached value.
+    """
+    if isinstance(node, DeferredTensor):
+        if node.value is not None:
+            node = node.value
+        elif id(node) in visited:
+            return False
+        else:
+            visited.add(id(node))
+            return any(__reads(operand, storage, visited) for operand in node.operands)
+
+    return node.storage().data_ptr() == storage
+
+
+def is_lazy():
+    """
+    Determines whether element-wise operations are currently recorded lazily.
+
+    Returns
+    -------
+    lazy_flag : bool
+        flag indicating whether lazy mode is enabled
+    """
+    return __lazy_depth > 0
+
+
+def track(x):
+    """
+    Registers a heat array holding deferred local data, so that it can be evaluated when lazy mode is left.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        The array to be tracked
+    """
+    __pending[id(x)] = x
+
+
+@contextlib.contextmanager
+def lazy():
+    """
+    Context manager enabling lazy evaluation of element-wise operations. Within the context, the element-wise
+    operations of the arithmetics, exponential, trigonometrics, rounding, relational and logical modules are recorded
+    in an expression graph instead of being computed immediately. The graph is evaluated in a single fused pass over
+    the process-local data once the result is consumed, e.g. by a reduction, communication or numpy(), or at the
+    latest when the outermost lazy context is left.
+
+    Deferred results reference their operands. In-place operations, out= buffers and item assignments evaluate the
+    deferred results reading the modified array first.
+
+    Examples
+    --------
+    >>> x = ht.random.randn(10000, 100, split=0)
+    >>> with ht.lazy():
+    ...     y = (x - x.mean(axis=0)) ** 2 / x.std(axis=0)
+    ...     total = y.sum()  # evaluates y in one pass without the three intermediate arrays
+    """
+    global __lazy_depth
+    __lazy_depth += 1
+
+    try:
+        yield
+    finally:
+        __lazy_depth -= 1
+
+        if not __lazy_depth:
+            pending = list(__pending.values())
+            __pending.clear()
+            for x in pending:
+                x._DNDarray__array
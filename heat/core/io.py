@@ -1,10 +1,18 @@
+import atexit
+import collections
+import concurrent.futures
+import functools
+import io
+import json
+import numpy as np
 import os.path
 
 import torch
 import warnings
+import zlib
 
 from heat.core import factories
-from .communication import MPI, MPI_WORLD, sanitize_comm
+from .communication import MPI, MPI_WORLD, MPICommunication, sanitize_comm
 from . import devices
 from .stride_tricks import sanitize_axis
 from . import types
@@ -13,9 +21,36 @@ __VALID_WRITE_MODES = frozenset(["w", "a", "r+"])
 __CSV_EXTENSION = frozenset([".csv"])
 __HDF5_EXTENSIONS = frozenset([".h5", ".hdf5"])
 __NETCDF_EXTENSIONS = frozenset([".nc", ".nc4", "netcdf"])
+__NPY_EXTENSION = frozenset([".npy"])
+__COMPRESSED_EXTENSION = frozenset([".htz"])
+__COMPRESSED_MAGIC = b"\x93HEATZ\x01\x00"
 __NETCDF_DIM_TEMPLATE = "{}_dim_{}"
 
-__all__ = ["load", "load_csv", "save"]
+# compression and decompression functions of the supported codecs, taking the bytes and the compression level
+__COMPRESSORS = {"zlib": (zlib.compress, zlib.decompress)}
+try:
+    import lz4.frame
+except ImportError:
+    # lz4 support is optional
+    pass
+else:
+    __COMPRESSORS["lz4"] = (
+        lambda data, level: lz4.frame.compress(data, compression_level=level),
+        lz4.frame.decompress,
+    )
+
+__all__ = [
+    "iter_chunks",
+    "load",
+    "load_compressed",
+    "load_csv",
+    "load_npy",
+    "load_raw",
+    "save",
+    "save_compressed",
+    "save_npy",
+    "save_raw",
+]
 
 
 try:
@@ -39,7 +74,16 @@ else:
     def supports_hdf5():
         return True
 
-    def load_hdf5(path, dataset, dtype=types.float32, split=None, device=None, comm=None):
+    def load_hdf5(
+        path,
+        dataset,
+        dtype=types.float32,
+        split=None,
+        device=None,
+        comm=None,
+        selection=None,
+        chunk_aligned=False,
+    ):
         """
         Loads data from an HDF5 file. The data may be distributed among multiple processing nodes via the split flag.
 
@@ -57,6 +101,13 @@ else:
             The device id on which to place the data, defaults to globally set default device.
         comm : Communication, optional
             The communication to use for the data distribution. defaults to MPI_COMM_WORLD.
+        selection : slice, list of ints or tuple of these, optional
+            The part of the dataset to be read, one entry per leading axis. Slices must have a positive step, lists
+            must be increasing. The rest of the dataset is not read. Default: None, the entire dataset is read.
+        chunk_aligned : bool, optional
+            Moves the boundaries between the processes along the split axis to the closest boundaries of the chunks
+            the dataset is stored in, so that every chunk is read and decompressed by a single process. The
+            resulting array may be unbalanced, see balance_(). Default: False.
 
         Returns
         -------
@@ -67,6 +118,8 @@ else:
         -------
         TypeError
             If any of the input parameters are not of correct type
+        ValueError
+            If the selection is not understood.
 
         Examples
         --------
@@ -80,6 +133,9 @@ else:
         (5,)
         >>> b.lshape
         (3,)
+        >>> c = ht.load_hdf5('data.h5', dataset='DATA', selection=slice(1, 4))
+        >>> c.shape
+        (3,)
         """
         if not isinstance(path, str):
             raise TypeError("path must be str, not {}".format(type(path)))
@@ -87,6 +143,8 @@ else:
             raise TypeError("dataset must be str, not {}".format(type(dataset)))
         if split is not None and not isinstance(split, int):
             raise TypeError("split must be None or int, not {}".format(type(split)))
+        if not isinstance(chunk_aligned, bool):
+            raise TypeError("chunk_aligned must be bool, not {}".format(type(chunk_aligned)))
 
         # infer the type and communicator for the loaded array
         dtype = types.canonical_heat_type(dtype)
@@ -97,34 +155,63 @@ else:
         # actually load the data from the HDF5 file
         with h5py.File(path, "r") as handle:
             data = handle[dataset]
-            gshape = tuple(data.shape)
-            dims = len(gshape)
+            keys = __sanitize_selection(data.shape, selection)
+            gshape = tuple(len(key) for key in keys)
             split = sanitize_axis(gshape, split)
-            _, _, indices = comm.chunk(gshape, split)
-            if split is None:
-                data = torch.tensor(
-                    data[indices], dtype=dtype.torch_type(), device=device.torch_device
-                )
-            elif indices[split].stop > indices[split].start:
-                data = torch.tensor(
-                    data[indices], dtype=dtype.torch_type(), device=device.torch_device
+
+            if split is not None:
+                _, displs, _ = comm.counts_displs_shape(gshape, split)
+                bounds = list(displs) + [gshape[split]]
+                key = keys[split]
+                # chunk boundaries are only meaningful for contiguous selections
+                if chunk_aligned and data.chunks is not None and isinstance(key, range):
+                    if key.step == 1:
+                        chunk = data.chunks[split]
+                        for i in range(1, comm.size):
+                            bound = (key.start + bounds[i] + chunk // 2) // chunk * chunk
+                            bounds[i] = min(max(bound, key.start), key.stop) - key.start
+                keys[split] = key[bounds[comm.rank] : bounds[comm.rank + 1]]
+
+            # HDF5 converts the data type while reading directly into the buffer, except for booleans
+            buffer_type = data.dtype if dtype is types.bool else dtype.torch_type()
+            if not isinstance(buffer_type, np.dtype):
+                buffer_type = torch.empty(0, dtype=buffer_type).numpy().dtype
+            buffer = np.empty(tuple(len(key) for key in keys), dtype=buffer_type)
+            if buffer.size > 0:
+                data.read_direct(
+                    buffer,
+                    tuple(
+                        slice(key.start, key.start + len(key) * key.step, key.step)
+                        if isinstance(key, range)
+                        else key
+                        for key in keys
+                    ),
                 )
-            else:
+            elif split is not None and len(keys[split]) == 0:
                 warnings.warn("More MPI ranks are used then the length of splitting dimension!")
-                slice1 = tuple(
-                    slice(0, gshape[i]) if i != split else slice(0, 1) for i in range(dims)
-                )
-                slice2 = tuple(
-                    slice(0, gshape[i]) if i != split else slice(0, 0) for i in range(dims)
-                )
-                data = torch.tensor(
-                    data[slice1], dtype=dtype.torch_type(), device=device.torch_device
-                )
-                data = data[slice2]
 
-            return dndarray.DNDarray(data, gshape, dtype, split, device, comm)
+        data = torch.from_numpy(buffer).type(dtype.torch_type()).to(device.torch_device)
+
+        return dndarray.DNDarray(data, gshape, dtype, split, device, comm)
+
+    def __hdf5_chunk_reader(path, dataset, split, comm):
+        """
+        Prepares reading successive rows of an HDF5 dataset, see iter_chunks.
+        """
+        with h5py.File(path, "r") as handle:
+            data = handle[dataset]
+            gshape, file_dtype = tuple(data.shape), data.dtype
+
+        def read(begin, end):
+            start, stop = __local_rows(begin, end, split, comm)
+            if stop == start:
+                return np.empty((0,) + gshape[1:], dtype=file_dtype)
+            with h5py.File(path, "r") as handle:
+                return handle[dataset][start:stop]
+
+        return gshape, read
 
-    def save_hdf5(data, path, dataset, mode="w", **kwargs):
+    def save_hdf5(data, path, dataset, mode="w", aggregators=None, **kwargs):
         """
         Saves data to an HDF5 file. Attempts to utilize parallel I/O if possible.
 
@@ -138,6 +225,9 @@ else:
             Name of the dataset the data is saved to.
         mode : str, one of 'w', 'a', 'r+'
             File access mode
+        aggregators : int, optional
+            Without parallel I/O, the chunks of split data are gathered on this number of processes, which write them
+            one after another. Default: None, every process writes its own chunk one after another.
         kwargs : dict
             additional arguments passed to the created dataset.
 
@@ -146,7 +236,7 @@ else:
         TypeError
             If any of the input parameters are not of correct type.
         ValueError
-            If the access mode is not understood.
+            If the access mode or the number of aggregators is not understood.
 
         Examples
         --------
@@ -165,6 +255,10 @@ else:
             raise ValueError(
                 "mode was {}, not in possible modes {}".format(mode, __VALID_WRITE_MODES)
             )
+        if aggregators is not None and not isinstance(aggregators, int):
+            raise TypeError("aggregators must be None or int, not {}".format(type(aggregators)))
+        if aggregators is not None and aggregators < 1:
+            raise ValueError("aggregators must be positive, but is {}".format(aggregators))
 
         # chunk the data, if no split is set maximize parallel I/O and chunk first axis
         is_split = data.split is not None
@@ -178,6 +272,18 @@ else:
                     data._DNDarray__array.cpu() if is_split else data._DNDarray__array[slices].cpu()
                 )
 
+        # gather the chunks on a few processes, which write them one after another
+        elif is_split and aggregators is not None:
+
+            def write(slab, slices, create):
+                with h5py.File(path, mode if create else "r+") as handle:
+                    if create:
+                        handle.create_dataset(dataset, data.shape, **kwargs)
+                    if slab.size > 0:
+                        handle[dataset][slices] = slab
+
+            __write_aggregated(data, aggregators, write)
+
         # otherwise a single rank only write is performed in case of local data (i.e. no split)
         elif data.comm.rank == 0:
             with h5py.File(path, mode) as handle:
@@ -308,7 +414,24 @@ else:
 
             return dndarray.DNDarray(data, gshape, dtype, split, device, comm)
 
-    def save_netcdf(data, path, variable, mode="w", **kwargs):
+    def __netcdf_chunk_reader(path, variable, split, comm):
+        """
+        Prepares reading successive rows of a NetCDF4 variable, see iter_chunks.
+        """
+        with nc.Dataset(path, "r") as handle:
+            data = handle[variable]
+            gshape, file_dtype = tuple(data.shape), data.dtype
+
+        def read(begin, end):
+            start, stop = __local_rows(begin, end, split, comm)
+            if stop == start:
+                return np.empty((0,) + gshape[1:], dtype=file_dtype)
+            with nc.Dataset(path, "r") as handle:
+                return np.asarray(handle[variable][start:stop])
+
+        return gshape, read
+
+    def save_netcdf(data, path, variable, mode="w", aggregators=None, **kwargs):
         """
         Saves data to a netCDF4 file. Attempts to utilize parallel I/O if possible.
 
@@ -322,6 +445,9 @@ else:
             Name of the variable the data is saved to.
         mode : str, one of 'w', 'a', 'r+'
             File access mode
+        aggregators : int, optional
+            Without parallel I/O, the chunks of split data are gathered on this number of processes, which write them
+            one after another. Default: None, every process writes its own chunk one after another.
         kwargs : dict
             additional arguments passed to the created dataset.
 
@@ -330,7 +456,7 @@ else:
         TypeError
             If any of the input parameters are not of correct type.
         ValueError
-            If the access mode is not understood.
+            If the access mode or the number of aggregators is not understood.
 
         Examples
         --------
@@ -349,6 +475,10 @@ else:
             raise ValueError(
                 "mode was {}, not in possible modes {}".format(mode, __VALID_WRITE_MODES)
             )
+        if aggregators is not None and not isinstance(aggregators, int):
+            raise TypeError("aggregators must be None or int, not {}".format(type(aggregators)))
+        if aggregators is not None and aggregators < 1:
+            raise ValueError("aggregators must be positive, but is {}".format(aggregators))
 
         # chunk the data, if no split is set maximize parallel I/O and chunk first axis
         is_split = data.split is not None
@@ -368,6 +498,25 @@ else:
                     data._DNDarray__array.cpu() if is_split else data._DNDarray__array[slices].cpu()
                 )
 
+        # gather the chunks on a few processes, which write them one after another
+        elif is_split and aggregators is not None:
+
+            def write(slab, slices, create):
+                with nc.Dataset(path, mode if create else "r+") as handle:
+                    if create:
+                        dimension_names = []
+                        for dimension, elements in enumerate(data.shape):
+                            name = __NETCDF_DIM_TEMPLATE.format(variable, dimension)
+                            handle.createDimension(name, elements)
+                            dimension_names.append(name)
+                        handle.createVariable(
+                            variable, data.dtype.char(), tuple(dimension_names), **kwargs
+                        )
+                    if slab.size > 0:
+                        handle[variable][slices] = slab
+
+            __write_aggregated(data, aggregators, write)
+
         # otherwise a single rank only write is performed in case of local data (i.e. no split)
         elif data.comm.rank == 0:
             with nc.Dataset(path, mode) as handle:
@@ -402,7 +551,64 @@ else:
             data.comm.Isend([None, 0, MPI.INT], dest=next_rank)
 
 
-def load(path, *args, **kwargs):
+def __sanitize_selection(shape, selection):
+    """
+    Converts a selection of a part of a dataset into one key per axis.
+
+    Parameters
+    ----------
+    shape : tuple of ints
+        The shape of the dataset.
+    selection : None, slice, list of ints or tuple of these
+        The part of the dataset to be selected, one entry per leading axis.
+
+    Returns
+    -------
+    keys : list of ranges or lists of ints
+        The selected indices for each axis.
+
+    Raises
+    -------
+    TypeError
+        If the selection is not a slice, list of ints or tuple of these.
+    ValueError
+        If the selection has more entries than the dataset has axes, a slice has a negative step or a list is not
+        increasing.
+    IndexError
+        If a list contains an index out of bounds.
+    """
+    if selection is None:
+        selection = ()
+    elif not isinstance(selection, tuple):
+        selection = (selection,)
+    if len(selection) > len(shape):
+        raise ValueError(
+            "selection has {} entries, but the dataset only has {} axes".format(
+                len(selection), len(shape)
+            )
+        )
+
+    keys = []
+    for key, length in zip(selection + (slice(None),) * (len(shape) - len(selection)), shape):
+        if isinstance(key, slice):
+            key = range(*key.indices(length))
+            if key.step < 0:
+                raise ValueError("selection slices must have a positive step")
+        elif isinstance(key, list) and all(isinstance(index, int) for index in key):
+            if any(key[i] >= key[i + 1] for i in range(len(key) - 1)):
+                raise ValueError("selection lists must be increasing, but are {}".format(key))
+            if key and (key[0] < 0 or key[-1] >= length):
+                raise IndexError(
+                    "selection {} out of bounds for axis of length {}".format(key, length)
+                )
+        else:
+            raise TypeError("selection must be slices or lists of ints, not {}".format(type(key)))
+        keys.append(key)
+
+    return keys
+
+
+def load(path, *args, shard=False, **kwargs):
     """
     Attempts to load data from a file stored on disk. Attempts to auto-detect the file format by determining the
     extension.
@@ -413,6 +619,11 @@ def load(path, *args, **kwargs):
         Path to the file to be read.
     args/kwargs : list/dict
         additional options passed to the particular functions.
+    shard : bool, optional
+        Loads data saved to one file per process, see save. The path contains '{rank}' or '*' in place of the number of
+        the process. The number of processes may differ from the one of the saving job, every process reads the parts
+        of the files it is assigned to. split, device and comm have to be passed as keyword arguments, split defaults
+        to the split axis of the saved data. Default: False.
 
     Returns
     -------
@@ -430,20 +641,412 @@ def load(path, *args, **kwargs):
     tensor([ 1.0000,  2.7183,  7.3891, 20.0855, 54.5981])
     >>> ht.load('data.nc', variable='DATA')
     tensor([ 1.0000,  2.7183,  7.3891, 20.0855, 54.5981])
+    >>> ht.load('data_*.h5', dataset='DATA', shard=True)
+    tensor([ 1.0000,  2.7183,  7.3891, 20.0855, 54.5981])
     """
     if not isinstance(path, str):
         raise TypeError("Expected path to be str, but was {}".format(type(path)))
     extension = os.path.splitext(path)[-1].strip().lower()
 
     if extension in __CSV_EXTENSION:
-        return load_csv(path, *args, **kwargs)
+        read = load_csv
+    elif extension in __NPY_EXTENSION:
+        read = load_npy
+    elif extension in __COMPRESSED_EXTENSION:
+        read = load_compressed
     elif supports_hdf5() and extension in __HDF5_EXTENSIONS:
-        return load_hdf5(path, *args, **kwargs)
+        read = load_hdf5
     elif supports_netcdf() and extension in __NETCDF_EXTENSIONS:
-        return load_netcdf(path, *args, **kwargs)
+        read = load_netcdf
     else:
         raise ValueError("Unsupported file extension {}".format(extension))
 
+    if shard:
+        return __load_sharded(read, path, args, kwargs)
+    return read(path, *args, **kwargs)
+
+
+def __shard_template(path):
+    """
+    Checks the path of sharded data and determines the path of its manifest.
+
+    Parameters
+    ----------
+    path : str
+        Path of the files, containing '{rank}' or '*' in place of the number of the process.
+
+    Returns
+    -------
+    template : str
+        The path containing '{rank}' in place of the number of the process.
+    manifest : str
+        The path of the manifest, the template with 'manifest' in place of the number of the process and the extension
+        '.json'.
+
+    Raises
+    -------
+    ValueError
+        If the path contains no placeholder for the number of the process.
+    """
+    template = path.replace("*", "{rank}")
+    if "{rank}" not in template:
+        raise ValueError(
+            "path of sharded data must contain '{{rank}}' or '*', but is {}".format(path)
+        )
+    manifest = os.path.splitext(template.replace("{rank}", "manifest"))[0] + ".json"
+
+    return template, manifest
+
+
+def __load_sharded(read, path, args, kwargs):
+    """
+    Loads data saved to one file per process. Every process reads the parts of the files overlapping with the rows
+    along the split axis it is assigned to, which are balanced irrespective of the number of saving processes.
+
+    Parameters
+    ----------
+    read : callable
+        The load function of the file format.
+    path : str
+        Path of the files, containing '{rank}' or '*' in place of the number of the process.
+    args/kwargs : list/dict
+        additional options passed to the load function, except for split, device and comm.
+
+    Returns
+    -------
+    out : ht.DNDarray
+        Data read from the files.
+    """
+    _, manifest_path = __shard_template(path)
+    kwargs = dict(kwargs)
+    device = devices.sanitize_device(kwargs.pop("device", None))
+    comm = sanitize_comm(kwargs.pop("comm", None))
+    with open(manifest_path, "r") as handle:
+        manifest = json.load(handle)
+    gshape, axis = tuple(manifest["shape"]), manifest["axis"]
+    split = sanitize_axis(gshape, kwargs.pop("split", manifest["split"]))
+    dtype = types.canonical_heat_type(kwargs.pop("dtype", getattr(types, manifest["dtype"])))
+
+    # every process reads the files independently
+    self_comm = MPICommunication(MPI.COMM_SELF)
+    directory = os.path.dirname(manifest_path)
+    _, local_shape, slices = comm.chunk(gshape, axis)
+    begin, end = slices[axis].start, slices[axis].stop
+    parts = []
+    for shard_path, start, rows in manifest["shards"]:
+        if start >= end or start + rows <= begin:
+            continue
+        data = read(
+            os.path.join(directory, shard_path),
+            *args,
+            dtype=dtype,
+            device=device,
+            comm=self_comm,
+            **kwargs
+        )
+        part = [slice(None)] * len(gshape)
+        part[axis] = slice(max(start, begin) - start, min(start + rows, end) - start)
+        parts.append(data._DNDarray__array[tuple(part)])
+
+    if parts:
+        data = torch.cat(parts, dim=axis)
+    else:
+        data = torch.empty(local_shape, dtype=dtype.torch_type(), device=device.torch_device)
+
+    result = dndarray.DNDarray(data, gshape, dtype, axis, device, comm)
+    if split != axis:
+        result.resplit_(split)
+
+    return result
+
+
+def iter_chunks(
+    path,
+    dataset=None,
+    chunk_rows=1024,
+    dtype=types.float32,
+    split=0,
+    device=None,
+    comm=None,
+    read_ahead=True,
+    header_lines=0,
+    sep=",",
+    encoding="UTF-8",
+):
+    """
+    Iterates over the data of a file in chunks of rows, i.e. along the first axis, without loading the entire data.
+    Supports the same file formats as load. While a chunk is processed, the next one is read in the background.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file to be read.
+    dataset : str, optional
+        Name of the dataset (HDF5) or variable (NetCDF4) to be read, ignored for other file formats.
+    chunk_rows : int, optional
+        The number of rows of each chunk, the last chunk may be shorter; default: 1024.
+    dtype : ht.dtype, optional
+        Data type of the resulting arrays; default: ht.float32.
+    split : None or 0, optional
+        The axis along which the chunks are distributed among the processing cores; default: 0.
+    device : None or str, optional
+        The device id on which to place the data, defaults to globally set default device.
+    comm : Communication, optional
+        The communication to use for the data distribution. defaults to MPI_COMM_WORLD.
+    read_ahead : bool, optional
+        Whether to read the next chunk on a background thread while the current one is processed; default: True.
+        NetCDF files are always read synchronously, as the netCDF4 library is not thread-safe.
+    header_lines : int, optional
+        CSV only, the number of lines at the beginning of the file that are not considered as data, see load_csv.
+    sep : str, optional
+        CSV only, the single char or string that separates the values in each row.
+    encoding : str, optional
+        CSV only, the encoding of the file.
+
+    Returns
+    -------
+    chunks : generator of ht.DNDarray
+        The successive chunks of rows of the data.
+
+    Raises
+    -------
+    TypeError
+        If any of the input parameters are not of correct type
+    ValueError
+        If the file extension is not understood or known, or the split axis or chunk size are not supported.
+
+    Examples
+    --------
+    >>> estimator = ht.naive_bayes.GaussianNB()
+    >>> for chunk in ht.io.iter_chunks('data.h5', 'DATA', chunk_rows=10000):
+    ...     estimator.partial_fit(chunk[:, :-1], chunk[:, -1], classes=ht.arange(3))
+    """
+    if not isinstance(path, str):
+        raise TypeError("path must be str, not {}".format(type(path)))
+    if not isinstance(chunk_rows, int):
+        raise TypeError("chunk_rows must be int, not {}".format(type(chunk_rows)))
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be positive, but is {}".format(chunk_rows))
+    if split not in [None, 0]:
+        raise ValueError("split must be in [None, 0], but is {}".format(split))
+
+    dtype = types.canonical_heat_type(dtype)
+    device = devices.sanitize_device(device)
+    comm = sanitize_comm(comm)
+    extension = os.path.splitext(path)[-1].strip().lower()
+
+    if extension in __CSV_EXTENSION:
+        if not isinstance(sep, str):
+            raise TypeError("separator must be str, not {}".format(type(sep)))
+        if not isinstance(header_lines, int):
+            raise TypeError("header_lines must int, not {}".format(type(header_lines)))
+        gshape, read = __csv_chunk_reader(
+            path, chunk_rows, header_lines, sep, encoding, split, comm
+        )
+    elif extension in __NPY_EXTENSION:
+        gshape, read = __npy_chunk_reader(path, split, comm)
+    elif supports_hdf5() and extension in __HDF5_EXTENSIONS:
+        if not isinstance(dataset, str):
+            raise TypeError("dataset must be str, not {}".format(type(dataset)))
+        gshape, read = __hdf5_chunk_reader(path, dataset, split, comm)
+    elif supports_netcdf() and extension in __NETCDF_EXTENSIONS:
+        if not isinstance(dataset, str):
+            raise TypeError("dataset must be str, not {}".format(type(dataset)))
+        gshape, read = __netcdf_chunk_reader(path, dataset, split, comm)
+        # netCDF4 must not be called from multiple threads
+        read_ahead = False
+    else:
+        raise ValueError("Unsupported file extension {}".format(extension))
+
+    return __iter_chunks(gshape, read, chunk_rows, dtype, split, device, comm, read_ahead)
+
+
+def __iter_chunks(gshape, read, chunk_rows, dtype, split, device, comm, read_ahead):
+    """
+    Generates the chunks of rows of iter_chunks. The reading function only performs process-local I/O, hence it may be
+    run on a background thread while the main thread communicates.
+
+    Parameters
+    ----------
+    gshape : tuple of ints
+        The global shape of the data in the file.
+    read : callable
+        read(begin, end) returns the process-local part of the rows begin to end as np.ndarray.
+    chunk_rows : int
+        The number of rows of each chunk.
+    dtype : ht.dtype
+        Data type of the resulting arrays.
+    split : None or 0
+        The axis along which the chunks are distributed among the processing cores.
+    device : ht.Device
+        The device on which to place the data.
+    comm : Communication
+        The communication to use for the data distribution.
+    read_ahead : bool
+        Whether to read the next chunk on a background thread.
+
+    Yields
+    ------
+    chunk : ht.DNDarray
+        The successive chunks of rows of the data.
+    """
+    windows = [
+        (begin, min(begin + chunk_rows, gshape[0])) for begin in range(0, gshape[0], chunk_rows)
+    ]
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1) if read_ahead else None
+    pending = None
+
+    try:
+        for index, (begin, end) in enumerate(windows):
+            local = pending.result() if pending is not None else read(begin, end)
+            if executor is not None and index + 1 < len(windows):
+                pending = executor.submit(read, *windows[index + 1])
+
+            if not local.dtype.isnative:
+                local = local.astype(local.dtype.newbyteorder("="))
+            data = torch.from_numpy(local).type(dtype.torch_type()).to(device.torch_device)
+            chunk = dndarray.DNDarray(
+                data, (end - begin,) + tuple(gshape[1:]), dtype, split, device, comm
+            )
+            # the rows of a process may not be known before reading, e.g. for CSV files
+            if split is not None and comm.allreduce(
+                data.shape[0] != chunk.comm.chunk(chunk.gshape, split)[1][0], MPI.LOR
+            ):
+                chunk.balance_()
+
+            yield chunk
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def __local_rows(begin, end, split, comm):
+    """
+    Determines the rows a process reads out of the rows begin to end.
+
+    Parameters
+    ----------
+    begin : int
+        The first row.
+    end : int
+        The row after the last one.
+    split : None or 0
+        The axis along which the rows are distributed among the processing cores.
+    comm : Communication
+        The communication used for the data distribution.
+
+    Returns
+    -------
+    start, stop : int
+        The first row and the row after the last one of the process.
+    """
+    if split is None:
+        return begin, end
+    _, _, slices = comm.chunk((end - begin,), 0)
+
+    return begin + slices[0].start, begin + slices[0].stop
+
+
+def __npy_chunk_reader(path, split, comm):
+    """
+    Prepares reading successive rows of a NumPy .npy file, see iter_chunks.
+    """
+    gshape, file_dtype, offset = __npy_header(path)
+    if len(gshape) == 0:
+        raise ValueError("data in {} has no rows to iterate over".format(path))
+    mapped = None
+    if np.prod(gshape) > 0:
+        mapped = np.memmap(path, dtype=file_dtype, mode="r", offset=offset, shape=gshape)
+
+    def read(begin, end):
+        start, stop = __local_rows(begin, end, split, comm)
+        if stop == start:
+            return np.empty((0,) + gshape[1:], dtype=file_dtype)
+        return np.array(mapped[start:stop])
+
+    return gshape, read
+
+
+def __csv_chunk_reader(path, chunk_rows, header_lines, sep, encoding, split, comm):
+    """
+    Prepares reading successive rows of a CSV file, see iter_chunks. The file is scanned once in parallel for the
+    positions of the lines starting a chunk, the lines in between are distributed by bytes among the processes.
+    """
+    file_size = os.stat(path).st_size
+    block = 1 << 24
+
+    # find the lines starting in the share of bytes of the process, reading blocks of bounded size
+    counts, displs, _ = comm.counts_displs_shape((file_size, 1), 0)
+    offset, count = int(displs[comm.rank]), int(counts[comm.rank])
+    with open(path, "rb") as f:
+        line_starts = [np.empty((0,), dtype=np.int64)]
+        empty = [np.empty((0,), dtype=bool)]
+        for position in range(offset, offset + count, block):
+            starts, empty_lines = __csv_line_starts(
+                f, position, min(block, offset + count - position), return_empty=True
+            )
+            line_starts.append(starts)
+            empty.append(empty_lines)
+    line_starts = np.concatenate(line_starts)
+    empty = np.concatenate(empty)
+
+    # like in load_csv, the header lines are skipped first and the empty lines among the rest afterwards
+    preceding_lines = comm.exscan(line_starts.size)
+    preceding_lines = preceding_lines if preceding_lines is not None else 0
+    data_lines = np.arange(line_starts.size) + preceding_lines >= header_lines
+    line_starts = line_starts[~empty & data_lines]
+
+    # the data rows preceding each line determine which lines start a chunk
+    preceding_rows = comm.exscan(line_starts.size)
+    preceding_rows = preceding_rows if preceding_rows is not None else 0
+    rows = np.arange(line_starts.size) + preceding_rows
+    first_lines = rows % chunk_rows == 0
+    chunk_starts = {}
+    first_lines = list(zip(rows[first_lines] // chunk_rows, line_starts[first_lines]))
+    for starts in comm.allgather(first_lines):
+        chunk_starts.update(starts)
+    chunk_starts = [int(chunk_starts[index]) for index in range(len(chunk_starts))] + [file_size]
+    gshape = (comm.allreduce(line_starts.size, MPI.SUM),)
+
+    # the columns are determined by the first data line
+    columns = 0
+    if rows.size > 0 and rows[0] <= 0 <= rows[-1]:
+        with open(path, "rb") as f:
+            f.seek(chunk_starts[0], 0)
+            line = b""
+            while not line.count(b"\n") and not line.count(b"\r"):
+                data = f.read(block)
+                line += data
+                if not data:
+                    break
+        columns = line.splitlines()[0].count(sep.encode(encoding)) + 1
+    gshape += (comm.allreduce(columns, MPI.MAX),)
+
+    def read(begin, end):
+        chunk_begin = chunk_starts[begin // chunk_rows]
+        chunk_end = chunk_starts[begin // chunk_rows + 1]
+        start, stop = __local_rows(chunk_begin, chunk_end, split, comm)
+
+        with open(path, "rb") as f:
+            starts = __csv_line_starts(f, start, stop - start)
+            if starts.size == 0:
+                return np.empty((0, gshape[1]))
+
+            # the last line of the process ends at the first line starting after its share
+            line_end = chunk_end
+            for position in range(stop, chunk_end, block):
+                following = __csv_line_starts(f, position, min(block, chunk_end - position))
+                if following.size > 0:
+                    line_end = int(following[0])
+                    break
+
+            f.seek(int(starts[0]), 0)
+            lines = [line for line in f.read(line_end - int(starts[0])).splitlines() if line]
+
+        return __csv_values(path, lines, gshape[1], sep, encoding)
+
+    return gshape, read
+
 
 def load_csv(
     path,
@@ -476,7 +1079,8 @@ def load_csv(
         default: 'UTF-8'
     split : None, 0, 1 : optional
         Along which axis the resulting tensor should be split.
-        Default is None which means each node will have the full tensor.
+        Default is None which means each node will have the full tensor. The file is read in parallel in any case,
+        each process parses its share of the bytes, and the data is redistributed afterwards.
     device : None or str, optional
         The device id on which to place the data, defaults to globally set default device.
     comm : Communication, optional
@@ -491,6 +1095,8 @@ def load_csv(
     -------
     TypeError
         If any of the input parameters are not of correct type
+    ValueError
+        If the lines of the file do not all have the same number of numeric values, raised on all processes.
 
     Examples
     --------
@@ -537,134 +1143,758 @@ def load_csv(
     rank = comm.rank
     size = comm.size
 
-    if split is None:
-        with open(path) as f:
-            data = f.readlines()
-            data = data[header_lines:]
-            result = []
-            for i, line in enumerate(data):
-                values = line.replace("\n", "").replace("\r", "").split(sep)
-                values = [float(val) for val in values]
-                result.append(values)
-            resulting_tensor = factories.array(
-                result, dtype=dtype, split=split, device=device, comm=comm
-            )
+    # every process reads its share of the bytes once, its lines are the ones starting in it
+    counts, displs, _ = comm.counts_displs_shape((file_size, 1), 0)
+    offset, count = int(displs[rank]), int(counts[rank])
+    with open(path, "rb") as f:
+        line_starts = __csv_line_starts(f, offset, count)
+
+        # the last line of a process ends where the next process with data starts
+        first_starts = comm.allgather(int(line_starts[0]) if line_starts.size > 0 else None)
+        end = next((start for start in first_starts[rank + 1 :] if start is not None), file_size)
+
+        # skip the header lines, which may span multiple processes
+        preceding_lines = comm.exscan(line_starts.size)
+        preceding_lines = preceding_lines if preceding_lines is not None else 0
+        line_starts = line_starts[min(max(header_lines - preceding_lines, 0), line_starts.size) :]
+
+        lines = []
+        if line_starts.size > 0:
+            f.seek(int(line_starts[0]), 0)
+            # in case there are some empty lines in the csv file
+            lines = [line for line in f.read(end - int(line_starts[0])).splitlines() if line]
+
+    # parse all values of the process at once
+    columns = lines[0].count(sep.encode(encoding)) + 1 if lines else 0
+    columns = comm.allreduce(columns, MPI.MAX)
+    error = None
+    try:
+        values = __csv_values(path, lines, columns, sep, encoding)
+    except ValueError as e:
+        error = e
+    # all processes raise, a single one raising would leave the others waiting in the redistribution
+    if comm.allreduce(error is not None, MPI.LOR):
+        if error is not None:
+            raise error
+        raise ValueError("lines of {} could not be parsed on another process".format(path))
+    local_tensor = torch.from_numpy(values).type(dtype.torch_type())
+
+    resulting_tensor = factories.array(
+        local_tensor, dtype=dtype, is_split=0, device=device, comm=comm
+    )
+    resulting_tensor.balance_()
+    # distribute the data read in parallel instead of reading the file on every process
+    if split != 0:
+        resulting_tensor.resplit_(split)
 
-    elif split == 0:
-        counts, displs, _ = comm.counts_displs_shape((file_size, 1), 0)
-        # in case lines are terminated with '\r\n' we need to skip 2 bytes later
-        lineter_len = 1
-        # Read a chunk of bytes and count the linebreaks
-        with open(path, "rb") as f:
-            f.seek(displs[rank], 0)
-            line_starts = []
-            r = f.read(counts[rank])
-            for pos, l in enumerate(r):
-                if chr(l) == "\n":
-                    # Check if it is part of '\r\n'
-                    if not chr(r[pos - 1]) == "\r":
-                        line_starts.append(pos + 1)
-                elif chr(l) == "\r":
-                    # check if file line is terminated by '\r\n'
-                    if pos + 1 < len(r) and chr(r[pos + 1]) == "\n":
-                        line_starts.append(pos + 2)
-                        lineter_len = 2
-                    else:
-                        line_starts.append(pos + 1)
-
-            if rank == 0:
-                line_starts = [0] + line_starts
-
-            # Find the correct starting point
-            total_lines = torch.empty(size, dtype=torch.int32)
-            comm.Allgather(torch.tensor([len(line_starts)], dtype=torch.int32), total_lines)
-
-            cumsum = total_lines.cumsum(dim=0).tolist()
-            start = next(i for i in range(size) if cumsum[i] > header_lines)
-            if rank < start:
-                line_starts = []
-            if rank == start:
-                rem = header_lines - (0 if start == 0 else cumsum[start - 1])
-                line_starts = line_starts[rem:]
-
-            # Determine the number of columns that each line consists of
-            if len(line_starts) > 1:
-                columns = 1
-                for l in r[line_starts[0] : line_starts[1]]:
-                    if chr(l) == sep:
-                        columns += 1
-            else:
-                columns = 0
-
-            columns = torch.tensor([columns], dtype=torch.int32)
-            comm.Allreduce(MPI.IN_PLACE, columns, MPI.MAX)
-
-            # Share how far the processes need to reed in their last line
-            last_line = file_size
-            if size - start > 1:
-                if rank == start:
-                    last_line = torch.empty(1, dtype=torch.int32)
-                    comm.Recv(last_line, source=rank + 1)
-                    last_line = last_line.item()
-                elif rank == size - 1:
-                    first_line = torch.tensor(displs[rank] + line_starts[0] - 1, dtype=torch.int32)
-                    comm.Send(first_line, dest=rank - 1)
-                elif start < rank < size - 1:
-                    last_line = torch.empty(1, dtype=torch.int32)
-                    first_line = torch.tensor(displs[rank] + line_starts[0] - 1, dtype=torch.int32)
-                    comm.Send(first_line, dest=rank - 1)
-                    comm.Recv(last_line, source=rank + 1)
-                    last_line = last_line.item()
-
-            # Create empty tensor and iteratively fill it with the values
-            local_shape = (len(line_starts), columns)
-            actual_length = 0
-            local_tensor = torch.empty(local_shape, dtype=dtype.torch_type())
-            for ind, start in enumerate(line_starts):
-                if ind == len(line_starts) - 1:
-                    f.seek(displs[rank] + start, 0)
-                    line = f.read(last_line - displs[rank] - start)
-                else:
-                    line = r[start : line_starts[ind + 1] - lineter_len]
-                # Decode byte array
-                line = line.decode(encoding)
-                if len(line) > 0:
-                    sep_values = [float(val) for val in line.split(sep)]
-                    local_tensor[actual_length] = torch.tensor(sep_values, dtype=dtype.torch_type())
-                    actual_length += 1
-
-        # In case there are some empty lines in the csv file
-        local_tensor = local_tensor[:actual_length]
-
-        resulting_tensor = factories.array(
-            local_tensor, dtype=dtype, is_split=0, device=device, comm=comm
+    return resulting_tensor
+
+
+def __csv_line_starts(f, offset, count, return_empty=False):
+    """
+    Finds the positions of the lines starting within a range of bytes of a CSV file. Lines are terminated by '\n',
+    '\r\n' or '\r'.
+
+    Parameters
+    ----------
+    f : file
+        The CSV file opened in binary mode
+    offset : int
+        The position of the first byte of the range
+    count : int
+        The number of bytes of the range
+    return_empty : bool, optional
+        Whether to return which of the lines are empty as well, default: False
+
+    Returns
+    -------
+    line_starts : np.ndarray
+        The positions of the lines starting in the range in ascending order
+    empty : np.ndarray, optional
+        Boolean mask of the empty lines, only returned if return_empty is True
+    """
+    # a line starts after a line break, hence the previous byte is read as well as the next one to detect '\r\n'
+    begin = max(offset - 1, 0)
+    f.seek(begin, 0)
+    buffer = np.frombuffer(f.read(offset + count + 1 - begin), dtype=np.uint8)
+
+    line_feeds = buffer == ord("\n")
+    line_breaks = buffer == ord("\r")
+    line_breaks[:-1] &= ~line_feeds[1:]
+    line_breaks |= line_feeds
+
+    line_starts = np.flatnonzero(line_breaks) + begin + 1
+    line_starts = line_starts[(line_starts >= offset) & (line_starts < offset + count)]
+    if offset == 0 and count > 0:
+        line_starts = np.concatenate(([0], line_starts))
+    if return_empty:
+        return line_starts, (line_feeds | (buffer == ord("\r")))[line_starts - begin]
+
+    return line_starts
+
+
+def __csv_values(path, lines, columns, sep, encoding):
+    """
+    Parses the values of lines of a CSV file at once.
+
+    Parameters
+    ----------
+    path : str
+        Path to the CSV file the lines are read from
+    lines : list of bytes
+        The non-empty lines to be parsed
+    columns : int
+        The number of values in each line
+    sep : str
+        The single char or string that separates the values in each row
+    encoding : str
+        The encoding of the lines
+
+    Returns
+    -------
+    values : np.ndarray
+        The values with one row per line
+
+    Raises
+    -------
+    ValueError
+        If a line does not have the given number of values.
+    """
+    if not lines:
+        return np.empty((0, columns))
+
+    try:
+        values = np.array(sep.encode(encoding).join(lines).decode(encoding).split(sep), dtype=float)
+    except ValueError:
+        raise ValueError("lines of {} must only contain numeric values".format(path))
+    if values.size != len(lines) * columns:
+        raise ValueError("lines of {} must all have {} values".format(path, columns))
+
+    return values.reshape(-1, columns)
+
+
+def load_npy(path, dtype=None, split=None, device=None, comm=None):
+    """
+    Loads data from a NumPy .npy file. The file is memory-mapped, i.e. each process only reads the chunk of the data
+    it is assigned to, the data may be distributed among multiple processing nodes via the split flag.
+
+    Parameters
+    ----------
+    path : str
+        Path to the .npy file to be read.
+    dtype : ht.dtype, optional
+        Data type of the resulting array; default: the data type stored in the file.
+    split : int, optional
+        The axis along which the data is distributed among the processing cores.
+    device : None or str, optional
+        The device id on which to place the data, defaults to globally set default device.
+    comm : Communication, optional
+        The communication to use for the data distribution. defaults to MPI_COMM_WORLD.
+
+    Returns
+    -------
+    out : ht.DNDarray
+        Data read from the .npy file.
+
+    Raises
+    -------
+    TypeError
+        If any of the input parameters are not of correct type
+    ValueError
+        If the data is stored in Fortran order.
+
+    Examples
+    --------
+    >>> a = ht.load_npy('data.npy', split=0)
+    >>> a.shape
+    [0/1] (5,)
+    [1/1] (5,)
+    >>> a.lshape
+    [0/1] (3,)
+    [1/1] (2,)
+    """
+    if not isinstance(path, str):
+        raise TypeError("path must be str, not {}".format(type(path)))
+    if split is not None and not isinstance(split, int):
+        raise TypeError("split must be None or int, not {}".format(type(split)))
+
+    gshape, file_dtype, offset = __npy_header(path)
+
+    return __load_mapped(path, gshape, file_dtype, offset, dtype, split, device, comm)
+
+
+def __npy_header(path):
+    """
+    Reads the header of a NumPy .npy file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the .npy file to be read.
+
+    Returns
+    -------
+    gshape : tuple of ints
+        The shape of the data stored in the file.
+    file_dtype : np.dtype
+        The data type of the data stored in the file.
+    offset : int
+        The number of bytes preceding the data in the file.
+
+    Raises
+    -------
+    ValueError
+        If the data is stored in Fortran order.
+    """
+    with open(path, "rb") as handle:
+        version = np.lib.format.read_magic(handle)
+        if version == (1, 0):
+            gshape, fortran_order, file_dtype = np.lib.format.read_array_header_1_0(handle)
+        else:
+            gshape, fortran_order, file_dtype = np.lib.format.read_array_header_2_0(handle)
+        offset = handle.tell()
+    if fortran_order:
+        raise ValueError("data in {} is stored in Fortran order, expected C order".format(path))
+
+    return gshape, file_dtype, offset
+
+
+def load_raw(path, shape, dtype=types.float32, offset=0, split=None, device=None, comm=None):
+    """
+    Loads data from a raw binary file without a header, e.g. written by save_raw or numpy.ndarray.tofile. The file is
+    memory-mapped, i.e. each process only reads the chunk of the data it is assigned to, the data may be distributed
+    among multiple processing nodes via the split flag.
+
+    Parameters
+    ----------
+    path : str
+        Path to the raw binary file to be read.
+    shape : tuple of ints
+        The global shape of the data stored in C order in the file.
+    dtype : ht.dtype, optional
+        Data type of the data stored in the file; default: ht.float32.
+    offset : int, optional
+        The number of bytes preceding the data in the file; default: 0.
+    split : int, optional
+        The axis along which the data is distributed among the processing cores.
+    device : None or str, optional
+        The device id on which to place the data, defaults to globally set default device.
+    comm : Communication, optional
+        The communication to use for the data distribution. defaults to MPI_COMM_WORLD.
+
+    Returns
+    -------
+    out : ht.DNDarray
+        Data read from the raw binary file.
+
+    Raises
+    -------
+    TypeError
+        If any of the input parameters are not of correct type
+
+    Examples
+    --------
+    >>> a = ht.load_raw('data.bin', (5,), dtype=ht.int32, split=0)
+    >>> a.lshape
+    [0/1] (3,)
+    [1/1] (2,)
+    """
+    if not isinstance(path, str):
+        raise TypeError("path must be str, not {}".format(type(path)))
+    if not isinstance(shape, (tuple, list)) or not all(isinstance(dim, int) for dim in shape):
+        raise TypeError("shape must be a tuple of ints, not {}".format(shape))
+    if not isinstance(offset, int):
+        raise TypeError("offset must be int, not {}".format(type(offset)))
+    if split is not None and not isinstance(split, int):
+        raise TypeError("split must be None or int, not {}".format(type(split)))
+
+    dtype = types.canonical_heat_type(dtype)
+    file_dtype = torch.empty(0, dtype=dtype.torch_type()).numpy().dtype
+
+    return __load_mapped(path, tuple(shape), file_dtype, offset, dtype, split, device, comm)
+
+
+def __load_mapped(path, gshape, file_dtype, offset, dtype, split, device, comm):
+    """
+    Memory-maps the chunk of C ordered binary data a process is assigned to and wraps it in a DNDarray.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file to be read.
+    gshape : tuple of ints
+        The global shape of the data stored in the file.
+    file_dtype : np.dtype
+        The data type of the data stored in the file.
+    offset : int
+        The number of bytes preceding the data in the file.
+    dtype : ht.dtype or None
+        Data type of the resulting array, None to keep the data type stored in the file.
+    split : int or None
+        The axis along which the data is distributed among the processing cores.
+    device : None or str
+        The device id on which to place the data.
+    comm : Communication or None
+        The communication to use for the data distribution.
+
+    Returns
+    -------
+    out : ht.DNDarray
+        Data read from the file.
+    """
+    device = devices.sanitize_device(device)
+    comm = sanitize_comm(comm)
+    split = sanitize_axis(gshape, split)
+    _, local_shape, indices = comm.chunk(gshape, split)
+
+    # chunks along the first axis are contiguous in the file, only the bytes of the chunk are mapped, otherwise the
+    # pages outside of the chunk are mapped but never read
+    if split == 0:
+        offset += indices[0].start * file_dtype.itemsize * int(np.prod(gshape[1:]))
+        map_shape, indices = local_shape, ()
+    else:
+        map_shape = gshape
+
+    # copy-on-write mapping, no data is read or copied until it is accessed
+    if np.prod(local_shape) > 0:
+        local = np.memmap(path, dtype=file_dtype, mode="c", offset=offset, shape=map_shape)[indices]
+    else:
+        local = np.empty(local_shape, dtype=file_dtype)
+    if not file_dtype.isnative:
+        local = local.astype(file_dtype.newbyteorder("="))
+
+    data = torch.from_numpy(local)
+    if dtype is None:
+        dtype = types.canonical_heat_type(data.dtype)
+    data = data.type(dtype.torch_type()).to(device.torch_device)
+
+    return dndarray.DNDarray(data, gshape, dtype, split, device, comm)
+
+
+def save_npy(data, path):
+    """
+    Saves data to a NumPy .npy file. All processes write their chunk of the data at once with collective MPI I/O.
+
+    Parameters
+    ----------
+    data : ht.DNDarray
+        The data to be saved on disk.
+    path : str
+        Path to the .npy file to be written.
+
+    Raises
+    -------
+    TypeError
+        If any of the input parameters are not of correct type.
+
+    Examples
+    --------
+    >>> a_range = ht.arange(100, split=0)
+    >>> ht.save_npy(a_range, 'data.npy')
+    """
+    if not isinstance(data, dndarray.DNDarray):
+        raise TypeError("data must be heat tensor, not {}".format(type(data)))
+    if not isinstance(path, str):
+        raise TypeError("path must be str, not {}".format(type(path)))
+
+    # the header is deterministic, every process knows where the data starts without communication
+    file_dtype = torch.empty(0, dtype=data.dtype.torch_type()).numpy().dtype
+    header = io.BytesIO()
+    np.lib.format.write_array_header_1_0(
+        header,
+        {
+            "descr": np.lib.format.dtype_to_descr(file_dtype),
+            "fortran_order": False,
+            "shape": data.gshape,
+        },
+    )
+
+    __save_mapped(data, path, header.getvalue())
+
+
+def save_raw(data, path):
+    """
+    Saves data to a raw binary file in C order without a header. All processes write their chunk of the data at once
+    with collective MPI I/O. The shape and data type have to be passed to load_raw to read the data again.
+
+    Parameters
+    ----------
+    data : ht.DNDarray
+        The data to be saved on disk.
+    path : str
+        Path to the raw binary file to be written.
+
+    Raises
+    -------
+    TypeError
+        If any of the input parameters are not of correct type.
+
+    Examples
+    --------
+    >>> a_range = ht.arange(100, split=0)
+    >>> ht.save_raw(a_range, 'data.bin')
+    >>> ht.load_raw('data.bin', (100,), dtype=ht.int32, split=0)
+    """
+    if not isinstance(data, dndarray.DNDarray):
+        raise TypeError("data must be heat tensor, not {}".format(type(data)))
+    if not isinstance(path, str):
+        raise TypeError("path must be str, not {}".format(type(path)))
+
+    __save_mapped(data, path, b"")
+
+
+def __save_mapped(data, path, header):
+    """
+    Writes a header and the data in C order to a binary file. The chunk of each process is described by a subarray
+    file view and written with a single collective call.
+
+    Parameters
+    ----------
+    data : ht.DNDarray
+        The data to be saved on disk.
+    path : str
+        Path to the file to be written.
+    header : bytes
+        The bytes preceding the data in the file, written by the first process.
+    """
+    comm = data.comm
+    local = data._DNDarray__array.cpu().contiguous().numpy()
+
+    # determine the chunk of the global data this process writes, local data is written in parallel chunks
+    if data.split is not None:
+        offsets = [0] * data.numdims
+        offsets[data.split] = comm.exscan(local.shape[data.split])
+        offsets[data.split] = offsets[data.split] if offsets[data.split] is not None else 0
+    elif data.numdims > 0:
+        offsets, _, slices = comm.chunk(data.gshape, 0)
+        offsets = [offsets] + [0] * (data.numdims - 1)
+        local = local[slices]
+    else:
+        offsets = []
+        local = local if comm.rank == 0 else local.reshape(-1)[:0]
+
+    handle = MPI.File.Open(comm.handle, path, MPI.MODE_WRONLY | MPI.MODE_CREATE)
+    filetype = None
+    try:
+        # drop stale content of an existing file
+        handle.Set_size(len(header) + data.gnumel * local.itemsize)
+        if comm.rank == 0 and header:
+            handle.Write_at(0, header)
+
+        if local.size > 0:
+            filetype = MPI.BYTE.Create_subarray(
+                list(data.gshape) + [local.itemsize],
+                list(local.shape) + [local.itemsize],
+                list(offsets) + [0],
+            ).Commit()
+            handle.Set_view(len(header), MPI.BYTE, filetype)
+        else:
+            handle.Set_view(len(header), MPI.BYTE, MPI.BYTE)
+        handle.Write_all([local.reshape(-1).view(np.uint8), MPI.BYTE])
+    finally:
+        handle.Close()
+        if filetype is not None:
+            filetype.Free()
+
+
+def load_compressed(path, dtype=None, split=None, device=None, comm=None):
+    """
+    Loads data from a compressed file written by save_compressed. Every process decompresses only the chunks
+    overlapping with its part of the data, the data may be distributed among multiple processing nodes via the split
+    flag.
+
+    Parameters
+    ----------
+    path : str
+        Path to the compressed file to be read.
+    dtype : ht.dtype, optional
+        Data type of the resulting array; default: the data type stored in the file.
+    split : int, optional
+        The axis along which the data is distributed among the processing cores.
+    device : None or str, optional
+        The device id on which to place the data, defaults to globally set default device.
+    comm : Communication, optional
+        The communication to use for the data distribution. defaults to MPI_COMM_WORLD.
+
+    Returns
+    -------
+    out : ht.DNDarray
+        Data read from the compressed file.
+
+    Raises
+    -------
+    TypeError
+        If any of the input parameters are not of correct type
+    ValueError
+        If the file is not a compressed heat file or its compression is not supported.
+
+    Examples
+    --------
+    >>> ht.save_compressed(ht.zeros((1000, 10), split=0), 'data.htz')
+    >>> a = ht.load_compressed('data.htz', split=1)
+    >>> a.lshape
+    [0/1] (1000, 5)
+    [1/1] (1000, 5)
+    """
+    if not isinstance(path, str):
+        raise TypeError("path must be str, not {}".format(type(path)))
+    if split is not None and not isinstance(split, int):
+        raise TypeError("split must be None or int, not {}".format(type(split)))
+
+    device = devices.sanitize_device(device)
+    comm = sanitize_comm(comm)
+
+    with open(path, "rb") as handle:
+        if handle.read(len(__COMPRESSED_MAGIC)) != __COMPRESSED_MAGIC:
+            raise ValueError("{} is not a compressed heat file".format(path))
+        header_length = int(np.frombuffer(handle.read(8), dtype="<u8")[0])
+        header = json.loads(handle.read(header_length).decode("ascii"))
+        data_offset = handle.tell()
+
+        if header["codec"] not in __COMPRESSORS:
+            raise ValueError("compression {} is not supported".format(header["codec"]))
+        decompress = __COMPRESSORS[header["codec"]][1]
+        gshape = tuple(header["shape"])
+        file_dtype = np.dtype(header["descr"])
+        split = sanitize_axis(gshape, split)
+
+        # the chunks are decompressed distributed along the axis they were compressed along
+        axis = header["axis"]
+        rows_shape = gshape if gshape else (1,)
+        if gshape:
+            _, local_shape, slices = comm.chunk(gshape, axis)
+            begin, end = slices[axis].start, slices[axis].stop
+        else:
+            local_shape, begin, end = rows_shape, 0, 1
+        local = np.empty(local_shape, dtype=file_dtype)
+        for start, rows, offset, length in header["chunks"]:
+            if start >= end or start + rows <= begin:
+                continue
+            handle.seek(data_offset + offset, 0)
+            chunk_shape = rows_shape[:axis] + (rows,) + rows_shape[axis + 1 :]
+            chunk = np.frombuffer(decompress(handle.read(length)), dtype=file_dtype)
+            chunk = chunk.reshape(chunk_shape)
+
+            target = [slice(None)] * len(rows_shape)
+            source = [slice(None)] * len(rows_shape)
+            target[axis] = slice(max(start, begin) - begin, min(start + rows, end) - begin)
+            source[axis] = slice(max(start, begin) - start, min(start + rows, end) - start)
+            local[tuple(target)] = chunk[tuple(source)]
+
+    if not file_dtype.isnative:
+        local = local.astype(file_dtype.newbyteorder("="))
+    data = torch.from_numpy(local.reshape(local_shape if gshape else ()))
+    dtype = types.canonical_heat_type(data.dtype if dtype is None else dtype)
+    data = data.type(dtype.torch_type()).to(device.torch_device)
+
+    if not gshape:
+        return dndarray.DNDarray(data, gshape, dtype, None, device, comm)
+    result = dndarray.DNDarray(data, gshape, dtype, axis, device, comm)
+    if split != axis:
+        result.resplit_(split)
+
+    return result
+
+
+def save_compressed(data, path, codec="zlib", level=6, chunk_rows=None):
+    """
+    Saves data to a compressed file. The data is divided into chunks of rows along the split axis, every process
+    compresses the chunks of its own data, all compressed chunks are written at once with collective MPI I/O. The
+    file can be read with load_compressed with any number of processes.
+
+    Parameters
+    ----------
+    data : ht.DNDarray
+        The data to be saved on disk.
+    path : str
+        Path to the compressed file to be written.
+    codec : str, optional
+        The compression, 'zlib', or 'lz4' if the lz4 package is installed; default: 'zlib'.
+    level : int, optional
+        The compression level; default: 6.
+    chunk_rows : int, optional
+        The number of rows along the split axis (the first axis for non-split data) compressed together, i.e. the
+        granularity of partial reads. Default: None, as many rows as fit into 4 MiB.
+
+    Raises
+    -------
+    TypeError
+        If any of the input parameters are not of correct type.
+    ValueError
+        If the compression is not supported or the chunk size is not positive.
+
+    Examples
+    --------
+    >>> a_range = ht.arange(100, split=0)
+    >>> ht.save_compressed(a_range, 'data.htz', level=9)
+    """
+    if not isinstance(data, dndarray.DNDarray):
+        raise TypeError("data must be heat tensor, not {}".format(type(data)))
+    if not isinstance(path, str):
+        raise TypeError("path must be str, not {}".format(type(path)))
+    if codec not in __COMPRESSORS:
+        raise ValueError(
+            "codec must be one of {}, but is {}".format(sorted(__COMPRESSORS.keys()), codec)
         )
-        resulting_tensor.balance_()
-
-    elif split == 1:
-        data = []
-
-        with open(path) as f:
-            for i in range(header_lines):
-                f.readline()
-            line = f.readline()
-            values = line.replace("\n", "").replace("\r", "").split(sep)
-            values = [float(val) for val in values]
-            rows = len(values)
-
-            chunk, displs, _ = comm.counts_displs_shape((1, rows), 1)
-            data.append(values[displs[rank] : displs[rank] + chunk[rank]])
-            # Read file line by line till EOF reached
-            for line in iter(f.readline, ""):
-                values = line.replace("\n", "").replace("\r", "").split(sep)
-                values = [float(val) for val in values]
-                data.append(values[displs[rank] : displs[rank] + chunk[rank]])
-        resulting_tensor = factories.array(data, dtype=dtype, is_split=1, device=device, comm=comm)
+    if not isinstance(level, int):
+        raise TypeError("level must be int, not {}".format(type(level)))
+    if chunk_rows is not None and not isinstance(chunk_rows, int):
+        raise TypeError("chunk_rows must be None or int, not {}".format(type(chunk_rows)))
+    if chunk_rows is not None and chunk_rows < 1:
+        raise ValueError("chunk_rows must be positive, but is {}".format(chunk_rows))
+
+    comm = data.comm
+    compress = __COMPRESSORS[codec][0]
+    local = data._DNDarray__array.cpu().numpy()
+    rows_shape = data.gshape if data.gshape else (1,)
+    local = local.reshape(local.shape if data.gshape else (1,))
+
+    # determine the rows along the axis of the chunks this process compresses, local data is compressed in parallel
+    axis = data.split if data.split is not None else 0
+    if data.split is not None:
+        first = comm.exscan(local.shape[axis])
+        first = first if first is not None else 0
+    else:
+        first, _, slices = comm.chunk(rows_shape, axis)
+        local = local[slices]
+    if chunk_rows is None:
+        row_bytes = local.itemsize * int(np.prod(rows_shape[:axis] + rows_shape[axis + 1 :]))
+        chunk_rows = max((1 << 22) // max(row_bytes, 1), 1)
+
+    chunks, buffers = [], []
+    for start in range(0, local.shape[axis], chunk_rows):
+        rows = min(chunk_rows, local.shape[axis] - start)
+        block = np.ascontiguousarray(np.take(local, range(start, start + rows), axis=axis))
+        buffers.append(compress(block.tobytes(), level))
+        chunks.append([first + start, rows, 0, len(buffers[-1])])
+
+    # every process knows the header and where to write its chunks after exchanging the chunk sizes
+    all_chunks = [chunk for rank_chunks in comm.allgather(chunks) for chunk in rank_chunks]
+    offset = 0
+    for chunk in all_chunks:
+        chunk[2] = offset
+        offset += chunk[3]
+    header = json.dumps(
+        {
+            "shape": list(data.gshape),
+            "descr": np.lib.format.dtype_to_descr(local.dtype),
+            "axis": axis,
+            "codec": codec,
+            "chunks": all_chunks,
+        }
+    ).encode("ascii")
+    header = __COMPRESSED_MAGIC + np.array([len(header)], dtype="<u8").tobytes() + header
+    preceding = comm.exscan(len(chunks))
+    local_offset = all_chunks[preceding][2] if chunks and preceding is not None else 0
+
+    handle = MPI.File.Open(comm.handle, path, MPI.MODE_WRONLY | MPI.MODE_CREATE)
+    try:
+        # drop stale content of an existing file
+        handle.Set_size(len(header) + offset)
+        if comm.rank == 0:
+            handle.Write_at(0, header)
+        payload = np.frombuffer(b"".join(buffers), dtype=np.uint8)
+        handle.Write_at_all(len(header) + local_offset, [payload, MPI.BYTE])
+    finally:
+        handle.Close()
+
+
+def __write_aggregated(data, aggregators, write):
+    """
+    Writes split data with a number of aggregating processes in two phases. The processes are divided into as many
+    consecutive groups, the chunks of each group are gathered on its first process with a single collective call.
+    Afterwards, the aggregating processes write their slab one after another.
 
-    return resulting_tensor
+    Parameters
+    ----------
+    data : ht.DNDarray
+        The split data to be saved on disk.
+    aggregators : int
+        The number of aggregating processes, capped by the number of processes.
+    write : callable
+        Called by the aggregating processes in order as write(slab, slices, create) with the gathered slab as
+        np.ndarray, its slices with respect to the global shape and whether the file has to be created.
+    """
+    comm = data.comm
+    split = data.split
+    aggregators = min(aggregators, comm.size)
+    group = comm.rank * aggregators // comm.size
+    ranks = [-(-group_index * comm.size // aggregators) for group_index in range(aggregators)]
+
+    # the chunks are concatenated along the split axis, which is moved to the front to make them contiguous
+    local = data._DNDarray__array.cpu().transpose(0, split).contiguous().numpy()
+    offset = comm.exscan(local.shape[0])
+    offset = offset if offset is not None else 0
+
+    group_comm = comm.handle.Split(group, comm.rank)
+    try:
+        rows = np.array(group_comm.allgather(local.shape[0]))
+        slab, recvbuf = None, None
+        if group_comm.rank == 0:
+            row_bytes = local.itemsize * int(np.prod(local.shape[1:]))
+            slab = np.empty((rows.sum(),) + local.shape[1:], dtype=local.dtype)
+            displs = np.concatenate(([0], np.cumsum(rows[:-1])))
+            recvbuf = [
+                slab.reshape(-1).view(np.uint8),
+                rows * row_bytes,
+                displs * row_bytes,
+                MPI.BYTE,
+            ]
+        group_comm.Gatherv([local.reshape(-1).view(np.uint8), MPI.BYTE], recvbuf, root=0)
+    finally:
+        group_comm.Free()
+    if slab is None:
+        return
+
+    # pass a token among the aggregating processes, wrap around to the first to complete barrier behavior
+    position = ranks.index(comm.rank)
+    if position > 0:
+        comm.Recv([None, 0, MPI.INT], source=ranks[position - 1])
+
+    slices = [slice(None)] * data.numdims
+    slices[split] = slice(offset, offset + slab.shape[0])
+    write(np.swapaxes(slab, 0, split), tuple(slices), position == 0)
+
+    if aggregators > 1:
+        comm.Isend([None, 0, MPI.INT], dest=ranks[(position + 1) % aggregators])
+        if position == 0:
+            comm.Recv([None, 0, MPI.INT], source=ranks[-1])
+
+
+class SaveRequest:
+    """
+    Handle of an asynchronous save, see save.
 
+    Parameters
+    ----------
+    future : concurrent.futures.Future
+        The future of the write performed on the background I/O thread.
+    """
 
-def save(data, path, *args, **kwargs):
+    def __init__(self, future):
+        self.__future = future
+        self.__waited = False
+
+    def done(self):
+        """
+        Returns whether the data has been written.
+        """
+        return self.__future.done()
+
+    def wait(self):
+        """
+        Blocks until the data has been written.
+
+        Raises
+        -------
+        Exception
+            The exception raised while writing the data, if any.
+        """
+        self.__waited = True
+        self.__future.result()
+
+
+def save(data, path, *args, async_=False, max_pending=2, shard=False, **kwargs):
     """
     Attempts to save data from a tensor to disk. Attempts to auto-detect the file format by determining the extension.
 
@@ -676,6 +1906,22 @@ def save(data, path, *args, **kwargs):
         Path to the file to be stored.
     args/kwargs : list/dict
         additional options passed to the particular functions.
+    async_ : bool, optional
+        Returns immediately after taking a snapshot of the data, which is written on a background I/O thread. The
+        asynchronous saves are performed one after another in the order they were issued. Default: False.
+    max_pending : int, optional
+        The maximum number of asynchronous saves in flight, before issuing another one the oldest are waited for.
+        Errors of saves that were not waited for are raised then, or at interpreter exit. Default: 2.
+    shard : bool, optional
+        Saves the data of every process to a file of its own, without any communication between the processes except
+        for a small JSON manifest describing the files. The path contains '{rank}' or '*' in place of the number of the
+        process, the manifest is saved to the path with 'manifest' in place of the number and the extension '.json'.
+        Non-split data is divided along the first axis. See load for loading the files. Default: False.
+
+    Returns
+    -------
+    request : SaveRequest or None
+        Handle to wait for the completion of an asynchronous save, None otherwise.
 
     Raises
     -------
@@ -687,18 +1933,192 @@ def save(data, path, *args, **kwargs):
     >>> a_range = ht.arange(100, split=0)
     >>> ht.save(a_range, 'data.h5', 'DATA', mode='a')
     >>> ht.save(a_range, 'data.nc', 'DATA', mode='w')
+    >>> ht.save(a_range, 'data.npy')
+    >>> request = ht.save(a_range, 'checkpoint.npy', async_=True)
+    >>> a_range += 1
+    >>> request.wait()
+    >>> ht.save(a_range, 'data_{rank}.h5', 'DATA', shard=True)
     """
     if not isinstance(path, str):
         raise TypeError("Expected path to be str, but was {}".format(type(path)))
     extension = os.path.splitext(path)[-1].strip().lower()
 
-    if supports_hdf5() and extension in __HDF5_EXTENSIONS:
-        save_hdf5(data, path, *args, **kwargs)
+    if extension in __NPY_EXTENSION:
+        write = save_npy
+    elif extension in __COMPRESSED_EXTENSION:
+        write = save_compressed
+    elif supports_hdf5() and extension in __HDF5_EXTENSIONS:
+        write = save_hdf5
     elif supports_netcdf() and extension in __NETCDF_EXTENSIONS:
-        save_netcdf(data, path, *args, **kwargs)
+        write = save_netcdf
     else:
         raise ValueError("Unsupported file extension {}".format(extension))
 
+    if shard:
+        if not isinstance(data, dndarray.DNDarray):
+            raise TypeError("data must be heat tensor, not {}".format(type(data)))
+        if data.numdims == 0:
+            raise ValueError("sharded data must have at least one dimension")
+        __shard_template(path)
+        write = functools.partial(__save_sharded, write)
+
+    if not async_:
+        write(data, path, *args, **kwargs)
+        return None
+
+    if not isinstance(data, dndarray.DNDarray):
+        raise TypeError("data must be heat tensor, not {}".format(type(data)))
+    if not isinstance(max_pending, int) or max_pending < 1:
+        raise ValueError("max_pending must be a positive int, but is {}".format(max_pending))
+
+    return __save_async(write, data, path, args, kwargs, max_pending)
+
+
+def __save_sharded(write, data, path, *args, **kwargs):
+    """
+    Saves the data of every process to a file of its own and a manifest of the files.
+
+    Parameters
+    ----------
+    write : callable
+        The save function of the file format.
+    data : ht.DNDarray
+        The data to be saved on disk.
+    path : str
+        Path of the files, containing '{rank}' or '*' in place of the number of the process.
+    args/kwargs : list/dict
+        additional options passed to the save function.
+    """
+    template, manifest_path = __shard_template(path)
+    comm = data.comm
+
+    # non-split data is divided along the first axis
+    axis = data.split if data.split is not None else 0
+    local = data._DNDarray__array
+    if data.split is not None:
+        first = comm.exscan(local.shape[axis])
+        first = first if first is not None else 0
+    else:
+        first, _, slices = comm.chunk(data.gshape, axis)
+        local = local[slices]
+
+    shard_path = template.replace("{rank}", str(comm.rank))
+    shard = dndarray.DNDarray(
+        local, tuple(local.shape), data.dtype, None, data.device, MPICommunication(MPI.COMM_SELF)
+    )
+    write(shard, shard_path, *args, **kwargs)
+
+    # the manifest is written once all files are complete
+    shards = comm.allgather([os.path.basename(shard_path), first, local.shape[axis]])
+    if comm.rank == 0:
+        with open(manifest_path, "w") as handle:
+            json.dump(
+                {
+                    "shape": list(data.gshape),
+                    "split": data.split,
+                    "axis": axis,
+                    "dtype": data.dtype.__name__,
+                    "shards": shards,
+                },
+                handle,
+            )
+    comm.Barrier()
+
+
+# background I/O thread of the asynchronous saves and their requests in the order they were issued
+__SAVE_EXECUTOR = None
+__PENDING_SAVES = collections.deque()
+
+
+def __unreported_error(request):
+    """
+    Waits for an asynchronous save and returns the exception raised while writing the data, unless it has already been
+    raised to the caller by SaveRequest.wait.
+    """
+    error = request._SaveRequest__future.exception()
+
+    return None if request._SaveRequest__waited else error
+
+
+@atexit.register
+def __wait_saves():
+    """
+    Waits for the pending asynchronous saves at interpreter exit and raises the first error nobody waited for.
+    """
+    errors = [__unreported_error(request) for request in __PENDING_SAVES]
+    __PENDING_SAVES.clear()
+    for error in errors:
+        if error is not None:
+            raise error
+
+
+def __save_async(write, data, path, args, kwargs, max_pending):
+    """
+    Writes a snapshot of the data on the background I/O thread. The snapshot uses a duplicate of the communicator,
+    so that the collective operations of the write do not interfere with those issued meanwhile by the caller. Without
+    thread support of MPI, the data is written immediately and errors are raised by this call. Errors of earlier saves
+    nobody waited for are raised by the call waiting for them to make room for this save, or at interpreter exit.
+
+    Parameters
+    ----------
+    write : callable
+        The save function of the file format.
+    data : ht.DNDarray
+        The data to be saved on disk.
+    path : str
+        Path to the file to be stored.
+    args/kwargs : list/dict
+        additional options passed to the save function.
+    max_pending : int
+        The maximum number of asynchronous saves in flight.
+
+    Returns
+    -------
+    request : SaveRequest
+        Handle to wait for the completion of the save.
+    """
+    global __SAVE_EXECUTOR
+
+    # all processes issue the saves in the same order, hence wait for the same ones and agree on their errors
+    if len(__PENDING_SAVES) >= max_pending:
+        error = None
+        while len(__PENDING_SAVES) >= max_pending:
+            error = error or __unreported_error(__PENDING_SAVES.popleft())
+        if data.comm.allreduce(error is not None, MPI.LOR):
+            if error is not None:
+                raise error
+            raise IOError("an asynchronous save failed on another process")
+
+    snapshot_comm = MPICommunication(data.comm.handle.Dup())
+    snapshot = dndarray.DNDarray(
+        data._DNDarray__array.detach().to("cpu", copy=True),
+        data.gshape,
+        data.dtype,
+        data.split,
+        devices.cpu,
+        snapshot_comm,
+    )
+
+    def write_snapshot():
+        try:
+            write(snapshot, path, *args, **kwargs)
+        finally:
+            snapshot_comm.handle.Free()
+
+    if MPI.Query_thread() < MPI.THREAD_MULTIPLE:
+        # failures are raised right away, they would be lost if the caller never waits for the request
+        write_snapshot()
+        future = concurrent.futures.Future()
+        future.set_result(None)
+        return SaveRequest(future)
+
+    if __SAVE_EXECUTOR is None:
+        __SAVE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    request = SaveRequest(__SAVE_EXECUTOR.submit(write_snapshot))
+    __PENDING_SAVES.append(request)
+
+    return request
+
 
 # tensor is imported at the very end to break circular dependency
 from . import dndarray
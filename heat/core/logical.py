@@ -219,7 +219,7 @@ def isclose(x, y, rtol=1e-05, atol=1e-08, equal_nan=False):
     return result
 
 
-def logical_and(t1, t2):
+def logical_and(t1, t2, out=None):
     """
     Compute the truth value of t1 AND t2 element-wise.
 
@@ -227,6 +227,8 @@ def logical_and(t1, t2):
     -----------
     t1, t2: tensor
         input tensors of same shape
+    out : tensor, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns:
     --------
@@ -239,7 +241,10 @@ def logical_and(t1, t2):
     tensor([ False, False])
     """
     return operations.__binary_op(
-        torch.Tensor.__and__, types.bool(t1, device=t1.device), types.bool(t2, device=t2.device)
+        torch.Tensor.__and__,
+        types.bool(t1, device=t1.device),
+        types.bool(t2, device=t2.device),
+        out,
     )
 
 
@@ -268,7 +273,7 @@ def logical_not(t, out=None):
     return operations.__local_op(torch.logical_not, t, out)
 
 
-def logical_or(t1, t2):
+def logical_or(t1, t2, out=None):
     """
     Compute the truth value of t1 OR t2 element-wise.
 
@@ -276,6 +281,8 @@ def logical_or(t1, t2):
     -----------
     t1, t2: tensor
         input tensors of same shape
+    out : tensor, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns:
     --------
@@ -288,11 +295,14 @@ def logical_or(t1, t2):
     tensor([True, False])
     """
     return operations.__binary_op(
-        torch.Tensor.__or__, types.bool(t1, device=t1.device), types.bool(t2, device=t2.device)
+        torch.Tensor.__or__,
+        types.bool(t1, device=t1.device),
+        types.bool(t2, device=t2.device),
+        out,
     )
 
 
-def logical_xor(t1, t2):
+def logical_xor(t1, t2, out=None):
     """
     Computes the element-wise logical XOR of the given input tensors.
 
@@ -300,6 +310,8 @@ def logical_xor(t1, t2):
     -----------
     t1, t2: tensor
         input tensors of same shape
+    out : tensor, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns:
     --------
@@ -311,7 +323,7 @@ def logical_xor(t1, t2):
     >>> ht.logical_xor(ht.array([True, False, True]), ht.array([True, False, False]))
     tensor([ False, False,  True])
     """
-    return operations.__binary_op(torch.logical_xor, t1, t2)
+    return operations.__binary_op(torch.logical_xor, t1, t2, out)
 
 
 def __sanitize_close_input(x, y):
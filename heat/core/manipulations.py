@@ -1085,7 +1085,15 @@ def squeeze(x, axis=None):
     )
 
 
-def unique(a, sorted=False, return_inverse=False, axis=None):
+def unique(
+    a,
+    sorted=False,
+    return_inverse=False,
+    axis=None,
+    distributed_inverse=False,
+    partitioned=False,
+    return_counts=False,
+):
     """
     Finds and returns the unique elements of an array.
 
@@ -1106,13 +1114,30 @@ def unique(a, sorted=False, return_inverse=False, axis=None):
     axis : int, optional
         Axis along which unique elements should be found. Default to None, which will return a one dimensional list of
         unique values.
+    distributed_inverse : bool, optional
+        Whether the inverse indices are returned as DNDarray distributed along the split axis of a (or along 0 for
+        axis == a.split) instead of being replicated on all processes. Only applies if axis is None or a.split.
+        Default: False
+    partitioned : bool, optional
+        Whether the unique elements are assigned to owner processes by hashing their values and returned distributed
+        along axis 0, instead of being gathered on all processes. Memory and runtime then scale with the number of
+        distinct values divided by the number of processes. The unique elements are only sorted per process. Only
+        supported for axis=None and without inverse indices.
+        Default: False
+    return_counts : bool, optional
+        Whether to also return the number of occurrences of each unique element, distributed like the unique elements.
+        Only supported if partitioned is True.
+        Default: False
 
     Returns
     -------
     res : ht.DNDarray
         Output array. The unique elements. Elements are distributed the same way as the input tensor.
-    inverse_indices : torch.tensor (optional)
-        If return_inverse is True, this tensor will hold the list of inverse indices
+    inverse_indices : torch.tensor or ht.DNDarray (optional)
+        If return_inverse is True, this tensor will hold the list of inverse indices. If distributed_inverse is True,
+        it is a DNDarray holding the inverse indices of the process-local elements.
+    counts : ht.DNDarray (optional)
+        If return_counts is True, this tensor will hold the number of occurrences of each unique element
 
     Examples
     --------
@@ -1127,7 +1152,19 @@ def unique(a, sorted=False, return_inverse=False, axis=None):
     >>> ht.unique(x, sorted=True, axis=1)
     array([[2, 3],
            [3, 1]])
+
+    >>> ht.unique(x, sorted=True, partitioned=True, return_counts=True)
+    [array([1, 2, 3]), array([1, 1, 2])]
     """
+    if partitioned:
+        if axis is not None or return_inverse:
+            raise NotImplementedError(
+                "Partitioned unique is only supported for axis=None and without inverse indices"
+            )
+        return __partitioned_unique(a, sorted, return_counts)
+    if return_counts:
+        raise NotImplementedError("return_counts is only supported for partitioned unique")
+
     if a.split is None:
         torch_output = torch.unique(
             a._DNDarray__array, sorted=sorted, return_inverse=return_inverse, dim=axis
@@ -1160,8 +1197,8 @@ def unique(a, sorted=False, return_inverse=False, axis=None):
             res_shape = list(local_data.shape)
             res_shape[0] = 0
             inv_shape = [0]
-        lres = torch.empty(res_shape, dtype=a.dtype.torch_type())
-        inverse_pos = torch.empty(inv_shape, dtype=torch.int64)
+        lres = torch.empty(res_shape, dtype=a.dtype.torch_type(), device=local_data.device)
+        inverse_pos = torch.empty(inv_shape, dtype=torch.int64, device=local_data.device)
 
     else:
         lres, inverse_pos = torch.unique(
@@ -1183,77 +1220,40 @@ def unique(a, sorted=False, return_inverse=False, axis=None):
         # Gather all unique vectors
         counts = list(uniques_buf.tolist())
         displs = list([0] + uniques_buf.cumsum(0).tolist()[:-1])
-        gres_buf = torch.empty(output_dim, dtype=a.dtype.torch_type())
+        gres_buf = torch.empty(output_dim, dtype=a.dtype.torch_type(), device=lres.device)
         a.comm.Allgatherv(lres, (gres_buf, counts, displs), recv_axis=0)
 
-        if return_inverse:
-            # Prepare some information to generated the inverse indices list
-            avg_len = a.gshape[a.split] // a.comm.Get_size()
-            rem = a.gshape[a.split] % a.comm.Get_size()
-
-            # Share the local reverse indices with other processes
-            counts = [avg_len] * a.comm.Get_size()
-            add_vec = [1] * rem + [0] * (a.comm.Get_size() - rem)
-            inverse_counts = [sum(x) for x in zip(counts, add_vec)]
-            inverse_displs = [0] + list(np.cumsum(inverse_counts[:-1]))
-            inverse_dim = list(inverse_pos.shape)
-            inverse_dim[a.split] = a.gshape[a.split]
-            inverse_buf = torch.empty(inverse_dim, dtype=inverse_pos.dtype)
-
-            # Transpose data and buffer so we can use Allgatherv along axis=0 (axis=1 does not work properly yet)
-            inverse_pos = inverse_pos.transpose(0, a.split)
-            inverse_buf = inverse_buf.transpose(0, a.split)
-            a.comm.Allgatherv(
-                inverse_pos, (inverse_buf, inverse_counts, inverse_displs), recv_axis=0
-            )
-            inverse_buf = inverse_buf.transpose(0, a.split)
-
         # Run unique a second time
         gres = torch.unique(gres_buf, sorted=sorted, return_inverse=return_inverse, dim=unique_axis)
         if return_inverse:
-            # Use the previously gathered information to generate global inverse_indices
+            # the local inverse indices point into the local uniques, which are found at the rank's displacement in the
+            # gathered uniques, whose inverse in turn points into the global uniques
             g_inverse = gres[1]
             gres = gres[0]
-            if axis is None:
-                # Calculate how many elements we have in each layer along the split axis
-                elements_per_layer = 1
-                for num, val in enumerate(a.gshape):
-                    if not num == a.split:
-                        elements_per_layer *= val
-
-                # Create the displacements for the flattened inverse indices array
-                local_elements = [displ * elements_per_layer for displ in inverse_displs][1:] + [
-                    float("inf")
-                ]
-
-                # Flatten the inverse indices array every element can be updated to represent a global index
-                transposed = inverse_buf.transpose(0, a.split)
-                transposed_shape = transposed.shape
-                flatten_inverse = transposed.flatten()
-
-                # Update the index elements iteratively
-                cur_displ = 0
-                inverse_indices = [0] * len(flatten_inverse)
-                for num in range(len(inverse_indices)):
-                    if num >= local_elements[cur_displ]:
-                        cur_displ += 1
-                    index = flatten_inverse[num] + displs[cur_displ]
-                    inverse_indices[num] = g_inverse[index].tolist()
-
-                # Convert the flattened array back to the correct global shape of a
-                inverse_indices = torch.tensor(inverse_indices).reshape(transposed_shape)
-                inverse_indices = inverse_indices.transpose(0, a.split)
+            local_inverse = g_inverse[inverse_pos.to(g_inverse.device) + displs[a.comm.rank]]
 
+            # the inverse indices have the shape of a for axis=None and are one dimensional otherwise
+            inverse_split = a.split if axis is None else 0
+            if distributed_inverse:
+                inverse_indices = factories.array(
+                    local_inverse, is_split=inverse_split, device=a.device, comm=a.comm
+                )
             else:
-                inverse_indices = torch.zeros_like(inverse_buf)
-                steps = displs + [None]
+                inverse_counts = a.create_lshape_map()[:, a.split].tolist()
+                inverse_displs = [0] + np.cumsum(inverse_counts[:-1]).tolist()
+                inverse_dim = list(local_inverse.shape)
+                inverse_dim[inverse_split] = a.gshape[a.split]
+                inverse_indices = torch.empty(
+                    inverse_dim, dtype=local_inverse.dtype, device=local_inverse.device
+                )
 
-                # Algorithm that creates the correct list for the reverse_indices
-                for i in range(len(steps) - 1):
-                    begin = steps[i]
-                    end = steps[i + 1]
-                    for num, x in enumerate(inverse_buf[begin:end]):
-                        inverse_indices[begin + num] = g_inverse[begin + x]
+                # Transpose data and buffer so we can use Allgatherv along axis=0 (axis=1 does not work properly yet)
+                local_inverse = local_inverse.transpose(0, inverse_split)
+                inverse_indices = inverse_indices.transpose(0, inverse_split)
+                a.comm.Allgatherv(
+                    local_inverse, (inverse_indices, inverse_counts, inverse_displs), recv_axis=0
+                )
+                inverse_indices = inverse_indices.transpose(0, inverse_split)
 
     else:
         # Tensor is already split and does not need to be redistributed afterward
@@ -1291,11 +1291,84 @@ def unique(a, sorted=False, return_inverse=False, axis=None):
 
     return_value = result
     if return_inverse:
-        return_value = [return_value, inverse_indices.to(a.device.torch_device)]
+        if isinstance(inverse_indices, torch.Tensor):
+            inverse_indices = inverse_indices.to(a.device.torch_device)
+        return_value = [return_value, inverse_indices]
 
     return return_value
 
 
+def __partitioned_unique(a, sorted, return_counts):
+    """
+    Finds the unique elements of the flattened array a by sending the process-local unique elements to owner processes
+    determined by a hash of their values. Each process deduplicates the elements it owns, such that no process holds
+    more than its share of the distinct values.
+
+    Parameters
+    ----------
+    a : ht.DNDarray
+        Input array where unique elements should be found
+    sorted : bool
+        Whether the unique elements are sorted on each process
+    return_counts : bool
+        Whether to also return the number of occurrences of each unique element
+
+    Returns
+    -------
+    res : ht.DNDarray
+        The unique elements, split along axis 0 unless a is not split
+    counts : ht.DNDarray (optional)
+        The number of occurrences of each unique element, distributed like res
+    """
+    lres, lcounts = torch.unique(a._DNDarray__array.reshape(-1), sorted=True, return_counts=True)
+
+    if a.is_distributed():
+        # floats are hashed by their bit pattern, where negative zero is normalized to be owned with positive zero
+        if types.heat_type_is_inexact(a.dtype):
+            int_type = torch.int64 if lres.element_size() == 8 else torch.int32
+            keys = (lres + 0.0).view(int_type).to(torch.int64)
+        else:
+            keys = lres.to(torch.int64)
+        keys = keys ^ (keys >> 17)
+        owners = torch.remainder(keys, a.comm.size)
+
+        order = torch.argsort(owners)
+        send_counts = torch.bincount(owners, minlength=a.comm.size)
+        recv_counts = torch.empty_like(send_counts)
+        a.comm.Alltoall(send_counts, recv_counts)
+
+        send_counts = tuple(send_counts.tolist())
+        recv_counts = tuple(recv_counts.tolist())
+        send_displs = tuple(np.cumsum((0,) + send_counts[:-1]).tolist())
+        recv_displs = tuple(np.cumsum((0,) + recv_counts[:-1]).tolist())
+
+        recv_values = torch.empty((sum(recv_counts),), dtype=lres.dtype, device=lres.device)
+        a.comm.Alltoallv(
+            (lres[order], send_counts, send_displs), (recv_values, recv_counts, recv_displs)
+        )
+        recv_occurrences = torch.empty(recv_values.shape, dtype=lcounts.dtype, device=lres.device)
+        a.comm.Alltoallv(
+            (lcounts[order], send_counts, send_displs),
+            (recv_occurrences, recv_counts, recv_displs),
+        )
+
+        # the same value may have been received from several processes
+        lres, inverse = torch.unique(recv_values, sorted=sorted, return_inverse=True)
+        lcounts = torch.zeros(lres.shape, dtype=lcounts.dtype, device=lres.device)
+        lcounts.scatter_add_(0, inverse, recv_occurrences)
+
+    is_split = 0 if a.is_distributed() else None
+    result = factories.array(lres, dtype=a.dtype, is_split=is_split, device=a.device, comm=a.comm)
+    if not return_counts:
+        return result
+
+    counts = factories.array(
+        lcounts, dtype=types.int64, is_split=is_split, device=a.device, comm=a.comm
+    )
+
+    return [result, counts]
+
+
 def resplit(a, axis=None):
     """
     Out-of-place redistribution of the content of the tensor. Allows to "unsplit" (i.e. gather) all values from all
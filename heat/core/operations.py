@@ -1,10 +1,10 @@
 import builtins
 import numpy as np
 import torch
-import warnings
 
 from .communication import MPI, MPI_WORLD
 from . import factories
+from . import fusion
 from . import stride_tricks
 from . import dndarray
 from . import types
@@ -13,7 +13,7 @@ __all__ = []
 __BOOLEAN_OPS = [MPI.LAND, MPI.LOR, MPI.BAND, MPI.BOR]
 
 
-def __binary_op(operation, t1, t2):
+def __binary_op(operation, t1, t2, out=None):
     """
     Generic wrapper for element-wise binary operations of two operands (either can be tensor or scalar).
     Takes the operation function and the two operands involved in the operation as arguments.
@@ -30,144 +30,280 @@ def __binary_op(operation, t1, t2):
     t2: dndarray or scalar
         The second operand involved in the operation,
 
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the broadcast shape of the operands. The
+        result is written into its process-local data, which keeps its split axis, device and data type. If not
+        provided or set to None, a fresh tensor is allocated.
+
     Returns
     -------
     result: ht.DNDarray
-        A DNDarray containing the results of element-wise operation.
+        A DNDarray containing the results of element-wise operation. If out was provided, result is a reference to it.
+
+    Raises
+    -------
+    ValueError
+        If the shape of the optional output buffer does not match the broadcast shape of the operands
     """
-    if np.isscalar(t1):
+    if out is not None and not isinstance(out, dndarray.DNDarray):
+        raise TypeError("expected out to be None or an ht.DNDarray, but was {}".format(type(out)))
+
+    # fast path: operands that need neither communication nor wrapping into a DNDarray, i.e. a scalar and a DNDarray
+    # or two equally distributed DNDarrays, are passed to torch right away
+    if isinstance(t1, dndarray.DNDarray):
+        if isinstance(t2, dndarray.DNDarray):
+            split = t1.split
+            if (
+                split == t2.split
+                and (
+                    split is None
+                    or (t1.numdims == t2.numdims and t1.gshape[split] == t2.gshape[split])
+                )
+                and (out is None or out.split == split)
+            ):
+                output_shape = stride_tricks.broadcast_shape(t1.shape, t2.shape)
+                return __binary_op_result(
+                    operation, t1, t2, t1.dtype.torch_type(), output_shape, split, out
+                )
+        elif np.isscalar(t2):
+            torch_type = t1.dtype.torch_type()
+            try:
+                t2 = torch.tensor(t2, dtype=torch_type, device=t1.device.torch_device)
+            except (ValueError, TypeError, RuntimeError):
+                raise TypeError("Data type not supported, input was {}".format(type(t2)))
+            if out is not None:
+                t1 = __align_operand(t1, t1.split, out.split, t1.shape)
+            return __binary_op_result(operation, t1, t2, torch_type, t1.shape, t1.split, out)
+    elif np.isscalar(t1) and isinstance(t2, dndarray.DNDarray):
+        torch_type = t2.dtype.torch_type()
         try:
-            t1 = factories.array([t1])
-        except (ValueError, TypeError):
+            t1 = torch.tensor(t1, dtype=torch_type, device=t2.device.torch_device)
+        except (ValueError, TypeError, RuntimeError):
             raise TypeError("Data type not supported, input was {}".format(type(t1)))
+        if out is not None:
+            t2 = __align_operand(t2, t2.split, out.split, t2.shape)
+        return __binary_op_result(operation, t1, t2, torch_type, t2.shape, t2.split, out)
 
-        if np.isscalar(t2):
-            try:
-                t2 = factories.array([t2])
-            except (ValueError, TypeError):
-                raise TypeError(
-                    "Only numeric scalars are supported, but input was {}".format(type(t2))
-                )
-            output_shape = (1,)
-            output_split = None
-            output_device = None
-            output_comm = MPI_WORLD
-        elif isinstance(t2, dndarray.DNDarray):
-            t1.gpu() if t2.device.device_type == "gpu" else t1.cpu()
-
-            output_shape = t2.shape
-            output_split = t2.split
-            output_device = t2.device
-            output_comm = t2.comm
-        else:
+    if np.isscalar(t1):
+        if not np.isscalar(t2):
             raise TypeError(
                 "Only tensors and numeric scalars are supported, but input was {}".format(type(t2))
             )
+        try:
+            t1 = factories.array([t1])
+        except (ValueError, TypeError):
+            raise TypeError("Data type not supported, input was {}".format(type(t1)))
+        try:
+            t2 = factories.array([t2])
+        except (ValueError, TypeError):
+            raise TypeError("Only numeric scalars are supported, but input was {}".format(type(t2)))
+        return __binary_op_result(operation, t1, t2, t2.dtype.torch_type(), (1,), None, out)
 
-        if t1.dtype != t2.dtype:
-            t1 = t1.astype(t2.dtype)
+    if not isinstance(t1, dndarray.DNDarray):
+        raise NotImplementedError("Not implemented for non scalar")
+    if not isinstance(t2, dndarray.DNDarray):
+        raise TypeError(
+            "Only tensors and numeric scalars are supported, but input was {}".format(type(t2))
+        )
 
-    elif isinstance(t1, dndarray.DNDarray):
-        if np.isscalar(t2):
-            try:
-                t2 = factories.array([t2], device=t1.device)
-                output_shape = t1.shape
-                output_split = t1.split
-                output_device = t1.device
-                output_comm = t1.comm
-            except (ValueError, TypeError):
-                raise TypeError("Data type not supported, input was {}".format(type(t2)))
+    output_shape = stride_tricks.broadcast_shape(t1.shape, t2.shape)
+    t1, t2, output_split = __align_operands(t1, t2, output_shape, out)
 
-        elif isinstance(t2, dndarray.DNDarray):
-            if t1.split is None:
-                t1 = factories.array(
-                    t1,
-                    split=t2.split,
-                    copy=False,
-                    comm=t1.comm,
-                    device=t1.device,
-                    ndmin=-t2.numdims,
-                )
-            elif t2.split is None:
-                t2 = factories.array(
-                    t2,
-                    split=t1.split,
-                    copy=False,
-                    comm=t2.comm,
-                    device=t2.device,
-                    ndmin=-t1.numdims,
-                )
-            elif t1.split != t2.split:
-                # It is NOT possible to perform binary operations on tensors with different splits, e.g. split=0
-                # and split=1
-                raise NotImplementedError("Not implemented for other splittings")
-
-            output_shape = stride_tricks.broadcast_shape(t1.shape, t2.shape)
-            output_split = t1.split
-            output_device = t1.device
-            output_comm = t1.comm
-
-            # ToDo: Fine tuning in case of comm.size>t1.shape[t1.split]. Send torch tensors only to ranks, that will hold data.
-            if t1.split is not None:
-                if t1.shape[t1.split] == 1 and t1.comm.is_distributed():
-                    warnings.warn(
-                        "Broadcasting requires transferring data of first operator between MPI ranks!"
-                    )
-                    if t1.comm.rank > 0:
-                        t1._DNDarray__array = torch.zeros(
-                            t1.shape, dtype=t1.dtype.torch_type(), device=t1.device.torch_device
-                        )
-                    t1.comm.Bcast(t1)
-
-            if t2.split is not None:
-                if t2.shape[t2.split] == 1 and t2.comm.is_distributed():
-                    warnings.warn(
-                        "Broadcasting requires transferring data of second operator between MPI ranks!"
-                    )
-                    if t2.comm.rank > 0:
-                        t2._DNDarray__array = torch.zeros(
-                            t2.shape, dtype=t2.dtype.torch_type(), device=t2.device.torch_device
-                        )
-                    t2.comm.Bcast(t2)
+    return __binary_op_result(
+        operation, t1, t2, t1.dtype.torch_type(), output_shape, output_split, out
+    )
 
+
+def __binary_op_result(operation, t1, t2, torch_type, output_shape, output_split, out):
+    """
+    Applies a binary operation to the aligned operands and either wraps the process-local result into a fresh DNDarray
+    or writes it into the output buffer out.
+    """
+    reference = t1 if isinstance(t1, dndarray.DNDarray) else t2
+
+    if out is None:
+        result = __local_binary_op(operation, t1, t2, torch_type)
+        if isinstance(reference, dndarray.DNDarray):
+            device, comm = reference.device, reference.comm
         else:
-            raise TypeError(
-                "Only tensors and numeric scalars are supported, but input was {}".format(type(t2))
-            )
+            device, comm = None, MPI_WORLD
 
-        if t2.dtype != t1.dtype:
-            t2 = t2.astype(t1.dtype)
+        return dndarray.DNDarray(
+            result, output_shape, types.heat_type_of(result), output_split, device, comm
+        )
 
-    else:
-        raise NotImplementedError("Not implemented for non scalar")
+    if out.shape != output_shape:
+        raise ValueError(
+            "Expecting output buffer of shape {}, got {}".format(output_shape, out.shape)
+        )
+    __local_binary_op(operation, t1, t2, torch_type, out._DNDarray__array)
 
-    promoted_type = types.promote_types(t1.dtype, t2.dtype).torch_type()
-    if t1.split is not None:
-        if len(t1.lshape) > t1.split and t1.lshape[t1.split] == 0:
-            result = t1._DNDarray__array.type(promoted_type)
-        else:
-            result = operation(
-                t1._DNDarray__array.type(promoted_type), t2._DNDarray__array.type(promoted_type)
-            )
-    elif t2.split is not None:
+    return out
 
-        if len(t2.lshape) > t2.split and t2.lshape[t2.split] == 0:
-            result = t2._DNDarray__array.type(promoted_type)
-        else:
-            result = operation(
-                t1._DNDarray__array.type(promoted_type), t2._DNDarray__array.type(promoted_type)
-            )
+
+def __align_operands(t1, t2, output_shape, out=None):
+    """
+    Aligns the distribution of the two operands of a binary operation, such that the operation can be applied to their
+    process-local data. The split axis of the result is the one of the output buffer, if provided, and otherwise
+    chosen among the split axes of the operands, such that the least amount of data is communicated. For each
+    operand, the transfer cost with respect to a candidate split axis is
+
+        * zero, if it is already split along that axis or not split at all
+        * its size, if it has to be redistributed along that axis via Alltoallv
+        * its size times (number of processes - 1), if it is broadcast along that axis, i.e. has to be gathered
+          entirely on all processes
+
+    Parameters
+    ----------
+    t1 : ht.DNDarray
+        The first operand
+    t2 : ht.DNDarray
+        The second operand
+    output_shape : tuple of ints
+        The broadcast shape of the operands
+    out : ht.DNDarray, optional
+        The output buffer, whose split axis is imposed on the result
+
+    Returns
+    -------
+    t1 : ht.DNDarray
+        The first operand, with process-local data aligned to output_split
+    t2 : ht.DNDarray
+        The second operand, with process-local data aligned to output_split
+    output_split : int or None
+        The split axis of the result
+    """
+    numdims = len(output_shape)
+    splits = [None if t.split is None else t.split + numdims - t.numdims for t in (t1, t2)]
+    candidates = [split for split in splits if split is not None]
+
+    if out is not None:
+        output_split = out.split
+    elif not candidates:
+        return t1, t2, None
     else:
-        result = operation(
-            t1._DNDarray__array.type(promoted_type), t2._DNDarray__array.type(promoted_type)
+        output_split = min(
+            candidates,
+            key=lambda axis: sum(
+                __transfer_cost(t, split, axis, output_shape) for t, split in zip((t1, t2), splits)
+            ),
         )
+    t1, t2 = (
+        __align_operand(t, split, output_split, output_shape) for t, split in zip((t1, t2), splits)
+    )
 
-    if not isinstance(result, torch.Tensor):
-        result = torch.tensor(result)
+    return t1, t2, output_split
 
-    return dndarray.DNDarray(
-        result, output_shape, types.heat_type_of(result), output_split, output_device, output_comm
+
+def __transfer_cost(t, split, axis, output_shape):
+    """
+    Number of bytes to be communicated in order to align the operand t to the split axis of the result. split and axis
+    refer to the dimensions of the result.
+    """
+    offset = len(output_shape) - t.numdims
+    spans = axis >= offset and t.gshape[axis - offset] == output_shape[axis]
+
+    if split is None or (split == axis and spans):
+        return 0
+    nbytes = t.gnumel * np.dtype(t.dtype.char()).itemsize
+    if spans:
+        return nbytes
+    return nbytes * (t.comm.size - 1)
+
+
+def __align_operand(t, split, axis, output_shape):
+    """
+    Aligns the process-local data of the operand t to the split axis of the result, without modifying t. split and
+    axis refer to the dimensions of the result.
+    """
+    if not t.comm.is_distributed():
+        return t
+    # operands are gathered entirely for an unsplit result
+    if axis is None:
+        if split is None:
+            return t
+        aligned = dndarray.DNDarray(t._DNDarray__array, t.gshape, t.dtype, t.split, t.device, t.comm)
+        return aligned.resplit_(None)
+
+    offset = len(output_shape) - t.numdims
+    spans = axis >= offset and t.gshape[axis - offset] == output_shape[axis]
+    if split == axis and spans:
+        return t
+    # replicated operands are either sliced locally or broadcast as a whole
+    if split is None:
+        if not spans:
+            return t
+        _, _, slices = t.comm.chunk(t.gshape, axis - offset)
+        return dndarray.DNDarray(
+            t._DNDarray__array[slices], t.gshape, t.dtype, axis - offset, t.device, t.comm
+        )
+
+    # redistribute a shallow copy, the local data of t is left untouched
+    aligned = dndarray.DNDarray(t._DNDarray__array, t.gshape, t.dtype, t.split, t.device, t.comm)
+    return aligned.resplit_(axis - offset if spans else None)
+
+
+def __local_binary_op(operation, t1, t2, torch_type, out=None):
+    """
+    Applies a binary operation to the process-local data of the operands after casting them to a common type. In
+    lazy mode, the operation is only recorded and evaluated fused with its successors.
+
+    Parameters
+    ----------
+    operation : function
+        The element-wise operation to be performed, e.g. torch.add
+    t1 : ht.DNDarray or torch.Tensor
+        The first operand
+    t2 : ht.DNDarray or torch.Tensor
+        The second operand
+    torch_type : torch.dtype
+        The type both operands are cast to
+    out : torch.Tensor, optional
+        A process-local buffer the result is written into, the operation is then always evaluated eagerly
+
+    Returns
+    -------
+    result : torch.Tensor or fusion.DeferredTensor
+        The process-local result of the operation
+    """
+    if out is None:
+        result = fusion.defer(
+            operation,
+            tuple(t._DNDarray__buffer if isinstance(t, dndarray.DNDarray) else t for t in (t1, t2)),
+            torch_type,
+        )
+        if result is not None:
+            return result
+
+    operands = tuple(
+        (t._DNDarray__array if isinstance(t, dndarray.DNDarray) else t).type(torch_type)
+        for t in (t1, t2)
     )
+    if out is None:
+        result = operation(*operands)
+        if not isinstance(result, torch.Tensor):
+            result = torch.tensor(result)
+        return result
+
+    # deferred results reading the output buffer are evaluated before it is overwritten
+    fusion.evaluate_readers(out)
+
+    # torch operations write into the buffer directly, all others (e.g. torch.Tensor.__and__ returning NotImplemented
+    # for the out keyword) are evaluated into a temporary that is copied
+    try:
+        if operation(*operands, out=out) is out:
+            return out
+    except (TypeError, RuntimeError):
+        pass
+    result = operation(*operands)
+    if not isinstance(result, torch.Tensor) or not torch.can_cast(result.dtype, out.dtype):
+        raise TypeError(
+            "Cannot write result of type {} into output buffer of type {}".format(
+                getattr(result, "dtype", type(result)), out.dtype
+            )
+        )
+
+    return out.copy_(result)
 
 
 def __local_op(operation, x, out, no_cast=False, **kwargs):
@@ -211,11 +347,13 @@ def __local_op(operation, x, out, no_cast=False, **kwargs):
         promoted_type = types.promote_types(x.dtype, types.float32)
         torch_type = promoted_type.torch_type()
     else:
-        torch_type = x._DNDarray__array.dtype
+        torch_type = x._DNDarray__buffer.dtype
 
     # no defined output tensor, return a freshly created one
     if out is None:
-        result = operation(x._DNDarray__array.type(torch_type), **kwargs)
+        result = fusion.defer(operation, (x._DNDarray__buffer,), torch_type, **kwargs)
+        if result is None:
+            result = operation(x._DNDarray__array.type(torch_type), **kwargs)
         return dndarray.DNDarray(
             result, x.gshape, types.canonical_heat_type(result.dtype), x.split, x.device, x.comm
         )
@@ -231,6 +369,7 @@ def __local_op(operation, x, out, no_cast=False, **kwargs):
 
     # do an inplace operation into a provided buffer
     casted = x._DNDarray__array.type(torch_type)
+    fusion.evaluate_readers(out._DNDarray__array)
     operation(
         casted.repeat(multiples) if needs_repetition else casted, out=out._DNDarray__array, **kwargs
     )
@@ -325,6 +464,9 @@ def __reduce_op(x, partial_op, reduction_op, neutral=None, **kwargs):
         split = None
         if x.comm.is_distributed():
             x.comm.Allreduce(MPI.IN_PLACE, partial, reduction_op)
+    # the split axis moves forward by the number of reduced dimensions preceding it
+    elif split is not None and len(output_shape) < x.numdims:
+        split -= len([dim for dim in axis if dim < split])
 
     # if reduction_op is a Boolean operation, then resulting tensor is bool
     tensor_type = bool if reduction_op in __BOOLEAN_OPS else partial.dtype
@@ -346,3 +488,84 @@ def __reduce_op(x, partial_op, reduction_op, neutral=None, **kwargs):
         device=x.device,
         comm=x.comm,
     )
+
+
+def __cum_op(x, partial_op, exscan_op, combine, neutral, axis, dtype=None, out=None):
+    """
+    Generic wrapper for cumulative operations, e.g. cumsum() and cumprod(). The cumulative operation is performed on
+    the process-local data first. If x is split along axis, the last local slices of all processes are then combined
+    in a single exclusive scan and each process applies the result of its predecessors to its local data.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        The heat DNDarray on which to perform the cumulative operation
+    partial_op: function
+        The function performing the cumulative operation on the process-local data, e.g. torch.cumsum
+    exscan_op: mpi4py.MPI.Op
+        The MPI operator combining the last local slices of the processes in an exclusive scan, e.g. MPI.SUM
+    combine: function
+        The function applying the combined slices of the preceding processes to the local data, e.g. torch.add
+    neutral: scalar
+        Neutral element of the operation, the offset of the first process and of empty local chunks
+    axis: int
+        The axis along which the cumulative operation is performed
+    dtype: ht.dtype, optional
+        The type the data is cast to before the operation, defaults to the type chosen by partial_op
+    out: ht.DNDarray, optional
+        Alternative output tensor, it must have the same shape as x
+
+    Returns
+    -------
+    result: ht.DNDarray
+        A DNDarray of the shape and split axis of x containing the result of the cumulative operation
+
+    Raises
+    ------
+    TypeError
+        If the input or optional output parameter are not of type ht.DNDarray or axis is not an integer
+    ValueError
+        If the shape of the optional output parameter does not match the shape of x
+    """
+    if not isinstance(x, dndarray.DNDarray):
+        raise TypeError("expected x to be a ht.DNDarray, but was {}".format(type(x)))
+    if out is not None and not isinstance(out, dndarray.DNDarray):
+        raise TypeError("expected out to be None or an ht.DNDarray, but was {}".format(type(out)))
+    if not isinstance(axis, int):
+        raise TypeError("axis must be int, but was {}".format(type(axis)))
+    axis = stride_tricks.sanitize_axis(x.shape, axis)
+    if out is not None and out.shape != x.shape:
+        raise ValueError("Expecting output buffer of shape {}, got {}".format(x.shape, out.shape))
+
+    torch_type = None if dtype is None else types.canonical_heat_type(dtype).torch_type()
+    partial = partial_op(x._DNDarray__array, dim=axis, dtype=torch_type)
+
+    # the combined last slices of all preceding processes are applied to the local data
+    if x.split == axis and x.comm.is_distributed():
+        slice_shape = partial.shape[:axis] + (1,) + partial.shape[axis + 1 :]
+        if partial.shape[axis] > 0:
+            last = partial.narrow(axis, partial.shape[axis] - 1, 1).clone()
+        else:
+            last = torch.full(slice_shape, neutral, dtype=partial.dtype, device=partial.device)
+        offset = torch.empty_like(last)
+        x.comm.Exscan(last, offset, exscan_op)
+        if x.comm.rank > 0:
+            partial = combine(partial, offset)
+
+    if out is not None:
+        out._DNDarray__array = partial
+        out._DNDarray__dtype = types.canonical_heat_type(partial.dtype)
+        out._DNDarray__split = x.split
+        out._DNDarray__device = x.device
+        out._DNDarray__comm = x.comm
+
+        return out
+
+    return dndarray.DNDarray(
+        partial,
+        x.gshape,
+        types.canonical_heat_type(partial.dtype),
+        split=x.split,
+        device=x.device,
+        comm=x.comm,
+    )
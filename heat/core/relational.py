@@ -6,7 +6,7 @@ from . import operations
 __all__ = ["eq", "equal", "ge", "gt", "le", "lt", "ne"]
 
 
-def eq(t1, t2):
+def eq(t1, t2, out=None):
     """
     Element-wise rich comparison of equality between values from two operands, commutative.
     Takes the first and second operand (scalar or tensor) whose elements are to be compared as argument.
@@ -17,6 +17,8 @@ def eq(t1, t2):
         The first operand involved in the comparison
     t2: tensor or scalar
         The second operand involved in the comparison
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -37,7 +39,7 @@ def eq(t1, t2):
     tensor([[0, 1],
             [0, 0]])
     """
-    return operations.__binary_op(torch.eq, t1, t2)
+    return operations.__binary_op(torch.eq, t1, t2, out)
 
 
 def equal(t1, t2):
@@ -79,7 +81,7 @@ def equal(t1, t2):
     return result_tensor.comm.allreduce(result_value, MPI.LAND)
 
 
-def ge(t1, t2):
+def ge(t1, t2, out=None):
     """
     Element-wise rich greater than or equal comparison between values from operand t1 with respect to values of
     operand t2 (i.e. t1 >= t2), not commutative.
@@ -91,6 +93,8 @@ def ge(t1, t2):
         The first operand to be compared greater than or equal to second operand
     t2: tensor or scalar
        The second operand to be compared less than or equal to first operand
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -111,10 +115,10 @@ def ge(t1, t2):
     tensor([[0, 1],
             [1, 1]], dtype=torch.uint8)
     """
-    return operations.__binary_op(torch.ge, t1, t2)
+    return operations.__binary_op(torch.ge, t1, t2, out)
 
 
-def gt(t1, t2):
+def gt(t1, t2, out=None):
     """
     Element-wise rich greater than comparison between values from operand t1 with respect to values of
     operand t2 (i.e. t1 > t2), not commutative.
@@ -127,6 +131,8 @@ def gt(t1, t2):
 
     t2: tensor or scalar
        The second operand to be compared less than first operand
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -147,10 +153,10 @@ def gt(t1, t2):
     tensor([[0, 0],
             [1, 1]], dtype=torch.uint8)
     """
-    return operations.__binary_op(torch.gt, t1, t2)
+    return operations.__binary_op(torch.gt, t1, t2, out)
 
 
-def le(t1, t2):
+def le(t1, t2, out=None):
     """
     Element-wise rich less than or equal comparison between values from operand t1 with respect to values of
     operand t2 (i.e. t1 <= t2), not commutative.
@@ -162,6 +168,8 @@ def le(t1, t2):
        The first operand to be compared less than or equal to second operand
     t2: tensor or scalar
        The second operand to be compared greater than or equal to first operand
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -182,10 +190,10 @@ def le(t1, t2):
     tensor([[1, 1],
             [0, 0]], dtype=torch.uint8)
     """
-    return operations.__binary_op(torch.le, t1, t2)
+    return operations.__binary_op(torch.le, t1, t2, out)
 
 
-def lt(t1, t2):
+def lt(t1, t2, out=None):
     """
     Element-wise rich less than comparison between values from operand t1 with respect to values of
     operand t2 (i.e. t1 < t2), not commutative.
@@ -198,6 +206,8 @@ def lt(t1, t2):
 
     t2: tensor or scalar
         The second operand to be compared greater than first operand
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -217,10 +227,10 @@ def lt(t1, t2):
     tensor([[1, 0],
             [0, 0]], dtype=torch.uint8)
     """
-    return operations.__binary_op(torch.lt, t1, t2)
+    return operations.__binary_op(torch.lt, t1, t2, out)
 
 
-def ne(t1, t2):
+def ne(t1, t2, out=None):
     """
     Element-wise rich comparison of non-equality between values from two operands, commutative.
     Takes the first and second operand (scalar or tensor) whose elements are to be compared as argument.
@@ -231,6 +241,8 @@ def ne(t1, t2):
         The first operand involved in the comparison
     t2: tensor or scalar
         The second operand involved in the comparison
+    out: ht.DNDarray, optional
+        Output buffer for the result, it must have the broadcast shape of the operands.
 
     Returns
     -------
@@ -251,4 +263,4 @@ def ne(t1, t2):
     tensor([[1, 0],
             [1, 1]])
     """
-    return operations.__binary_op(torch.ne, t1, t2)
+    return operations.__binary_op(torch.ne, t1, t2, out)
@@ -271,7 +271,7 @@ def round(x, decimals=0, out=None, dtype=None):
         raise TypeError("dtype must be a heat data type")
 
     if decimals != 0:
-        x *= 10 ** decimals
+        x = x * 10 ** decimals
 
     rounded_values = operations.__local_op(torch.round, x, out)
 
@@ -1,3 +1,4 @@
+import builtins
 import numpy as np
 import torch
 
@@ -18,12 +19,20 @@ __all__ = [
     "argmax",
     "argmin",
     "average",
+    "bincount",
     "cov",
+    "describe",
+    "histc",
+    "histogram",
     "max",
     "maximum",
     "mean",
+    "mean_var",
+    "median",
     "min",
     "minimum",
+    "percentile",
+    "quantile",
     "std",
     "var",
 ]
@@ -335,12 +344,6 @@ def average(x, axis=None, weights=None, returned=False):
             wgt._DNDarray__array[wgt_slice] = weights._DNDarray__array
             wgt = factories.array(wgt._DNDarray__array, is_split=wgt_split)
         else:
-            if x.comm.is_distributed():
-                if x.split is not None and weights.split != x.split and weights.numdims != 1:
-                    # fix after Issue #425 is solved
-                    raise NotImplementedError(
-                        "weights.split does not match data.split: not implemented yet."
-                    )
             wgt = factories.empty_like(weights, device=x.device)
             wgt._DNDarray__array = weights._DNDarray__array
 
@@ -363,6 +366,68 @@ def average(x, axis=None, weights=None, returned=False):
     return result
 
 
+def bincount(x, weights=None, minlength=0):
+    """
+    Counts the number of occurrences of each value in a tensor of non-negative integers. Every process counts its
+    local values, the counts of all processes are added up in a single Allreduce. The length of the result is
+    discovered beforehand with a fused reduction of the global minimum and maximum.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        One-dimensional input tensor of non-negative integers
+    weights : ht.DNDarray, optional
+        Weights of the same shape and split axis as x. If given, the weights of the values are summed up instead of
+        counting them.
+    minlength : int, optional
+        A minimum number of bins for the output tensor. Default: 0.
+
+    Returns
+    -------
+    counts : ht.DNDarray
+        The non-split counts of length max(x.max() + 1, minlength), of dtype int64 or float64 if weights are given.
+
+    Raises
+    ------
+    TypeError
+        If x is not an integer tensor or minlength is not an integer.
+    ValueError
+        If x is not one-dimensional, contains negative values, minlength is negative or the weights do not match x.
+
+    Examples
+    --------
+    >>> ht.bincount(ht.array([1, 1, 3, 0, 1], split=0))
+    tensor([1, 3, 0, 1])
+    >>> ht.bincount(ht.array([0, 1, 1]), weights=ht.array([0.5, 1.0, 2.0]), minlength=3)
+    tensor([0.5000, 3.0000, 0.0000], dtype=torch.float64)
+    """
+    if not isinstance(x, dndarray.DNDarray):
+        raise TypeError("expected x to be a ht.DNDarray, but was {}".format(type(x)))
+    if not types.heat_type_is_exact(x.dtype):
+        raise TypeError("x must be an integer tensor, but is of type {}".format(x.dtype))
+    if len(x.gshape) != 1:
+        raise ValueError("x must be one-dimensional, but has shape {}".format(x.gshape))
+    if not isinstance(minlength, int):
+        raise TypeError("minlength must be int, but was {}".format(type(minlength)))
+    if minlength < 0:
+        raise ValueError("minlength must be non-negative, but was {}".format(minlength))
+    local_weights = __sanitize_weights(x, weights)
+    if local_weights is not None:
+        local_weights = local_weights.double()
+
+    minimum, maximum = __extrema(x)
+    if minimum < 0:
+        raise ValueError("x must not contain negative values")
+    length = builtins.max(minlength, int(maximum) + 1 if x.gnumel > 0 else 0)
+
+    local = x._DNDarray__array
+    counts = torch.bincount(local.long(), weights=local_weights, minlength=length)
+    if x.is_distributed():
+        x.comm.Allreduce(MPI.IN_PLACE, counts, MPI.SUM)
+
+    return factories.array(counts, is_split=None, device=x.device, comm=x.comm)
+
+
 def cov(m, y=None, rowvar=True, bias=False, ddof=None):
     """
     Estimate the covariance matrix of some data, m. For more imformation on the algorithm please see the numpy function of the same name
@@ -435,6 +500,290 @@ def cov(m, y=None, rowvar=True, bias=False, ddof=None):
     return c
 
 
+def describe(x, axis=None, stats=None, ddof=0):
+    """
+    Calculates several statistics of a tensor at once. Only the requested statistics are computed on the local data,
+    and all of them are combined across the processes in a single collective operation of packed per-element
+    summaries. This replaces one pass over the data and one collective per separately called reduction.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        Values for which the statistics are calculated for
+    axis : None, int or iterable of ints, optional
+        Axis/axes along which the statistics are computed. Default None reduces all data items.
+    stats : iterable of str, optional
+        The requested statistics, any of "count", "sum", "sumsq" (sum of squares), "min", "max", "mean", "var" and
+        "std". Default None computes all of them.
+    ddof : int, optional
+        Delta Degrees of Freedom of "var" and "std", see var. Default: 0.
+
+    Returns
+    -------
+    statistics : dict of ht.DNDarray
+        The requested statistics keyed by their names. Their split axis follows the semantics of mean and var.
+
+    Raises
+    ------
+    TypeError
+        If stats is not an iterable of strings or ddof is not an integer.
+    ValueError
+        If a statistic is unknown, ddof is negative, an axis is out of bounds or given twice or the minimum or maximum
+        of an empty axis is requested.
+    NotImplementedError
+        If ddof is larger than 1.
+
+    Notes
+    -----
+    The summaries are exchanged in double precision, integer minima, maxima and sums beyond 2**53 are not exact.
+
+    Examples
+    --------
+    >>> a = ht.array([[1.0, 4.0], [3.0, 2.0], [5.0, 9.0]], split=0)
+    >>> ht.describe(a, axis=0, stats=["min", "max", "mean"])
+    {'min': tensor([1., 2.]), 'max': tensor([5., 9.]), 'mean': tensor([3., 5.])}
+    >>> ht.describe(a, stats=("count", "sum"))
+    {'count': tensor(6), 'sum': tensor(24.)}
+    """
+    if stats is None:
+        stats = __DESCRIBE_STATS
+    elif isinstance(stats, str):
+        raise TypeError("stats must be an iterable of str, but was {}".format(type(stats)))
+    stats = tuple(stats)
+    for stat in stats:
+        if stat not in __DESCRIBE_STATS:
+            raise ValueError("unknown statistic {}, must be in {}".format(stat, __DESCRIBE_STATS))
+    __sanitize_ddof(ddof)
+    axis, split = __reduction_axis(x, axis)
+
+    # move the reduced axes to the end and flatten them, all statistics are reduced along the last dimension
+    local = x._DNDarray__array
+    dims = tuple(range(local.dim())) if axis is None else axis
+    kept = [dim for dim in range(local.dim()) if dim not in dims]
+    output_shape = [local.shape[dim] for dim in kept]
+    if {"min", "max"}.intersection(stats) and not np.prod([x.gshape[dim] for dim in dims]):
+        raise ValueError("cannot compute the minimum or maximum of an empty axis")
+    n = int(np.prod([local.shape[dim] for dim in dims]))
+    flat = (local.permute(*kept, *dims) if local.dim() else local).reshape(*output_shape, n)
+
+    # per element summaries: count, mean, M2, sum, sum of squares, minimum, maximum
+    summaries = torch.zeros(output_shape + [7], dtype=torch.float64)
+    summaries[..., 5] = float("inf")
+    summaries[..., 6] = -float("inf")
+    if n > 0:
+        summaries[..., 0] = n
+        if {"mean", "var", "std"}.intersection(stats):
+            values = flat if flat.is_floating_point() else flat.double()
+            var, mu = torch.var_mean(values, dim=-1, unbiased=False)
+            summaries[..., 1] = mu.cpu()
+            summaries[..., 2] = var.cpu() * n
+        if "sum" in stats:
+            summaries[..., 3] = flat.sum(dim=-1).cpu()
+        if "sumsq" in stats:
+            # squared in a wider type, small integer types would overflow
+            wide = flat.double() if flat.is_floating_point() else flat.long()
+            summaries[..., 4] = (wide * wide).sum(dim=-1).cpu()
+        if "min" in stats:
+            summaries[..., 5] = flat.min(dim=-1)[0].cpu()
+        if "max" in stats:
+            summaries[..., 6] = flat.max(dim=-1)[0].cpu()
+    if x.is_distributed() and split is None:
+        x.comm.Allreduce(MPI.IN_PLACE, [summaries.numpy(), __DESCRIBE_TYPE], MPI_DESCRIBE)
+
+    float_type = local.dtype if local.is_floating_point() else torch.float32
+    sum_type = local.dtype if local.is_floating_point() else torch.int64
+    results = {}
+    for stat in stats:
+        if stat == "count":
+            result = summaries[..., 0].to(torch.int64)
+        elif stat == "sum":
+            result = summaries[..., 3].to(sum_type)
+        elif stat == "sumsq":
+            result = summaries[..., 4].to(sum_type)
+        elif stat == "min":
+            result = summaries[..., 5].to(local.dtype)
+        elif stat == "max":
+            result = summaries[..., 6].to(local.dtype)
+        elif stat == "mean":
+            result = summaries[..., 1].to(float_type)
+        else:
+            result = summaries[..., 2] / (summaries[..., 0] - ddof)
+            result = (result.sqrt() if stat == "std" else result).to(float_type)
+        results[stat] = factories.array(
+            result.to(local.device), is_split=split, device=x.device, comm=x.comm
+        )
+
+    return results
+
+
+def histc(x, bins=100, min=0, max=0):
+    """
+    Computes the histogram of a tensor with equal width bins between min and max, analogous to torch.histc. See
+    histogram.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        Input data
+    bins : int, optional
+        Number of histogram bins. Default: 100.
+    min : scalar, optional
+        Lower end of the range (inclusive). If min and max are both zero, the global minimum and maximum of the data
+        are used.
+    max : scalar, optional
+        Upper end of the range (inclusive).
+
+    Returns
+    -------
+    hist : ht.DNDarray
+        The non-split histogram, of the floating point type of x.
+
+    Examples
+    --------
+    >>> ht.histc(ht.array([1.0, 2.0, 1.0], split=0), bins=4, min=0, max=3)
+    tensor([0., 2., 1., 0.])
+    """
+    value_range = None if min == 0 and max == 0 else (min, max)
+    hist, bin_edges = histogram(x, bins=bins, range=value_range)
+
+    return hist.astype(bin_edges.dtype)
+
+
+def histogram(x, bins=10, range=None, weights=None, density=False):
+    """
+    Computes the histogram of a tensor with equal width bins. Each process bins its local values, the histograms of
+    all processes are added up in a single Allreduce. If no range is given, it is discovered beforehand with a fused
+    reduction of the global minimum and maximum. The data is flattened.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        Input data
+    bins : int, optional
+        Number of equal width bins. Default: 10.
+    range : (float, float), optional
+        The lower and upper range of the bins. Values outside of the range are ignored. Default: the global minimum
+        and maximum of x. All bins but the last one are half-open, the last one also includes the upper range.
+    weights : ht.DNDarray, optional
+        Weights of the same shape and split axis as x. If given, the weights of the values are summed up instead of
+        counting them.
+    density : bool, optional
+        If True, the histogram is normalized to a probability density function, whose integral over the range is 1.
+        Default: False.
+
+    Returns
+    -------
+    hist : ht.DNDarray
+        The non-split values of the histogram. They are of dtype int64, the dtype of the weights or the floating point
+        type of x if density is True.
+    bin_edges : ht.DNDarray
+        The non-split bin edges of length bins + 1, of the floating point type of x.
+
+    Raises
+    ------
+    TypeError
+        If bins is not an integer.
+    ValueError
+        If bins is not positive, the range is invalid, the weights do not match x or the automatically discovered
+        range is not finite.
+
+    Examples
+    --------
+    >>> a = ht.array([1.0, 2.0, 1.0, 4.0], split=0)
+    >>> ht.histogram(a, bins=3)
+    (tensor([2, 1, 1]), tensor([1., 2., 3., 4.]))
+    >>> ht.histogram(a, bins=2, range=(0, 2), density=True)
+    (tensor([0.0000, 1.0000]), tensor([0., 1., 2.]))
+    """
+    if not isinstance(x, dndarray.DNDarray):
+        raise TypeError("expected x to be a ht.DNDarray, but was {}".format(type(x)))
+    if not isinstance(bins, int):
+        raise TypeError("bins must be int, but was {}".format(type(bins)))
+    if bins < 1:
+        raise ValueError("bins must be positive, but was {}".format(bins))
+    local_weights = __sanitize_weights(x, weights)
+
+    if range is None:
+        lower, upper = __extrema(x)
+        if x.gnumel == 0:
+            lower, upper = 0.0, 1.0
+        elif not (np.isfinite(lower) and np.isfinite(upper)):
+            raise ValueError("autodetected range of [{}, {}] is not finite".format(lower, upper))
+    else:
+        lower, upper = (float(bound) for bound in range)
+        if not (np.isfinite(lower) and np.isfinite(upper)):
+            raise ValueError("range of [{}, {}] is not finite".format(lower, upper))
+        if lower > upper:
+            raise ValueError("max must be larger than min in range parameter")
+    if lower == upper:
+        lower, upper = lower - 0.5, upper + 0.5
+    edges = torch.linspace(lower, upper, bins + 1, dtype=torch.float64)
+
+    # bin the local values in range, rounding errors of the indices are corrected with the edges
+    local = x._DNDarray__array.reshape(-1).double().cpu()
+    in_range = (local >= lower) & (local <= upper)
+    local = local[in_range]
+    index = ((local - lower) * (bins / (upper - lower))).long().clamp(max=bins - 1)
+    index -= (local < edges[index]).long()
+    index += ((local >= edges[index + 1]) & (index < bins - 1)).long()
+    if local_weights is not None:
+        local_weights = local_weights.reshape(-1).double().cpu()[in_range]
+    hist = torch.bincount(index, weights=local_weights, minlength=bins)
+    if x.is_distributed():
+        x.comm.Allreduce(MPI.IN_PLACE, hist, MPI.SUM)
+
+    float_type = x._DNDarray__array.dtype
+    if not x._DNDarray__array.is_floating_point():
+        float_type = torch.float32
+    if density:
+        hist = (hist.double() / (hist.sum().double() * (edges[1:] - edges[:-1]))).to(float_type)
+    elif local_weights is not None and weights._DNDarray__array.is_floating_point():
+        hist = hist.to(weights._DNDarray__array.dtype)
+    elif local_weights is not None:
+        hist = hist.to(torch.int64)
+
+    hist = hist.to(x._DNDarray__array.device)
+    edges = edges.to(dtype=float_type, device=x._DNDarray__array.device)
+    return (
+        factories.array(hist, is_split=None, device=x.device, comm=x.comm),
+        factories.array(edges, is_split=None, device=x.device, comm=x.comm),
+    )
+
+
+def __extrema(x):
+    """
+    Determines the global minimum and maximum of x as floats in a single fused reduction, in which the negated
+    minimum and the maximum are maximized together. Both are infinite for empty tensors.
+    """
+    local = x._DNDarray__array
+    extrema = torch.full((2,), -float("inf"), dtype=torch.float64)
+    if local.numel() > 0:
+        extrema[0] = -local.min().double().item()
+        extrema[1] = local.max().double().item()
+    if x.is_distributed():
+        x.comm.Allreduce(MPI.IN_PLACE, extrema, MPI.MAX)
+
+    return -extrema[0].item(), extrema[1].item()
+
+
+def __sanitize_weights(x, weights):
+    """
+    Checks that weights are None or a tensor of the shape and split axis of x, and returns their local tensor.
+    """
+    if weights is None:
+        return None
+    if not isinstance(weights, dndarray.DNDarray):
+        raise TypeError("weights must be None or a ht.DNDarray, but were {}".format(type(weights)))
+    mismatch = weights.gshape != x.gshape or weights.split != x.split
+    # the local shapes may only differ on some processes, all of them raise together
+    if not mismatch and x.split is not None and x.is_distributed():
+        mismatch = x.comm.allreduce(weights.lshape != x.lshape, MPI.LOR)
+    if mismatch:
+        raise ValueError("weights must be distributed like x")
+
+    return weights._DNDarray__array
+
+
 def max(x, axis=None, out=None, keepdim=None):
     # TODO: initial : scalar, optional Issue #101
     """
@@ -689,41 +1038,18 @@ def mean(x, axis=None):
     tensor(0.4730)
     """
 
-    def reduce_means_elementwise(output_shape_i):
+    def reduce_means_elementwise():
         """
-        Function to combine the calculated means together.
-        This does an element-wise update of the calculated means to merge them together using the
-        merge_means function. This function operates using x from the mean function parameters.
-
-        Parameters
-        ----------
-        output_shape_i : iterable
-            Iterable with the dimensions of the output of the mean function.
+        Function to combine the calculated means together. The local moments of all processes are merged in a single
+        Allreduce, see __moments. This function operates using x and axis from the mean function parameters.
 
         Returns
         -------
         means : ht.DNDarray
             The calculated means.
         """
-        if x.lshape[x.split] != 0:
-            mu = torch.mean(x._DNDarray__array, dim=axis)
-        else:
-            mu = factories.zeros(output_shape_i, device=x.device)
-
-        mu_shape = list(mu.shape) if list(mu.shape) else [1]
-
-        mu_tot = factories.zeros(([x.comm.size] + mu_shape), device=x.device)
-        n_tot = factories.zeros(x.comm.size, device=x.device)
-        n_tot[x.comm.rank] = float(x.lshape[x.split])
-        mu_tot[x.comm.rank, :] = mu
-        x.comm.Allreduce(MPI.IN_PLACE, n_tot, MPI.SUM)
-        x.comm.Allreduce(MPI.IN_PLACE, mu_tot, MPI.SUM)
-
-        for i in range(1, x.comm.size):
-            mu_tot[0, :], n_tot[0] = __merge_moments(
-                (mu_tot[0, :], n_tot[0]), (mu_tot[i, :], n_tot[i])
-            )
-        return mu_tot[0][0] if mu_tot[0].size == 1 else mu_tot[0]
+        mu, _, _ = __moments(x, axis)
+        return factories.array(mu.reshape(()) if mu.numel() == 1 else mu, device=x.device)
 
     # ----------------------------------------------------------------------------------------------
 
@@ -735,20 +1061,7 @@ def mean(x, axis=None):
             return factories.array(ret, is_split=None, device=x.device)
         else:
             # if x is distributed and no axis is given: return mean of the whole set
-            mu_in = torch.mean(x._DNDarray__array)
-            if torch.isnan(mu_in):
-                mu_in = 0.0
-            n = x.lnumel
-            mu_tot = factories.zeros((x.comm.size, 2), device=x.device)
-            mu_proc = factories.zeros((x.comm.size, 2), device=x.device)
-            mu_proc[x.comm.rank] = mu_in, float(n)
-            x.comm.Allreduce(mu_proc, mu_tot, MPI.SUM)
-
-            for i in range(1, x.comm.size):
-                mu_tot[0, 0], mu_tot[0, 1] = __merge_moments(
-                    (mu_tot[0, 0], mu_tot[0, 1]), (mu_tot[i, 0], mu_tot[i, 1])
-                )
-            return mu_tot[0][0]
+            return reduce_means_elementwise()
 
     output_shape = list(x.shape)
     if isinstance(axis, (list, tuple, dndarray.DNDarray, torch.Tensor)):
@@ -778,7 +1091,7 @@ def mean(x, axis=None):
 
         if x.split in axis:
             # merge in the direction of the split
-            return reduce_means_elementwise(output_shape)
+            return reduce_means_elementwise()
         else:
             # multiple dimensions which does *not* include the split axis
             # combine along the split axis
@@ -802,7 +1115,7 @@ def mean(x, axis=None):
                 torch.mean(x._DNDarray__array, dim=axis), is_split=None, device=x.device
             )
         elif axis == x.split:
-            return reduce_means_elementwise(output_shape)
+            return reduce_means_elementwise()
         else:
             # singular axis given (axis) not equal to split direction (x.split)
             return factories.array(
@@ -816,27 +1129,126 @@ def mean(x, axis=None):
     )
 
 
-def __merge_moments(m1, m2, bessel=True):
+def mean_var(x, axis=None, ddof=0):
     """
-    Merge two statistical moments. If the length of m1/m2 (must be equal) is == 3 then the second moment (variance)
-    is merged. This function can be expanded to merge other moments according to Reference 1 as well.
-    Note: all tensors/arrays must be either the same size or individual values
+    Calculates and returns the mean and the variance of a tensor in a single pass over the data. If the split axis is
+    reduced, the moments of all processes are merged in a single collective operation.
 
     Parameters
     ----------
-    m1 : tuple
-        Tuple of the moments to merge together, the 0th element is the moment to be merged. The tuple must be
-        sorted in descending order of moments
-    m2 : tuple
-        Tuple of the moments to merge together, the 0th element is the moment to be merged. The tuple must be
-        sorted in descending order of moments
-    bessel : bool
-        Flag for the use of the bessel correction for the calculation of the variance
+    x : ht.DNDarray
+        Values for which the mean and variance are calculated for
+    axis : None, int or iterable of ints, optional
+        Axis/axes along which the mean and variance are computed. Default None reduces all data items.
+    ddof : int, optional
+        Delta Degrees of Freedom: the denominator of the variance is N - ddof, where N represents the number of
+        elements. Default: ddof=0. If ddof=1, the Bessel correction will be applied. Setting ddof > 1 raises a
+        NotImplementedError.
 
     Returns
     -------
-    merged_moments : tuple
-        a tuple of the merged moments
+    means : ht.DNDarray
+        The mean/s, split according to the semantics of mean and var.
+    variances : ht.DNDarray
+        The variance/s, split according to the semantics of mean and var.
+
+    Raises
+    ------
+    TypeError
+        If ddof is not an integer or an axis is not integral.
+    ValueError
+        If ddof is negative, an axis is out of bounds or given twice.
+    NotImplementedError
+        If ddof is larger than 1.
+
+    Examples
+    --------
+    >>> a = ht.array([[1.0, 2.0], [3.0, 4.0], [5.0, 9.0]], split=0)
+    >>> ht.mean_var(a, axis=0)
+    (tensor([3., 5.]), tensor([2.6667, 8.6667]))
+    >>> ht.mean_var(a, ddof=1)
+    (tensor(4.), tensor(8.))
+    """
+    __sanitize_ddof(ddof)
+    axis, split = __reduction_axis(x, axis)
+
+    if x.is_distributed() and split is None:
+        mu, m2, n = __moments(x, axis)
+        var = m2 / (n - ddof)
+    else:
+        local = x._DNDarray__array
+        if not local.is_floating_point():
+            local = local.float()
+        if axis is None:
+            var, mu = torch.var_mean(local, unbiased=bool(ddof))
+        else:
+            var, mu = torch.var_mean(local, dim=axis, unbiased=bool(ddof))
+
+    return (
+        factories.array(mu, is_split=split, device=x.device, comm=x.comm),
+        factories.array(var, is_split=split, device=x.device, comm=x.comm),
+    )
+
+
+def __sanitize_ddof(ddof):
+    """
+    Checks that the delta degrees of freedom are either 0 or 1.
+    """
+    if not isinstance(ddof, int):
+        raise TypeError("ddof must be integer, is {}".format(type(ddof)))
+    elif ddof > 1:
+        raise NotImplementedError("Not implemented for ddof > 1.")
+    elif ddof < 0:
+        raise ValueError("Expected ddof=0 or ddof=1, got {}".format(ddof))
+
+
+def __reduction_axis(x, axis):
+    """
+    Sanitizes the axis/axes of a reduction of x and determines the split axis of its result.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        The reduced values
+    axis : None, int or iterable of ints
+        The axis/axes to reduce
+
+    Returns
+    -------
+    axis : None or tuple of ints
+        The non-negative reduced axes, None if all axes are reduced
+    split : None or int
+        The split axis of the result, None if the split axis of x is reduced
+    """
+    axis = stride_tricks.sanitize_axis(x.shape, tuple(axis) if isinstance(axis, list) else axis)
+    if isinstance(axis, int):
+        axis = (axis,)
+    if axis is not None and len(set(axis)) != len(axis):
+        raise ValueError("duplicate value in axis")
+
+    if axis is None or x.split is None or x.split in axis:
+        return axis, None
+    return axis, x.split - len([dim for dim in axis if dim < x.split])
+
+
+def __moments(x, axis):
+    """
+    Calculates the mean and the sum of squared deviations from the mean (M2) of x along the given axis/axes, which
+    include the split axis of x. Each process computes count, mean and M2 of its local data in a single pass, the
+    moments of all processes are then merged pairwise by MPI_MOMENTS within one Allreduce, whose message size does
+    not depend on the number of processes.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        The distributed values
+    axis : None, int or iterable of ints
+        The sanitized axis/axes to reduce, None reduces all axes
+
+    Returns
+    -------
+    moments : tuple of torch.Tensor
+        The global mean, M2 and element count, all of the shape of the reduced local tensor
 
     References
     ----------
@@ -844,26 +1256,54 @@ def __merge_moments(m1, m2, bessel=True):
         algorithms, IEEE International Conference on Cluster Computing and Workshops, 2009, Oct 2009, New Orleans, LA,
         USA.
     """
-    if len(m1) != len(m2):
-        raise ValueError(
-            "m1 and m2 must be same length, currently {} and {}".format(len(m1, len(m2)))
-        )
-    n1, n2 = m1[-1], m2[-1]
-    mu1, mu2 = m1[-2], m2[-2]
-    n = n1 + n2
-    delta = mu2 - mu1
-    mu = mu1 + n2 * (delta / n)
-    if len(m1) == 2:  # merge means
-        return mu, n
-
-    var1, var2 = m1[-3], m2[-3]
-    if bessel:
-        var_m = (var1 * (n1 - 1) + var2 * (n2 - 1) + (delta ** 2) * n1 * n2 / n) / (n - 1)
-    else:
-        var_m = (var1 * n1 + var2 * n2 + (delta ** 2) * n1 * n2 / n) / n
+    local = x._DNDarray__array
+    if not local.is_floating_point():
+        local = local.float()
+    dims = tuple(range(local.dim())) if axis is None else axis
+    dims = (dims,) if isinstance(dims, int) else tuple(int(dim) for dim in dims)
+    output_shape = [local.shape[i] for i in range(local.dim()) if i not in dims]
+
+    # count, mean and M2 of every output element are packed together, the moments are merged in double precision
+    moments = torch.zeros(output_shape + [3], dtype=torch.float64)
+    n = int(np.prod([local.shape[i] for i in dims]))
+    if n > 0:
+        var, mu = torch.var_mean(local, dim=dims, unbiased=False)
+        moments[..., 0] = n
+        moments[..., 1] = mu.cpu()
+        moments[..., 2] = var.cpu() * n
+    x.comm.Allreduce(MPI.IN_PLACE, [moments.numpy(), __MOMENTS_TYPE], MPI_MOMENTS)
+
+    moments = moments.to(dtype=local.dtype, device=local.device)
+    return moments[..., 1], moments[..., 2], moments[..., 0]
+
+
+def median(x, axis=None, sketch_size=None):
+    """
+    Calculates the median of a tensor along the given axis/axes, see percentile.
 
-    if len(m1) == 3:  # merge vars
-        return var_m, mu, n
+    Parameters
+    ----------
+    x : ht.DNDarray
+        Values for which the median is calculated for
+    axis : None, int or iterable of ints, optional
+        Axis/axes along which the median is computed. Default None reduces all data items.
+    sketch_size : int, optional
+        If given, the median is approximated from quantile sketches of this size per process, see percentile.
+
+    Returns
+    -------
+    medians : ht.DNDarray
+        The median/s, split according to the semantics of mean.
+
+    Examples
+    --------
+    >>> a = ht.array([[10.0, 7.0, 4.0], [3.0, 2.0, 1.0]], split=1)
+    >>> ht.median(a)
+    tensor(3.5000)
+    >>> ht.median(a, axis=0)
+    tensor([6.5000, 4.5000, 2.5000])
+    """
+    return __quantile(x, 0.5, axis, "linear", sketch_size)
 
 
 def min(x, axis=None, out=None, keepdim=None):
@@ -1065,6 +1505,313 @@ def minimum(x1, x2, out=None):
     return lresult
 
 
+def percentile(x, q, axis=None, interpolation="linear", sketch_size=None):
+    """
+    Calculates the q-th percentile/s of a tensor along the given axis/axes. If the split axis is reduced, the
+    percentiles are selected in parallel without moving the data: every process sorts its local values and, in each
+    round, the weighted median of the medians of the remaining local candidates serves as pivot. Counting the
+    candidates below the pivot discards at least a quarter of them, i.e. O(log n) rounds of two small collectives
+    are needed. Alternatively, the percentiles are approximated from mergeable quantile sketches in one collective.
+    Like in numpy, the percentiles of values containing NaN are NaN.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        Values for which the percentiles are calculated for
+    q : float or sequence of floats
+        The percentile/s to compute, must be between 0 and 100 inclusive
+    axis : None, int or iterable of ints, optional
+        Axis/axes along which the percentiles are computed. Default None reduces all data items.
+    interpolation : str, optional
+        The interpolation between the two nearest data points i < j of a percentile, one of "linear" (default),
+        "lower", "higher", "midpoint" and "nearest", see numpy.percentile.
+    sketch_size : int, optional
+        If given, every process summarizes its values along the axis/axes by this many evenly spaced order
+        statistics, the percentiles are determined from the merged summaries. The rank error is about
+        1 / sketch_size of the number of values.
+
+    Returns
+    -------
+    percentiles : ht.DNDarray
+        The percentile/s. If q is a sequence, the first axis of the result corresponds to the percentiles. The split
+        axis follows the semantics of mean.
+
+    Raises
+    ------
+    TypeError
+        If sketch_size is not an integer.
+    ValueError
+        If q is not within [0, 100] or has more than one dimension, the interpolation is unknown, the sketch_size is
+        not positive, an axis is out of bounds or given twice or there are no values to reduce.
+
+    Examples
+    --------
+    >>> a = ht.array([[10.0, 7.0, 4.0], [3.0, 2.0, 1.0]], split=0)
+    >>> ht.percentile(a, 50)
+    tensor(3.5000)
+    >>> ht.percentile(a, [25, 75], axis=1)
+    tensor([[5.5000, 1.5000],
+            [8.5000, 2.5000]])
+    >>> ht.percentile(a, 50, axis=0, interpolation="lower")
+    tensor([3., 2., 1.])
+    """
+    q = __sanitize_q(q)
+    if ((q < 0.0) | (q > 100.0)).any():
+        raise ValueError("percentiles must be in the range [0, 100]")
+
+    return __quantile(x, q / 100.0, axis, interpolation, sketch_size)
+
+
+def quantile(x, q, axis=None, interpolation="linear", sketch_size=None):
+    """
+    Calculates the q-th quantile/s of a tensor along the given axis/axes, see percentile.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        Values for which the quantiles are calculated for
+    q : float or sequence of floats
+        The quantile/s to compute, must be between 0 and 1 inclusive
+    axis : None, int or iterable of ints, optional
+        Axis/axes along which the quantiles are computed. Default None reduces all data items.
+    interpolation : str, optional
+        The interpolation between the two nearest data points, see percentile.
+    sketch_size : int, optional
+        If given, the quantiles are approximated from quantile sketches of this size per process, see percentile.
+
+    Returns
+    -------
+    quantiles : ht.DNDarray
+        The quantile/s. If q is a sequence, the first axis of the result corresponds to the quantiles.
+
+    Examples
+    --------
+    >>> a = ht.arange(11, split=0)
+    >>> ht.quantile(a, [0.1, 0.55])
+    tensor([1.0000, 5.5000])
+    """
+    q = __sanitize_q(q)
+    if ((q < 0.0) | (q > 1.0)).any():
+        raise ValueError("quantiles must be in the range [0, 1]")
+
+    return __quantile(x, q, axis, interpolation, sketch_size)
+
+
+def __sanitize_q(q):
+    """
+    Converts the requested percentiles/quantiles to a 0- or 1-dimensional float64 tensor.
+    """
+    if isinstance(q, dndarray.DNDarray):
+        q = q.numpy()
+    elif isinstance(q, torch.Tensor):
+        q = q.cpu().numpy()
+    q = torch.from_numpy(np.array(q, dtype=np.float64))
+    if q.dim() > 1:
+        raise ValueError("q must be a scalar or 1-dimensional, but has shape {}".format(q.shape))
+
+    return q
+
+
+def __quantile(x, q, axis, interpolation, sketch_size):
+    """
+    Calculates the quantiles q, given as float64 tensor of fractions, of x along axis. See percentile.
+    """
+    if interpolation not in ("linear", "lower", "higher", "midpoint", "nearest"):
+        raise ValueError("unknown interpolation {}".format(interpolation))
+    if sketch_size is not None:
+        if not isinstance(sketch_size, int):
+            raise TypeError("sketch_size must be None or int, but was {}".format(type(sketch_size)))
+        if sketch_size < 1:
+            raise ValueError("sketch_size must be positive, but was {}".format(sketch_size))
+    axis, split = __reduction_axis(x, axis)
+
+    # sort the values along the reduced axes, which are moved to the end and flattened, locally
+    local = x._DNDarray__array
+    dims = tuple(range(local.dim())) if axis is None else axis
+    kept = [dim for dim in range(local.dim()) if dim not in dims]
+    output_shape = [local.shape[dim] for dim in kept]
+    n = int(np.prod([x.gshape[dim] for dim in dims]))
+    if n == 0:
+        raise ValueError("cannot compute quantiles of an empty axis")
+    local_n = int(np.prod([local.shape[dim] for dim in dims]))
+    rows = local.permute(*kept, *dims) if local.dim() else local
+    rows = rows.reshape(int(np.prod(output_shape)), local_n)
+    rows = rows.sort(dim=-1)[0]
+
+    # the ranks of the data points below and above each quantile, and the weight of the upper one
+    positions = q.reshape(-1) * (n - 1)
+    if interpolation == "lower":
+        below = above = positions.floor()
+    elif interpolation == "higher":
+        below = above = positions.ceil()
+    elif interpolation == "nearest":
+        below = above = positions.round()
+    else:
+        below, above = positions.floor(), positions.ceil()
+    weight = positions - below if interpolation == "linear" else torch.full_like(positions, 0.5)
+
+    # like in numpy, the quantiles of output elements with NaN values are NaN, they are not selected
+    distributed = x.is_distributed() and split is None
+    nans = torch.zeros(rows.shape[0], dtype=torch.bool)
+    if rows.is_floating_point():
+        nans = rows.isnan().any(dim=-1).cpu()
+        if distributed:
+            x.comm.Allreduce(MPI.IN_PLACE, nans, MPI.LOR)
+
+    # select the data points of all quantiles for every output element
+    ranks = torch.cat((below, above)).long().repeat(rows.shape[0])
+    elements = torch.arange(rows.shape[0]).repeat_interleave(2 * positions.numel())
+    selected = ~nans[elements]
+    elements, ranks = elements[selected], ranks[selected]
+    if not distributed:
+        values = rows[elements.to(rows.device), ranks.to(rows.device)].cpu()
+    elif sketch_size is None:
+        values = __select(x.comm, rows, elements, ranks)
+    else:
+        values = __sketch_select(x.comm, rows, elements, ranks, sketch_size)
+    if not selected.all():
+        values = torch.full(selected.shape, float("nan"), dtype=values.dtype).masked_scatter_(
+            selected, values
+        )
+
+    # the selected values keep their type unless they are interpolated, e.g. int64 beyond the float64 precision
+    values = values.reshape(-1, 2, positions.numel())
+    if interpolation in ("lower", "higher", "nearest"):
+        result = values[:, 0]
+    else:
+        values = values.double()
+        result = values[:, 0] + (values[:, 1] - values[:, 0]) * weight
+    result = result.t().reshape([positions.numel()] + output_shape)
+    if q.dim() == 0:
+        result = result[0]
+    elif split is not None:
+        split += 1
+
+    if interpolation in ("lower", "higher", "nearest"):
+        result = result.to(local.dtype)
+    elif not local.is_floating_point():
+        result = result.to(torch.float32)
+    else:
+        result = result.to(local.dtype)
+
+    return factories.array(result.to(local.device), is_split=split, device=x.device, comm=x.comm)
+
+
+def __searchsorted(rows, elements, values, right=False):
+    """
+    Vectorized binary search, i.e. the number of entries of the sorted row elements[i] of rows smaller than (or equal
+    to, if right) values[i].
+    """
+    lo = torch.zeros(values.shape, dtype=torch.int64, device=rows.device)
+    hi = torch.full_like(lo, rows.shape[1])
+    for _ in range(int(np.ceil(np.log2(rows.shape[1] + 1)))):
+        active = lo < hi
+        middle = (lo + hi) // 2
+        entries = rows[elements, middle.clamp(max=rows.shape[1] - 1)]
+        smaller = entries <= values if right else entries < values
+        lo = torch.where(active & smaller, middle + 1, lo)
+        hi = torch.where(active & ~smaller, middle, hi)
+
+    return lo
+
+
+def __select(comm, rows, elements, ranks):
+    """
+    Selects the value of the given global rank from the distributed sorted rows for each pair of row elements[i] and
+    ranks[i] by parallel weighted median of medians selection. Each process keeps a window of candidates in its
+    sorted rows, the candidates of all processes are narrowed down around the weighted median of the window medians.
+    The medians are exchanged exactly, i.e. as int64 for int64 data and as float64 otherwise, hence the pivot is
+    always one of the candidates and every round discards at least it.
+    """
+    device = rows.device
+    elements = elements.to(device)
+    exchange_type = torch.int64 if rows.dtype == torch.int64 else torch.float64
+    if exchange_type == torch.int64:
+        unused = torch.iinfo(torch.int64).max
+    else:
+        unused = float("inf")
+    k = ranks.clone()
+    lo = torch.zeros_like(ranks)
+    hi = torch.full_like(ranks, rows.shape[1])
+    values = torch.zeros(ranks.shape, dtype=exchange_type)
+    active = torch.ones(ranks.shape, dtype=torch.bool)
+
+    while active.any():
+        # median and number of the local candidates
+        width = torch.where(active, hi - lo, torch.zeros_like(lo))
+        if rows.shape[1] > 0:
+            middle = (lo + (width - 1).clamp(min=0) // 2).clamp(max=rows.shape[1] - 1)
+            medians = rows[elements, middle.to(device)].to(exchange_type).cpu()
+        else:
+            medians = torch.zeros(ranks.shape, dtype=exchange_type)
+        proposals = torch.stack((medians, width.to(exchange_type)), dim=1)
+        gathered = torch.empty((comm.size * proposals.shape[0], 2), dtype=exchange_type)
+        comm.Allgather(proposals, gathered)
+        gathered = gathered.reshape(comm.size, -1, 2)
+
+        # the pivot is the median of the local medians, weighted by the number of candidates
+        weights = gathered[..., 1]
+        medians = torch.where(weights > 0, gathered[..., 0], torch.full_like(weights, unused))
+        medians, order = medians.sort(dim=0)
+        cumulative = weights.gather(0, order).cumsum(dim=0)
+        index = (2 * cumulative < weights.sum(dim=0)).sum(dim=0).clamp(max=comm.size - 1)
+        pivot = medians.gather(0, index.unsqueeze(0))[0]
+
+        # count the candidates smaller than and at most equal to the pivot on all processes
+        local_pivot = pivot.to(device=device, dtype=rows.dtype)
+        less = __searchsorted(rows, elements, local_pivot).cpu()
+        less_equal = __searchsorted(rows, elements, local_pivot, right=True).cpu()
+        less = torch.max(torch.min(less, hi), lo)
+        less_equal = torch.max(torch.min(less_equal, hi), lo)
+        counts = torch.stack((less - lo, less_equal - lo), dim=1)
+        comm.Allreduce(MPI.IN_PLACE, counts, MPI.SUM)
+
+        # either the pivot has the requested rank or the candidates beyond it are discarded
+        found = active & (k >= counts[:, 0]) & (k < counts[:, 1])
+        left = active & (k < counts[:, 0])
+        right = active & (k >= counts[:, 1])
+        values = torch.where(found, pivot, values)
+        hi = torch.where(left, less, hi)
+        lo = torch.where(right, less_equal, lo)
+        k = torch.where(right, k - counts[:, 1], k)
+        active = left | right
+
+    return values
+
+
+def __sketch_select(comm, rows, elements, ranks, sketch_size):
+    """
+    Approximates the value of the given global rank for each pair of row elements[i] and ranks[i]. Every process
+    summarizes its sorted rows by sketch_size evenly spaced order statistics, each representing an equal share of its
+    values. The summaries are merged with one Allgather and searched for the cumulative weight of the rank.
+    """
+    count, length = rows.shape
+    if length <= sketch_size:
+        samples = rows.double().cpu()
+        shares = torch.ones(length, dtype=torch.float64)
+    else:
+        index = torch.arange(sketch_size, dtype=torch.float64) + 0.5
+        index = (index * length / sketch_size).long()
+        samples = rows[:, index.to(rows.device)].double().cpu()
+        shares = torch.full((sketch_size,), length / sketch_size, dtype=torch.float64)
+
+    # unused entries of the summaries carry no weight
+    sketch = torch.zeros((count, sketch_size, 2), dtype=torch.float64)
+    sketch[..., 0] = float("inf")
+    sketch[:, : samples.shape[1], 0] = samples
+    sketch[:, : samples.shape[1], 1] = shares
+    gathered = torch.empty((comm.size * count * sketch_size, 2), dtype=torch.float64)
+    comm.Allgather(sketch.reshape(-1, 2), gathered)
+    gathered = gathered.reshape(comm.size, count, sketch_size, 2).transpose(0, 1)
+    gathered = gathered.reshape(count, comm.size * sketch_size, 2)
+
+    samples, order = gathered[..., 0].sort(dim=1)
+    cumulative = gathered[..., 1].gather(1, order).cumsum(dim=1)
+    index = (cumulative[elements] <= ranks.double().unsqueeze(1)).sum(dim=1)
+
+    return samples[elements, index.clamp(max=samples.shape[1] - 1)]
+
+
 def mpi_argmax(a, b, _):
     lhs = torch.from_numpy(np.frombuffer(a, dtype=np.float64))
     rhs = torch.from_numpy(np.frombuffer(b, dtype=np.float64))
@@ -1100,6 +1847,48 @@ def mpi_argmin(a, b, _):
 MPI_ARGMIN = MPI.Op.Create(mpi_argmin, commute=True)
 
 
+def __merge_moments(lhs, rhs):
+    """
+    Merges the count, mean and M2 columns of lhs into rhs, according to Chan et al.
+    """
+    n = lhs[:, 0] + rhs[:, 0]
+    weight = torch.where(n > 0, lhs[:, 0] / n, torch.zeros_like(n))
+    delta = lhs[:, 1] - rhs[:, 1]
+
+    rhs[:, 2] += lhs[:, 2] + delta ** 2 * rhs[:, 0] * weight
+    rhs[:, 1] += delta * weight
+    rhs[:, 0] = n
+
+
+def mpi_moments(a, b, _):
+    lhs = torch.from_numpy(np.frombuffer(a, dtype=np.float64)).reshape(-1, 3)
+    rhs = torch.from_numpy(np.frombuffer(b, dtype=np.float64)).reshape(-1, 3)
+
+    # each element consists of the count, mean and M2 of a partition
+    __merge_moments(lhs, rhs)
+
+
+MPI_MOMENTS = MPI.Op.Create(mpi_moments, commute=True)
+# the count, mean and M2 of an element form one MPI element, reductions never split them
+__MOMENTS_TYPE = MPI.DOUBLE.Create_contiguous(3).Commit()
+
+
+def mpi_describe(a, b, _):
+    lhs = torch.from_numpy(np.frombuffer(a, dtype=np.float64)).reshape(-1, 7)
+    rhs = torch.from_numpy(np.frombuffer(b, dtype=np.float64)).reshape(-1, 7)
+
+    # each element holds count, mean, M2, sum, sum of squares, minimum and maximum of a partition
+    __merge_moments(lhs[:, :3], rhs[:, :3])
+    rhs[:, 3:5] += lhs[:, 3:5]
+    rhs[:, 5] = torch.min(lhs[:, 5], rhs[:, 5])
+    rhs[:, 6] = torch.max(lhs[:, 6], rhs[:, 6])
+
+
+MPI_DESCRIBE = MPI.Op.Create(mpi_describe, commute=True)
+__DESCRIBE_TYPE = MPI.DOUBLE.Create_contiguous(7).Commit()
+__DESCRIBE_STATS = ("count", "sum", "sumsq", "min", "max", "mean", "var", "std")
+
+
 def std(x, axis=None, ddof=0, **kwargs):
     """
     Calculates and returns the standard deviation of a tensor with the bessel correction.
@@ -1224,47 +2013,19 @@ def var(x, axis=None, ddof=0, **kwargs):
         else:
             bessel = bool(ddof)
 
-    def reduce_vars_elementwise(output_shape_i):
+    def reduce_vars_elementwise():
         """
-        Function to combine the calculated vars together. This does an element-wise update of the
-        calculated vars to merge them together using the merge_vars function. This function operates
-         using x from the var function parameters.
-
-        Parameters
-        ----------
-        output_shape_i : iterable
-            Iterable with the dimensions of the output of the var function.
+        Function to combine the calculated vars together. The local moments of all processes are merged in a single
+        Allreduce, see __moments. This function operates using x and axis from the var function parameters.
 
         Returns
         -------
         variances : ht.DNDarray
             The calculated variances.
         """
-
-        if x.lshape[x.split] != 0:
-            mu = torch.mean(x._DNDarray__array, dim=axis)
-            var = torch.var(x._DNDarray__array, dim=axis, unbiased=bessel)
-        else:
-            mu = factories.zeros(output_shape_i, dtype=x.dtype, device=x.device)
-            var = factories.zeros(output_shape_i, dtype=x.dtype, device=x.device)
-
-        var_shape = list(var.shape) if list(var.shape) else [1]
-
-        var_tot = factories.zeros(([x.comm.size, 2] + var_shape), dtype=x.dtype, device=x.device)
-        n_tot = factories.zeros(x.comm.size, device=x.device)
-        var_tot[x.comm.rank, 0, :] = var
-        var_tot[x.comm.rank, 1, :] = mu
-        n_tot[x.comm.rank] = float(x.lshape[x.split])
-        x.comm.Allreduce(MPI.IN_PLACE, var_tot, MPI.SUM)
-        x.comm.Allreduce(MPI.IN_PLACE, n_tot, MPI.SUM)
-
-        for i in range(1, x.comm.size):
-            var_tot[0, 0, :], var_tot[0, 1, :], n_tot[0] = __merge_moments(
-                (var_tot[0, 0, :], var_tot[0, 1, :], n_tot[0]),
-                (var_tot[i, 0, :], var_tot[i, 1, :], n_tot[i]),
-                bessel=bessel,
-            )
-        return var_tot[0, 0, :][0] if var_tot[0, 0, :].size == 1 else var_tot[0, 0, :]
+        _, m2, n = __moments(x, axis)
+        var = m2 / (n - 1) if bessel else m2 / n
+        return factories.array(var.reshape(()) if var.numel() == 1 else var, device=x.device)
 
     # ----------------------------------------------------------------------------------------------
     if axis is None:  # no axis given
@@ -1273,27 +2034,7 @@ def var(x, axis=None, ddof=0, **kwargs):
             return factories.array(ret)
 
         else:  # case for full matrix calculation (axis is None)
-            mu_in = torch.mean(x._DNDarray__array)
-            var_in = torch.var(x._DNDarray__array, unbiased=bessel)
-            # Nan is returned when local tensor is empty
-            if torch.isnan(var_in):
-                var_in = 0.0
-            if torch.isnan(mu_in):
-                mu_in = 0.0
-
-            n = x.lnumel
-            var_tot = factories.zeros((x.comm.size, 3), dtype=x.dtype, device=x.device)
-            var_proc = factories.zeros((x.comm.size, 3), dtype=x.dtype, device=x.device)
-            var_proc[x.comm.rank] = var_in, mu_in, float(n)
-            x.comm.Allreduce(var_proc, var_tot, MPI.SUM)
-
-            for i in range(1, x.comm.size):
-                var_tot[0, 0], var_tot[0, 1], var_tot[0, 2] = __merge_moments(
-                    (var_tot[0, 0], var_tot[0, 1], var_tot[0, 2]),
-                    (var_tot[i, 0], var_tot[i, 1], var_tot[i, 2]),
-                    bessel=bessel,
-                )
-            return var_tot[0][0]
+            return reduce_vars_elementwise()
 
     else:  # axis is given
         # case for var in one dimension
@@ -1322,16 +2063,18 @@ def var(x, axis=None, ddof=0, **kwargs):
             # multiple dimensions
             if x.split is None:
                 return factories.array(
-                    torch.var(x._DNDarray__array, dim=axis), is_split=x.split, device=x.device
+                    torch.var(x._DNDarray__array, dim=axis, unbiased=bessel),
+                    is_split=x.split,
+                    device=x.device,
                 )
             if x.split in axis:
                 # merge in the direction of the split
-                return reduce_vars_elementwise(output_shape)
+                return reduce_vars_elementwise()
             else:
                 # multiple dimensions which does *not* include the split axis
                 # combine along the split axis
                 return factories.array(
-                    torch.var(x._DNDarray__array, dim=axis),
+                    torch.var(x._DNDarray__array, dim=axis, unbiased=bessel),
                     is_split=x.split if x.split < len(output_shape) else len(output_shape) - 1,
                     device=x.device,
                 )
@@ -1350,10 +2093,10 @@ def var(x, axis=None, ddof=0, **kwargs):
                     device=x.device,
                 )
             elif axis == x.split:  # x is distributed and axis chosen is == to split
-                return reduce_vars_elementwise(output_shape)
+                return reduce_vars_elementwise()
             else:
                 # singular axis given (axis) not equal to split direction (x.split)
-                lcl = torch.var(x._DNDarray__array, dim=axis, keepdim=False)
+                lcl = torch.var(x._DNDarray__array, dim=axis, unbiased=bessel)
                 return factories.array(
                     lcl,
                     is_split=x.split if axis > x.split else x.split - 1,
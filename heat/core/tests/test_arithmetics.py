@@ -46,8 +46,25 @@ class TestArithmetics(unittest.TestCase):
         self.assertTrue(ht.equal(ht.add(self.a_tensor, self.an_int_scalar), result))
         self.assertTrue(ht.equal(ht.add(self.a_split_tensor, self.a_tensor), result))
 
+        # the result is written into the process-local data of out, which keeps its distribution
+        out = ht.zeros((2, 2), split=1, device=ht_device)
+        local_data = out._DNDarray__array.data_ptr()
+        self.assertIs(ht.add(self.a_split_tensor, self.a_tensor, out=out), out)
+        self.assertTrue(ht.equal(out, result))
+        self.assertEqual(out.split, 1)
+        self.assertEqual(out._DNDarray__array.data_ptr(), local_data)
+        out = ht.zeros((2, 2), dtype=ht.float64, device=ht_device)
+        ht.add(self.a_split_tensor, self.a_scalar, out=out)
+        self.assertEqual(out.dtype, ht.float64)
+        self.assertIsNone(out.split)
+        self.assertTrue(ht.equal(out, ht.full((2, 2), 4.0, device=ht_device)))
+
         with self.assertRaises(ValueError):
             ht.add(self.a_tensor, self.another_vector)
+        with self.assertRaises(ValueError):
+            ht.add(self.a_tensor, self.a_scalar, out=ht.zeros((2,), device=ht_device))
+        with self.assertRaises(TypeError):
+            ht.add(self.a_tensor, self.a_scalar, out=torch.zeros((2, 2), device=device))
         with self.assertRaises(TypeError):
             ht.add(self.a_tensor, self.errorneous_type)
         with self.assertRaises(TypeError):
@@ -161,6 +178,78 @@ class TestArithmetics(unittest.TestCase):
         with self.assertRaises(TypeError):
             ht.bitwise_xor(self.an_int_scalar, self.a_scalar)
 
+    def test_cumprod(self):
+        np_data = (np.arange(7 * 4 * 3).reshape(7, 4, 3) % 3 + 1).astype(np.float64)
+        for split in [None, 0, 1, 2]:
+            x = ht.array(np_data, split=split, device=ht_device)
+            for axis in [0, 1, -1]:
+                result = ht.cumprod(x, axis)
+                self.assertIsInstance(result, ht.DNDarray)
+                self.assertEqual(result.shape, x.shape)
+                self.assertEqual(result.split, split)
+                self.assertEqual(result.dtype, ht.float64)
+                self.assertTrue(np.allclose(result.numpy(), np.cumprod(np_data, axis=axis)))
+
+        # integer promotion, zeros, empty local chunks and out
+        x = ht.array([2, 0, 3], dtype=ht.int32, split=0, device=ht_device)
+        result = x.cumprod(0)
+        self.assertEqual(result.dtype, ht.int64)
+        self.assertTrue((result.numpy() == [2, 0, 0]).all())
+        x = ht.array([1, 2, 3], split=0, device=ht_device)
+        out = ht.empty(3, split=0, device=ht_device)
+        result = ht.cumprod(x, 0, dtype=ht.float32, out=out)
+        self.assertIs(result, out)
+        self.assertEqual(out.dtype, ht.float32)
+        self.assertTrue((out.numpy() == [1.0, 2.0, 6.0]).all())
+
+        with self.assertRaises(TypeError):
+            ht.cumprod(np_data, 0)
+        with self.assertRaises(TypeError):
+            ht.cumprod(x, None)
+        with self.assertRaises(TypeError):
+            ht.cumprod(x, 0, out=np.empty(3))
+        with self.assertRaises(ValueError):
+            ht.cumprod(x, 1)
+        with self.assertRaises(ValueError):
+            ht.cumprod(x, 0, out=ht.empty(4, device=ht_device))
+
+    def test_cumsum(self):
+        np_data = np.arange(9 * 5 * 2, dtype=np.float32).reshape(9, 5, 2) % 7 - 3.0
+        for split in [None, 0, 1, 2]:
+            x = ht.array(np_data, split=split, device=ht_device)
+            for axis in [0, 1, 2, -2]:
+                result = ht.cumsum(x, axis)
+                self.assertIsInstance(result, ht.DNDarray)
+                self.assertEqual(result.shape, x.shape)
+                self.assertEqual(result.split, split)
+                self.assertEqual(result.dtype, ht.float32)
+                self.assertTrue(np.allclose(result.numpy(), np.cumsum(np_data, axis=axis)))
+            result = x.cumsum(0, dtype=ht.float64)
+            self.assertEqual(result.dtype, ht.float64)
+            self.assertTrue(np.allclose(result.numpy(), np.cumsum(np_data, axis=0)))
+
+        # integer promotion, empty local chunks and out
+        x = ht.arange(2, dtype=ht.int32, split=0, device=ht_device)
+        result = ht.cumsum(x, 0)
+        self.assertEqual(result.dtype, ht.int64)
+        self.assertTrue((result.numpy() == [0, 1]).all())
+        x = ht.zeros((0, 3), split=0, device=ht_device)
+        self.assertEqual(ht.cumsum(x, 0).shape, (0, 3))
+        x = ht.ones((5, 2), split=0, device=ht_device)
+        out = ht.empty((5, 2), split=0, device=ht_device)
+        result = ht.cumsum(x, 0, out=out)
+        self.assertIs(result, out)
+        self.assertTrue((out.numpy() == np.cumsum(np.ones((5, 2)), axis=0)).all())
+
+        with self.assertRaises(TypeError):
+            ht.cumsum(np_data, 0)
+        with self.assertRaises(TypeError):
+            ht.cumsum(x, "0")
+        with self.assertRaises(ValueError):
+            ht.cumsum(x, 2)
+        with self.assertRaises(ValueError):
+            ht.cumsum(x, 0, out=ht.empty((2, 5), device=ht_device))
+
     def test_diff(self):
         ht_array = ht.random.rand(20, 20, 20, split=None, device=ht_device)
         arb_slice = [0] * 3
@@ -302,8 +391,16 @@ class TestArithmetics(unittest.TestCase):
         self.assertTrue(ht.equal(ht.mul(self.a_tensor, self.an_int_scalar), result))
         self.assertTrue(ht.equal(ht.mul(self.a_split_tensor, self.a_tensor), result))
 
+        out = ht.zeros((2, 2), dtype=ht.float64, split=0, device=ht_device)
+        ht.mul(self.a_tensor.copy().resplit_(1), self.an_int_scalar, out=out)
+        self.assertEqual(out.dtype, ht.float64)
+        self.assertEqual(out.split, 0)
+        self.assertTrue(ht.equal(out, result))
+
         with self.assertRaises(ValueError):
             ht.mul(self.a_tensor, self.another_vector)
+        with self.assertRaises(TypeError):
+            ht.mul(self.a_tensor, self.a_scalar, out=ht.zeros((2, 2), dtype=ht.bool))
         with self.assertRaises(TypeError):
             ht.mul(self.a_tensor, self.errorneous_type)
         with self.assertRaises(TypeError):
@@ -202,6 +202,52 @@ class TestCommunication(unittest.TestCase):
         if ht.get_device().device_type == "cpu" or ht.communication.CUDA_AWARE_MPI:
             self.assertFalse(both_non_contiguous_out._DNDarray__array.is_contiguous())
 
+    def test_derived_types_cache(self):
+        comm = ht.core.communication.MPICommunication
+        comm.free_derived_types()
+        info = comm.derived_types_info()
+        self.assertEqual(info["size"], 0)
+        self.assertEqual(info["hit_rate"], 0.0)
+
+        # equally shaped and strided buffers share the committed derived type
+        first = torch.ones((3, 2), device=device).T
+        second = torch.zeros((3, 2), device=device).T
+        first_type, elements = comm.mpi_type_and_elements_of(first, None, None)
+        second_type, _ = comm.mpi_type_and_elements_of(second, None, None)
+        self.assertEqual(elements, 2)
+        self.assertIs(first_type, second_type)
+        info = comm.derived_types_info()
+        self.assertEqual((info["hits"], info["misses"], info["size"]), (1, 1, 1))
+        self.assertEqual(info["hit_rate"], 0.5)
+
+        # contiguous buffers use the native types and do not touch the cache
+        comm.mpi_type_and_elements_of(first.contiguous(), None, None)
+        self.assertEqual(comm.derived_types_info()["misses"], 1)
+
+        # the least recently used type is evicted once the capacity is exceeded
+        capacity = comm.derived_types_capacity
+        comm.derived_types_capacity = 2
+        try:
+            comm.mpi_type_and_elements_of(torch.ones((4, 2), device=device).T, None, None)
+            comm.mpi_type_and_elements_of(torch.ones((5, 2), device=device).T, None, None)
+            self.assertEqual(comm.derived_types_info()["size"], 2)
+            third_type, _ = comm.mpi_type_and_elements_of(first, None, None)
+            self.assertIsNot(third_type, first_type)
+        finally:
+            comm.derived_types_capacity = capacity
+
+        # data is still transmitted correctly with a cached type
+        data = ht.ones((3, 2), device=ht_device).T
+        out = ht.zeros((2, 3), device=ht_device)
+        for _ in range(2):
+            req = data.comm.Isend(data, dest=data.comm.rank)
+            out.comm.Recv(out, source=out.comm.rank)
+            req.Wait()
+        self.assertTrue((out._DNDarray__array == 1).all())
+
+        comm.free_derived_types()
+        self.assertEqual(comm.derived_types_info()["size"], 0)
+
     def test_default_comm(self):
         # default comm is world
         a = ht.zeros((4, 5), device=ht_device)
@@ -505,6 +551,46 @@ class TestCommunication(unittest.TestCase):
         self.assertTrue(out._DNDarray__array.is_contiguous())
         self.assertTrue((out._DNDarray__array == data.comm.size).all())
 
+    def test_allreduce_init(self):
+        # persistent reduction of a separate send buffer, restarted on changing contents
+        data = ht.ones((10, 2), dtype=ht.float32, device=ht_device)
+        out = ht.zeros_like(data, device=ht_device)
+        req = data.comm.Allreduce_init(data, out, op=ht.MPI.SUM)
+        self.assertIsInstance(req, ht.communication.MPIPersistentRequest)
+        for i in range(1, 4):
+            data._DNDarray__array.fill_(i)
+            req.start()
+            req.wait()
+            self.assertTrue((out._DNDarray__array == i * data.comm.size).all())
+        req.Free()
+
+        # in-place reduction
+        buf = torch.ones((3, 4), dtype=torch.int64, device=device)
+        req = ht.MPI_WORLD.allreduce_init(ht.MPI.IN_PLACE, buf, op=ht.MPI.MAX)
+        for i in range(3):
+            buf.fill_(ht.MPI_WORLD.rank + i)
+            req.Start()
+            req.Wait()
+            self.assertTrue((buf == ht.MPI_WORLD.size - 1 + i).all())
+        req.free()
+
+        # batched start and completion
+        sums = torch.zeros(5, dtype=torch.float64, device=device)
+        maxs = torch.zeros(5, dtype=torch.float64, device=device)
+        reqs = [
+            ht.MPI_WORLD.Allreduce_init(ht.MPI.IN_PLACE, sums),
+            ht.MPI_WORLD.Allreduce_init(ht.MPI.IN_PLACE, maxs, op=ht.MPI.MAX),
+        ]
+        for i in range(2):
+            sums.fill_(1.0)
+            maxs.fill_(float(ht.MPI_WORLD.rank + i))
+            ht.communication.MPIPersistentRequest.Startall(reqs)
+            ht.communication.MPIRequest.Waitall(reqs)
+            self.assertTrue((sums == ht.MPI_WORLD.size).all())
+            self.assertTrue((maxs == ht.MPI_WORLD.size - 1 + i).all())
+        for req in reqs:
+            req.Free()
+
     def test_alltoall(self):
         # contiguous data
         data = ht.array([[ht.MPI_WORLD.rank] * 10] * ht.MPI_WORLD.size, device=ht_device)
@@ -725,6 +811,18 @@ class TestCommunication(unittest.TestCase):
             (data._DNDarray__array == torch.ones((5, 2), dtype=torch.float32, device=device)).all()
         )
 
+    def test_bcast_init(self):
+        data = ht.zeros(10, dtype=ht.int64, device=ht_device)
+        req = data.comm.Bcast_init(data, root=0)
+        self.assertIsInstance(req, ht.communication.MPIPersistentRequest)
+        for i in range(3):
+            if data.comm.rank == 0:
+                data._DNDarray__array.copy_(torch.arange(10, device=device) + i)
+            req.start()
+            req.wait()
+            self.assertTrue((data._DNDarray__array == torch.arange(10, device=device) + i).all())
+        req.Free()
+
     def test_exscan(self):
         # contiguous data
         data = ht.ones((5, 3), dtype=ht.int64, device=ht_device)
@@ -940,6 +1038,44 @@ class TestCommunication(unittest.TestCase):
                 (output._DNDarray__array == torch.ones(output_count, 10, device=device)).all()
             )
 
+    def test_hierarchical(self):
+        comm = ht.communication.MPICommunication(ht.MPI.COMM_WORLD.Dup(), hierarchical=True)
+        self.assertTrue(comm.hierarchical)
+        self.assertLessEqual(comm.node.size, comm.size)
+        self.assertEqual(comm.leaders is not None, comm.node.rank == 0)
+
+        # reductions with changing buffer sizes, reusing and growing the shared memory
+        for shape in [(3,), (10, 2), (4, 5, 6)]:
+            data = torch.full(shape, comm.rank + 1, dtype=torch.float64)
+            out = torch.zeros(shape, dtype=torch.float64)
+            comm.Allreduce(data, out, op=ht.MPI.SUM)
+            self.assertTrue((out == comm.size * (comm.size + 1) / 2).all())
+
+        data = torch.full((5, 3), comm.rank, dtype=torch.int64).T
+        comm.Allreduce(ht.MPI.IN_PLACE, data, op=ht.MPI.MAX)
+        self.assertTrue((data == comm.size - 1).all())
+
+        # gathering along every axis of unevenly distributed data
+        full = torch.arange(7 * 5 * 3, dtype=torch.float32).reshape(7, 5, 3)
+        for axis in range(3):
+            counts, displs, _ = comm.counts_displs_shape(full.shape, axis)
+            local = full.narrow(axis, displs[comm.rank], counts[comm.rank])
+            out = torch.zeros_like(full)
+            comm.Allgatherv(local, (out, counts, displs), recv_axis=axis)
+            self.assertTrue((out == full).all())
+
+        # gathering a distributed array
+        a = ht.arange(17, split=0, comm=comm)
+        a.resplit_(None)
+        self.assertIsNone(a.split)
+        self.assertTrue((a._DNDarray__array == torch.arange(17, device=a.device.torch_device)).all())
+
+        # freeing the communicator releases the shared memory and the node communicators
+        comm.Free()
+        self.assertIsNone(comm._MPICommunication__window)
+        self.assertIsNone(comm._MPICommunication__node)
+        self.assertEqual(comm.handle, ht.MPI.COMM_NULL)
+
     def test_iallgather(self):
         try:
             # contiguous data
@@ -1113,6 +1249,19 @@ class TestCommunication(unittest.TestCase):
         except NotImplementedError:
             pass
 
+    def test_waitall(self):
+        data = ht.ones((4, 3), dtype=ht.float32, device=ht_device)
+        outs = [ht.zeros_like(data, device=ht_device) for _ in range(3)]
+        reqs = [data.comm.Iallreduce(data, out, op=ht.MPI.SUM) for out in outs]
+        buf = ht.arange(5, device=ht_device)
+        if data.comm.rank != 0:
+            buf = ht.zeros_like(buf, device=ht_device)
+        reqs.append(data.comm.Ibcast(buf, root=0))
+        ht.communication.MPIRequest.waitall(reqs)
+        for out in outs:
+            self.assertTrue((out._DNDarray__array == data.comm.size).all())
+        self.assertTrue((buf._DNDarray__array == torch.arange(5, device=device)).all())
+
     def test_iallreduce(self):
         try:
             # contiguous data
@@ -224,6 +224,43 @@ class TestDNDarray(unittest.TestCase):
             with self.assertRaises(TypeError):
                 int(ht.full((ht.MPI_WORLD.size,), 2, split=0, device=ht_device))
 
+    def test_inplace_operations(self):
+        data = torch.arange(ht.MPI_WORLD.size * 6, device=device).reshape(-1, 3)
+        a = ht.array(data, split=0, device=ht_device)
+        local_data = a._DNDarray__array.data_ptr()
+
+        a += 1
+        a *= ht.full((3,), 2, device=ht_device)
+        a -= ht.ones(data.shape, dtype=ht.int64, split=1, device=ht_device)
+        a %= 5
+        a **= 2
+        expected = (((data + 1) * 2 - 1) % 5) ** 2
+        self.assertEqual(a._DNDarray__array.data_ptr(), local_data)
+        self.assertEqual(a.split, 0)
+        self.assertEqual(a.dtype, ht.int64)
+        self.assertTrue(ht.equal(a, ht.array(expected, device=ht_device)))
+
+        a <<= 2
+        a |= 1
+        a &= 7
+        a ^= 2
+        a >>= 1
+        expected = ((((expected << 2) | 1) & 7) ^ 2) >> 1
+        self.assertEqual(a._DNDarray__array.data_ptr(), local_data)
+        self.assertTrue(ht.equal(a, ht.array(expected, device=ht_device)))
+
+        b = ht.ones(data.shape, split=1, device=ht_device)
+        b /= 4
+        b //= 0.125
+        self.assertEqual(b.split, 1)
+        self.assertTrue(ht.equal(b, ht.full(data.shape, 2.0, device=ht_device)))
+
+        # the shape and data type of the tensor are fixed
+        with self.assertRaises(ValueError):
+            a += ht.ones((2,) + data.shape, device=ht_device)
+        with self.assertRaises(TypeError):
+            a /= 2
+
     def test_invert(self):
         int_tensor = ht.array([[0, 1], [2, -2]])
         bool_tensor = ht.array([[False, True], [True, False]])
@@ -382,6 +419,21 @@ class TestDNDarray(unittest.TestCase):
             else:
                 self.assertEqual(st.lshape, (50, 81, 0))
 
+            # the values keep their global order, the given lshape map is updated to the new distribution
+            data = torch.arange(50 * 6, device=device).reshape(6, 50)
+            st = ht.array(data, split=1, device=ht_device)
+            lshape_map = st.create_lshape_map()
+            target_map = torch.zeros((st.comm.size, 2), dtype=torch.int64, device=device)
+            target_map[-1, 1] = 7
+            target_map[1, 1] = 50 - 7
+            st.redistribute_(lshape_map=lshape_map, target_map=target_map)
+            self.assertTrue(torch.equal(lshape_map[..., 1], target_map[..., 1]))
+            self.assertEqual(st.lshape, (6, target_map[st.comm.rank, 1].item()))
+            self.assertTrue(st._DNDarray__array.is_contiguous())
+            st.balance_()
+            st.resplit_(None)
+            self.assertTrue(torch.equal(st._DNDarray__array, data))
+
             st = ht.zeros((8, 8, 8), split=None, device=ht_device)
             target_map = torch.zeros((st.comm.size, 3), dtype=torch.int, device=device)
             # this will do nothing!
@@ -454,6 +506,16 @@ class TestDNDarray(unittest.TestCase):
         self.assertTrue(data.lshape[1] == 1 or data.lshape[1] == 2)
         self.assertEqual(data.split, 1)
 
+        # redistribution between unevenly chunked split axes keeps the element order
+        expected = torch.arange(
+            (ht.MPI_WORLD.size + 2) * (ht.MPI_WORLD.size + 1), device=device
+        ).reshape(ht.MPI_WORLD.size + 2, ht.MPI_WORLD.size + 1)
+        data = ht.array(expected, split=1, device=ht_device)
+        data.resplit_(0)
+        _, _, slices = data.comm.chunk(expected.shape, 0)
+        self.assertEqual(data.split, 0)
+        self.assertTrue(torch.equal(data._DNDarray__array, expected[slices]))
+
         # test sorting order of resplit
         a_tensor = self.reference_tensor.copy()
         N = ht.MPI_WORLD.size
@@ -818,6 +880,131 @@ class TestDNDarray(unittest.TestCase):
         a[0] = ht.array([6, 6, 6, 6, 6], device=ht_device)
         self.assertTrue((a[ht.array((0,), device=ht_device)] == 6).all())
 
+    def test_getitem_setitem_advanced(self):
+        size = ht.MPI_WORLD.size
+        data = torch.arange(size * 12, device=device).reshape(size * 4, 3)
+        a = ht.array(data, split=0, device=ht_device)
+
+        # global indices distributed across the processes, requesting elements of other processes
+        indices = torch.arange(size * 4 - 1, -1, -3, device=device)
+        key = ht.array(indices, split=0, device=ht_device)
+        result = a[key]
+        self.assertEqual(result.shape, (indices.shape[0], 3))
+        self.assertEqual(result.split, 0)
+        self.assertEqual(result.lshape[0], key.lshape[0])
+        self.assertTrue(torch.equal(result._DNDarray__array, data[key._DNDarray__array]))
+
+        result = a[key, 1:]
+        self.assertEqual(result.shape, (indices.shape[0], 2))
+        self.assertTrue(torch.equal(result._DNDarray__array, data[key._DNDarray__array, 1:]))
+
+        # negative indices and the split axis of a not being indexed
+        key = ht.array([-1, 0, 2], split=0, device=ht_device)
+        result = ht.array(data, split=1, device=ht_device)[key]
+        self.assertEqual(result.split, 1)
+        self.assertEqual(result.shape, (3, 3))
+        self.assertTrue(torch.equal(result.resplit_(None)._DNDarray__array, data[[-1, 0, 2]]))
+
+        # integer keys select rows independent of their split axis
+        for split in (None, 0):
+            key = ht.array([0, 2], split=split, device=ht_device)
+            for array_split in (None, 0, 1):
+                result = ht.array(data, split=array_split, device=ht_device)[key]
+                self.assertEqual(result.shape, (2, 3))
+                result.balance_()
+                self.assertTrue(torch.equal(result.resplit_(None)._DNDarray__array, data[[0, 2]]))
+            b = ht.zeros((size * 4, 3), dtype=ht.int64, device=ht_device)
+            b[key] = 1
+            expected = torch.zeros((size * 4, 3), dtype=torch.int64, device=device)
+            expected[[0, 2]] = 1
+            self.assertTrue(torch.equal(b._DNDarray__array, expected))
+
+        # boolean masks, both distributed and replicated
+        mask = data[:, 0] % 2 == 0
+        for split in (0, None):
+            result = a[ht.array(mask, split=split, device=ht_device)]
+            self.assertEqual(result.shape, (int(mask.sum()), 3))
+            result.balance_()
+            self.assertTrue(torch.equal(result.resplit_(None)._DNDarray__array, data[mask]))
+
+        with self.assertRaises(IndexError):
+            a[ht.array([size * 4], split=0, device=ht_device)]
+        with self.assertRaises(IndexError):
+            a[ht.ones((size * 4 + 1,), dtype=ht.bool, split=0, device=ht_device)]
+
+        # values are scattered to the owning processes
+        b = ht.zeros((size * 4, 3), dtype=ht.int64, split=0, device=ht_device)
+        key = ht.array(indices, split=0, device=ht_device)
+        b[key] = 1
+        expected = torch.zeros((size * 4, 3), dtype=torch.int64, device=device)
+        expected[indices] = 1
+        self.assertTrue(torch.equal(b.resplit_(None)._DNDarray__array, expected))
+
+        b = ht.zeros((size * 4, 3), dtype=ht.int64, split=0, device=ht_device)
+        b[key, :] = ht.array(data[indices], split=0, device=ht_device)
+        expected[indices] = data[indices]
+        self.assertTrue(torch.equal(b.resplit_(None)._DNDarray__array, expected))
+
+        b = ht.zeros((size * 4, 3), dtype=ht.int64, split=0, device=ht_device)
+        b[ht.array(mask, split=0, device=ht_device)] = data[mask]
+        expected = torch.where(mask.unsqueeze(1), data, torch.zeros_like(data))
+        self.assertTrue(torch.equal(b.resplit_(None)._DNDarray__array, expected))
+
+    def test_getitem_slices(self):
+        # slices along the split axis are intersected with the local chunks arithmetically
+        data = torch.arange(17, device=device)
+        a = ht.array(data, split=0, device=ht_device)
+        for key in (
+            slice(2, 15, 3),
+            slice(-12, -2),
+            slice(None, None, 4),
+            slice(3, 3),
+            slice(15, None, -2),
+            slice(None, None, -1),
+            slice(-3, 1, -5),
+        ):
+            expected = data[list(range(17)[key])]
+            # both a single slice and a tuple of slices
+            for result in (a[key], a[(key,)]):
+                self.assertEqual(result.shape, tuple(expected.shape))
+                self.assertEqual(result.split, 0)
+                result.balance_()
+                self.assertTrue(torch.equal(result.resplit_(None)._DNDarray__array, expected))
+
+        # negative steps of non-distributed arrays
+        np_data = np.arange(6 * 5).reshape(6, 5)
+        a = ht.array(np_data, device=ht_device)
+        for key in (
+            slice(15, None, -2),
+            slice(None, None, -1),
+            slice(-3, 1, -5),
+            (slice(4, None, -2), 1),
+            (slice(None), slice(-2, 0, -1)),
+            (2, slice(None, None, -3)),
+            (Ellipsis, slice(None, None, -2)),
+            (slice(1, 5), None, slice(3, None, -1)),
+        ):
+            result = a[key]
+            expected = np_data[key]
+            self.assertIsNone(result.split)
+            self.assertEqual(result.shape, expected.shape)
+            self.assertTrue((result.numpy() == expected).all())
+
+        # negative steps along the non-split axes of distributed arrays
+        for split, key in (
+            (0, (slice(None), slice(-2, 0, -1))),
+            (0, (slice(1, None, 2), slice(None, None, -1))),
+            (1, slice(None, None, -1)),
+            (1, (slice(4, None, -2), slice(None, 4))),
+        ):
+            a = ht.array(np_data, split=split, device=ht_device)
+            result = a[key]
+            expected = np_data[key]
+            self.assertEqual(result.shape, expected.shape)
+            self.assertEqual(result.split, split)
+            result.balance_()
+            self.assertTrue((result.resplit_(None).numpy() == expected).all())
+
     def test_size_gnumel(self):
         a = ht.zeros((10, 10, 10), split=None, device=ht_device)
         self.assertEqual(a.size, 10 * 10 * 10)
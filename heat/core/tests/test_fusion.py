@@ -0,0 +1,88 @@
+import unittest
+import torch
+import os
+import heat as ht
+
+from heat.core import fusion
+
+if os.environ.get("DEVICE") == "gpu" and torch.cuda.is_available():
+    ht.use_device("gpu")
+    torch.cuda.set_device(torch.device(ht.get_device().torch_device))
+else:
+    ht.use_device("cpu")
+device = ht.get_device().torch_device
+ht_device = None
+if os.environ.get("DEVICE") == "lgpu" and torch.cuda.is_available():
+    device = ht.gpu.torch_device
+    ht_device = ht.gpu
+    torch.cuda.set_device(device)
+
+
+class TestFusion(unittest.TestCase):
+    def test_lazy(self):
+        x = ht.array(
+            torch.arange(60, dtype=torch.float32).reshape(20, 3), split=0, device=ht_device
+        )
+        mu = ht.array([1.0, 2.0, 3.0], device=ht_device)
+        sigma = ht.array([[2.0, 4.0, 8.0]], device=ht_device)
+        expected = (x - mu) ** 2 / sigma
+
+        self.assertFalse(ht.is_lazy())
+        with ht.lazy():
+            self.assertTrue(ht.is_lazy())
+            result = (x - mu) ** 2 / sigma
+
+            # the result is only recorded, but already knows its meta data
+            self.assertIsInstance(result._DNDarray__buffer, fusion.DeferredTensor)
+            self.assertEqual(result.shape, expected.shape)
+            self.assertEqual(result.lshape, expected.lshape)
+            self.assertEqual(result.split, 0)
+            self.assertEqual(result.dtype, ht.float32)
+
+            # consuming the result evaluates it
+            self.assertTrue(ht.allclose(result, expected))
+            self.assertIsInstance(result._DNDarray__buffer, torch.Tensor)
+        self.assertFalse(ht.is_lazy())
+
+        # chunked evaluation with broadcasting and mixed operations
+        chunk_size = fusion.CHUNK_SIZE
+        fusion.CHUNK_SIZE = 4
+        try:
+            with ht.lazy():
+                deferred = ht.sqrt(ht.exp(x / 60.0) + 1) > ht.cos(mu)
+                also_deferred = ht.floor(x * 0.5) + ht.sin(sigma)
+                self.assertEqual(deferred.dtype, ht.bool)
+                self.assertIsInstance(deferred._DNDarray__buffer, fusion.DeferredTensor)
+            # leaving the context evaluates all pending results
+            self.assertIsInstance(deferred._DNDarray__buffer, torch.Tensor)
+            self.assertIsInstance(also_deferred._DNDarray__buffer, torch.Tensor)
+        finally:
+            fusion.CHUNK_SIZE = chunk_size
+        self.assertTrue(ht.equal(deferred, ht.sqrt(ht.exp(x / 60.0) + 1) > ht.cos(mu)))
+        self.assertTrue(ht.allclose(also_deferred, ht.floor(x * 0.5) + ht.sin(sigma)))
+
+        # operations that are not element-wise are evaluated eagerly
+        with ht.lazy():
+            self.assertTrue(ht.equal(x, x))
+            self.assertEqual(int(ht.sum(x - x).item()), 0)
+
+        # in-place modifications evaluate the deferred results reading the modified data first
+        with ht.lazy():
+            y = x.copy()
+            shifted = y + 1
+            scaled = shifted * 2
+            y += 100
+            self.assertIsInstance(y._DNDarray__buffer, torch.Tensor)
+            self.assertIsInstance(shifted._DNDarray__buffer, torch.Tensor)
+            doubled = y * 2
+            ht.exp(x, out=y)
+            y[0] = -1
+        self.assertTrue(ht.equal(shifted, x + 1))
+        self.assertTrue(ht.equal(scaled, (x + 1) * 2))
+        self.assertTrue(ht.equal(doubled, (x + 100) * 2))
+
+        # errors are raised eagerly
+        with ht.lazy():
+            with self.assertRaises(TypeError):
+                ht.bitwise_and(x, 1)
+        self.assertFalse(ht.is_lazy())
@@ -1,5 +1,6 @@
 import numpy as np
 import os
+import shutil
 import tempfile
 import torch
 import unittest
@@ -30,6 +31,10 @@ class TestIO(unittest.TestCase):
         cls.NETCDF_OUT_PATH = os.path.join(tempfile.gettempdir(), "test.nc")
         cls.NETCDF_VARIABLE = "data"
 
+        cls.NPY_OUT_PATH = os.path.join(tempfile.gettempdir(), "test.npy")
+        cls.RAW_OUT_PATH = os.path.join(tempfile.gettempdir(), "test.bin")
+        cls.COMPRESSED_OUT_PATH = os.path.join(tempfile.gettempdir(), "test.htz")
+
         # load comparison data from csv
         cls.CSV_PATH = os.path.join(os.getcwd(), "heat/datasets/data/iris.csv")
         cls.IRIS = torch.from_numpy(np.loadtxt(cls.CSV_PATH, delimiter=";")).float().to(device)
@@ -51,6 +56,13 @@ class TestIO(unittest.TestCase):
             except FileNotFoundError:
                 pass
 
+        if ht.MPI_WORLD.rank == 0:
+            for path in (self.NPY_OUT_PATH, self.RAW_OUT_PATH, self.COMPRESSED_OUT_PATH):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
         # synchronize all nodes
         ht.MPI_WORLD.Barrier()
 
@@ -137,6 +149,35 @@ class TestIO(unittest.TestCase):
         a = ht.load_csv(self.CSV_PATH, sep=";", header_lines=100, split=0, device=ht_device)
         self.assertEqual(a.shape, (50, 4))
 
+        # all distributions hold the same values
+        for split in (None, 0, 1):
+            a = ht.load_csv(self.CSV_PATH, sep=";", split=split, device=ht_device)
+            self.assertEqual(a.split, split)
+            self.assertTrue(torch.equal(a.resplit_(None)._DNDarray__array, self.IRIS))
+
+        # windows line breaks and empty lines
+        csv_out_path = os.path.join(tempfile.gettempdir(), "test.csv")
+        if ht.MPI_WORLD.rank == 0:
+            with open(csv_out_path, "wb") as f:
+                f.write(b"a,b\r\n1,2\r\n\r\n3.5,4\r\n-5,6e1\r\n")
+        ht.MPI_WORLD.Barrier()
+        a = ht.load_csv(csv_out_path, header_lines=1, split=0, device=ht_device)
+        expected = torch.tensor([[1, 2], [3.5, 4], [-5, 60]], device=device)
+        self.assertTrue(torch.equal(a.resplit_(None)._DNDarray__array, expected))
+        ht.MPI_WORLD.Barrier()
+
+        # malformed lines parsed by a single process are reported on all processes
+        for last_line in (b"7,x\n", b"7\n"):
+            if ht.MPI_WORLD.rank == 0:
+                with open(csv_out_path, "wb") as f:
+                    f.write(b"1,2\n" * 10 * ht.MPI_WORLD.size + last_line)
+            ht.MPI_WORLD.Barrier()
+            with self.assertRaises(ValueError):
+                ht.load_csv(csv_out_path, split=0, device=ht_device)
+            ht.MPI_WORLD.Barrier()
+        if ht.MPI_WORLD.rank == 0:
+            os.remove(csv_out_path)
+
         with self.assertRaises(TypeError):
             ht.load_csv(12314, device=ht_device)
         with self.assertRaises(TypeError):
@@ -212,6 +253,109 @@ class TestIO(unittest.TestCase):
                     )
                 self.assertTrue((local_range._DNDarray__array == comparison).all())
 
+    def test_load_save_sharded(self):
+        directory = os.path.join(tempfile.gettempdir(), "test_sharded")
+        if ht.MPI_WORLD.rank == 0:
+            os.makedirs(directory, exist_ok=True)
+        ht.MPI_WORLD.Barrier()
+        path = os.path.join(directory, "shard_{rank}.npy")
+        manifest_path = os.path.join(directory, "shard_manifest.json")
+
+        comparison = torch.arange(180, dtype=torch.float32).reshape(9, 4, 5)
+        for split in [None, 0, 1]:
+            data = ht.array(comparison, split=split, device=ht_device)
+            data.save(path, shard=True)
+            self.assertTrue(os.path.exists(path.format(rank=data.comm.rank)))
+            self.assertTrue(os.path.exists(manifest_path))
+
+            # the saved split axis is the default
+            loaded = ht.load(path.replace("{rank}", "*"), shard=True, device=ht_device)
+            self.assertEqual(loaded.shape, data.shape)
+            self.assertEqual(loaded.split, split)
+            self.assertEqual(loaded.dtype, ht.float32)
+            self.assertEqual(loaded.lshape, loaded.comm.chunk(loaded.shape, split)[1])
+            self.assertTrue(ht.equal(loaded, data))
+
+            loaded = ht.load(path, shard=True, split=2, dtype=ht.int64, device=ht_device)
+            self.assertEqual(loaded.split, 2)
+            self.assertEqual(loaded.dtype, ht.int64)
+            self.assertTrue(ht.equal(loaded, ht.array(comparison, dtype=ht.int64)))
+
+        # unbalanced data read with a different distribution
+        data = ht.array(comparison, split=0, device=ht_device)[2:]
+        ht.save(data, path, shard=True)
+        loaded = ht.load(path, shard=True, device=ht_device)
+        self.assertEqual(loaded.shape, (7, 4, 5))
+        self.assertEqual(loaded.lshape, loaded.comm.chunk(loaded.shape, 0)[1])
+        self.assertTrue(ht.equal(loaded, ht.array(comparison[2:], device=ht_device)))
+
+        # HDF5 shards with additional arguments
+        if ht.io.supports_hdf5():
+            path = os.path.join(directory, "shard_{rank}.h5")
+            ht.save(data, path, self.HDF5_DATASET, shard=True)
+            loaded = ht.load(path, dataset=self.HDF5_DATASET, shard=True, device=ht_device)
+            self.assertTrue(ht.equal(loaded, ht.array(comparison[2:], device=ht_device)))
+
+        with self.assertRaises(ValueError):
+            ht.save(data, os.path.join(directory, "shard.npy"), shard=True)
+        with self.assertRaises(ValueError):
+            ht.save(ht.array(1.0), path, shard=True)
+        with self.assertRaises(TypeError):
+            ht.save(1, path, shard=True)
+        with self.assertRaises(ValueError):
+            ht.load(os.path.join(directory, "shard.npy"), shard=True)
+
+        ht.MPI_WORLD.Barrier()
+        if ht.MPI_WORLD.rank == 0:
+            shutil.rmtree(directory)
+
+    def test_save_async(self):
+        data = ht.arange(60, dtype=ht.float32, split=0, device=ht_device)
+        comparison = data._DNDarray__array.cpu().clone()
+        request = ht.save(data, self.NPY_OUT_PATH, async_=True)
+        self.assertIsInstance(request, ht.io.SaveRequest)
+
+        # the data may be modified and communicated while it is written
+        data += 1
+        self.assertEqual(data.sum().item(), 1770 + 60)
+        request.wait()
+        self.assertTrue(request.done())
+        loaded = ht.load_npy(self.NPY_OUT_PATH, split=0, device=ht_device)
+        self.assertTrue((loaded._DNDarray__array.cpu() == comparison).all())
+
+        # successive saves are performed in order, bounded in number
+        requests = [data.save(self.NPY_OUT_PATH, async_=True, max_pending=1) for _ in range(3)]
+        requests.append(ht.save(data * 2, self.NPY_OUT_PATH, async_=True, max_pending=1))
+        for request in requests:
+            request.wait()
+        loaded = ht.load_npy(self.NPY_OUT_PATH, split=0, device=ht_device)
+        self.assertTrue(ht.equal(loaded, data * 2))
+
+        # synchronous saves return no handle
+        self.assertIsNone(ht.save(data, self.NPY_OUT_PATH))
+
+        # failed saves are reported, without thread support of MPI by the call itself
+        missing = os.path.join(tempfile.gettempdir(), "missing_directory", "test.npy")
+        if ht.MPI.Query_thread() < ht.MPI.THREAD_MULTIPLE:
+            with self.assertRaises(ht.MPI.Exception):
+                ht.save(data, missing, async_=True)
+        else:
+            request = ht.save(data, missing, async_=True)
+            with self.assertRaises(ht.MPI.Exception):
+                request.wait()
+            # errors nobody waited for are raised by the save waiting for them
+            ht.save(data, missing, async_=True, max_pending=1)
+            with self.assertRaises(ht.MPI.Exception):
+                ht.save(data, self.NPY_OUT_PATH, async_=True, max_pending=1)
+            ht.save(data, self.NPY_OUT_PATH, async_=True, max_pending=1).wait()
+
+        with self.assertRaises(ValueError):
+            ht.save(data, self.NPY_OUT_PATH, async_=True, max_pending=0)
+        with self.assertRaises(ValueError):
+            ht.save(data, "data.foo", async_=True)
+        with self.assertRaises(TypeError):
+            ht.save(1, self.NPY_OUT_PATH, async_=True)
+
     def test_save_exception(self):
         data = ht.arange(1, device=ht_device)
 
@@ -237,6 +381,239 @@ class TestIO(unittest.TestCase):
             with self.assertRaises(ValueError):
                 ht.save(data, self.NETCDF_OUT_PATH, self.NETCDF_VARIABLE)
 
+    def test_iter_chunks(self):
+        if ht.MPI_WORLD.rank == 0:
+            np.save(self.NPY_OUT_PATH, self.IRIS.cpu().numpy())
+        ht.MPI_WORLD.Barrier()
+
+        sources = [(self.CSV_PATH, {"sep": ";"}), (self.NPY_OUT_PATH, {})]
+        if ht.io.supports_hdf5():
+            sources.append((self.HDF5_PATH, {"dataset": self.HDF5_DATASET}))
+        if ht.io.supports_netcdf():
+            sources.append((self.NETCDF_PATH, {"dataset": self.NETCDF_VARIABLE}))
+
+        for path, kwargs in sources:
+            for split, read_ahead in [(0, True), (None, False)]:
+                begin = 0
+                for chunk in ht.io.iter_chunks(
+                    path,
+                    chunk_rows=40,
+                    split=split,
+                    read_ahead=read_ahead,
+                    device=ht_device,
+                    **kwargs
+                ):
+                    end = min(begin + 40, self.IRIS.shape[0])
+                    self.assertIsInstance(chunk, ht.DNDarray)
+                    self.assertEqual(chunk.shape, (end - begin, self.IRIS.shape[1]))
+                    self.assertEqual(chunk.split, split)
+                    self.assertEqual(chunk.dtype, ht.float32)
+                    self.assertEqual(chunk.lshape, chunk.comm.chunk(chunk.shape, split)[1])
+                    comparison = ht.array(self.IRIS[begin:end], device=ht_device)
+                    self.assertTrue(ht.equal(chunk, comparison))
+                    begin = end
+                self.assertEqual(begin, self.IRIS.shape[0])
+
+        # skipped header lines and stopping early
+        chunks = ht.io.iter_chunks(
+            self.CSV_PATH, chunk_rows=100, header_lines=10, sep=";", dtype=ht.float64
+        )
+        chunk = next(chunks)
+        chunks.close()
+        self.assertEqual(chunk.shape, (100, 4))
+        self.assertEqual(chunk.dtype, ht.float64)
+        self.assertTrue(ht.equal(chunk, ht.array(self.IRIS[10:110], dtype=ht.float64)))
+
+        # header lines count like in load_csv, i.e. including empty ones
+        csv_out_path = os.path.join(tempfile.gettempdir(), "test_chunks.csv")
+        if ht.MPI_WORLD.rank == 0:
+            with open(csv_out_path, "wb") as f:
+                f.write(b"a,b\n\n1,2\n3,4\n\n5,6\n7,8\n")
+        ht.MPI_WORLD.Barrier()
+        for header_lines in (1, 2, 3):
+            expected = ht.load_csv(csv_out_path, header_lines=header_lines, device=ht_device)
+            chunks = list(
+                ht.io.iter_chunks(
+                    csv_out_path, chunk_rows=2, header_lines=header_lines, device=ht_device
+                )
+            )
+            self.assertEqual(sum(chunk.shape[0] for chunk in chunks), expected.shape[0])
+            gathered = ht.concatenate([chunk.resplit_(None) for chunk in chunks], 0)
+            self.assertTrue(ht.equal(gathered, expected))
+        ht.MPI_WORLD.Barrier()
+        if ht.MPI_WORLD.rank == 0:
+            os.remove(csv_out_path)
+
+        with self.assertRaises(TypeError):
+            ht.io.iter_chunks(1)
+        with self.assertRaises(TypeError):
+            ht.io.iter_chunks(self.CSV_PATH, chunk_rows=1.0)
+        with self.assertRaises(ValueError):
+            ht.io.iter_chunks(self.CSV_PATH, chunk_rows=0)
+        with self.assertRaises(ValueError):
+            ht.io.iter_chunks(self.CSV_PATH, split=1)
+        with self.assertRaises(ValueError):
+            ht.io.iter_chunks("data.foo")
+
+    def test_load_npy(self):
+        comparison = np.arange(60, dtype=np.float64).reshape(4, 3, 5)
+        if ht.MPI_WORLD.rank == 0:
+            np.save(self.NPY_OUT_PATH, comparison)
+        ht.MPI_WORLD.Barrier()
+
+        for split in [None, 0, 1, 2]:
+            data = ht.load_npy(self.NPY_OUT_PATH, split=split, device=ht_device)
+            self.assertIsInstance(data, ht.DNDarray)
+            self.assertEqual(data.shape, comparison.shape)
+            self.assertEqual(data.split, split)
+            self.assertEqual(data.dtype, ht.float64)
+            _, lshape, slices = data.comm.chunk(data.shape, split)
+            self.assertEqual(data.lshape, lshape)
+            self.assertTrue(
+                (data._DNDarray__array.cpu() == torch.from_numpy(comparison[slices])).all()
+            )
+
+        # type conversion and catch-all loading
+        data = ht.load(self.NPY_OUT_PATH, dtype=ht.int32, split=0, device=ht_device)
+        self.assertEqual(data.dtype, ht.int32)
+        self.assertEqual(data._DNDarray__array.dtype, torch.int32)
+        self.assertTrue(ht.equal(data, ht.array(comparison, dtype=ht.int32, device=ht_device)))
+
+        # more processes than rows
+        data = ht.load_npy(self.NPY_OUT_PATH, split=0, device=ht_device)
+        data = data[:1]
+        ht.save_npy(data, self.NPY_OUT_PATH)
+        data = ht.load_npy(self.NPY_OUT_PATH, split=0, device=ht_device)
+        self.assertEqual(data.shape, (1, 3, 5))
+        self.assertTrue(ht.equal(data, ht.array(comparison[:1], device=ht_device)))
+
+    def test_load_npy_exception(self):
+        with self.assertRaises(TypeError):
+            ht.load_npy(1)
+        with self.assertRaises(TypeError):
+            ht.load_npy(self.NPY_OUT_PATH, split=1.0)
+
+        if ht.MPI_WORLD.rank == 0:
+            np.save(self.NPY_OUT_PATH, np.asfortranarray(np.ones((3, 4))))
+        ht.MPI_WORLD.Barrier()
+        with self.assertRaises(ValueError):
+            ht.load_npy(self.NPY_OUT_PATH)
+
+    def test_save_npy(self):
+        comparison = np.arange(60, dtype=np.int32).reshape(4, 3, 5)
+        for split in [None, 0, 1, 2]:
+            data = ht.array(comparison, split=split, device=ht_device)
+            ht.save_npy(data, self.NPY_OUT_PATH)
+            if data.comm.rank == 0:
+                self.assertTrue((np.load(self.NPY_OUT_PATH) == comparison).all())
+            ht.MPI_WORLD.Barrier()
+
+        # unbalanced data, overwriting a larger file
+        data = ht.array(comparison, split=0, device=ht_device)
+        data = data[::3] > 10
+        data.save(self.NPY_OUT_PATH)
+        if data.comm.rank == 0:
+            loaded = np.load(self.NPY_OUT_PATH)
+            self.assertEqual(loaded.dtype, np.bool_)
+            self.assertTrue((loaded == (comparison[[0, 3]] > 10)).all())
+
+    def test_save_npy_exception(self):
+        data = ht.arange(1, device=ht_device)
+
+        with self.assertRaises(TypeError):
+            ht.save_npy(1, self.NPY_OUT_PATH)
+        with self.assertRaises(TypeError):
+            ht.save_npy(data, 1)
+
+    def test_load_save_raw(self):
+        comparison = np.arange(60, dtype=np.float32).reshape(3, 4, 5)
+        for split in [None, 0, 1, 2]:
+            data = ht.array(comparison, split=split, device=ht_device)
+            ht.save_raw(data, self.RAW_OUT_PATH)
+            if data.comm.rank == 0:
+                self.assertEqual(os.path.getsize(self.RAW_OUT_PATH), comparison.nbytes)
+                self.assertTrue(
+                    (np.fromfile(self.RAW_OUT_PATH, dtype=np.float32) == comparison.ravel()).all()
+                )
+            ht.MPI_WORLD.Barrier()
+
+            loaded = ht.load_raw(
+                self.RAW_OUT_PATH, (3, 4, 5), dtype=ht.float32, split=split, device=ht_device
+            )
+            self.assertEqual(loaded.split, split)
+            self.assertEqual(loaded.lshape, data.lshape)
+            self.assertTrue(ht.equal(loaded, data))
+
+        # skip leading bytes
+        loaded = ht.load_raw(
+            self.RAW_OUT_PATH, (2, 4, 5), dtype=ht.float32, offset=80, split=0, device=ht_device
+        )
+        self.assertTrue(ht.equal(loaded, ht.array(comparison[1:], device=ht_device)))
+
+        with self.assertRaises(TypeError):
+            ht.load_raw(1, (3, 4, 5))
+        with self.assertRaises(TypeError):
+            ht.load_raw(self.RAW_OUT_PATH, 60)
+        with self.assertRaises(TypeError):
+            ht.load_raw(self.RAW_OUT_PATH, (3, 4, 5), offset=1.0)
+        with self.assertRaises(TypeError):
+            ht.save_raw(data, 1)
+
+    def test_load_save_compressed(self):
+        comparison = torch.arange(240, dtype=torch.float64).reshape(4, 6, 10) % 7
+        for split in [None, 0, 1, 2]:
+            data = ht.array(comparison, split=split, device=ht_device)
+            for chunk_rows in [None, 1, 4]:
+                ht.save_compressed(data, self.COMPRESSED_OUT_PATH, level=9, chunk_rows=chunk_rows)
+                if data.comm.rank == 0:
+                    size = os.path.getsize(self.COMPRESSED_OUT_PATH)
+                    self.assertLess(size, comparison.numel() * 8)
+
+                # loading with any split axis, also via the catch-all function
+                for load_split in [None, 0, 2]:
+                    loaded = ht.load(self.COMPRESSED_OUT_PATH, split=load_split, device=ht_device)
+                    self.assertEqual(loaded.shape, data.shape)
+                    self.assertEqual(loaded.split, load_split)
+                    self.assertEqual(loaded.dtype, ht.float64)
+                    self.assertEqual(loaded.lshape, loaded.comm.chunk(loaded.shape, load_split)[1])
+                    self.assertTrue(ht.equal(loaded, data))
+
+        # unbalanced data, other types and scalars
+        data = ht.array(comparison, split=0, device=ht_device)[1:] > 3
+        data.save(self.COMPRESSED_OUT_PATH)
+        loaded = ht.load_compressed(self.COMPRESSED_OUT_PATH, split=0, device=ht_device)
+        self.assertEqual(loaded.dtype, ht.bool)
+        self.assertTrue(ht.equal(loaded, ht.array(comparison[1:] > 3, device=ht_device)))
+        loaded = ht.load_compressed(self.COMPRESSED_OUT_PATH, dtype=ht.int32, device=ht_device)
+        self.assertEqual(loaded.dtype, ht.int32)
+        comparison = ht.array(comparison[1:] > 3, dtype=ht.int32, device=ht_device)
+        self.assertTrue(ht.equal(loaded, comparison))
+
+        data = ht.array(2.5, device=ht_device)
+        ht.save_compressed(data, self.COMPRESSED_OUT_PATH)
+        loaded = ht.load_compressed(self.COMPRESSED_OUT_PATH, device=ht_device)
+        self.assertEqual(loaded.shape, ())
+        self.assertEqual(loaded.item(), 2.5)
+
+        with self.assertRaises(TypeError):
+            ht.save_compressed(1, self.COMPRESSED_OUT_PATH)
+        with self.assertRaises(TypeError):
+            ht.save_compressed(data, 1)
+        with self.assertRaises(TypeError):
+            ht.save_compressed(data, self.COMPRESSED_OUT_PATH, level=1.0)
+        with self.assertRaises(TypeError):
+            ht.save_compressed(data, self.COMPRESSED_OUT_PATH, chunk_rows=1.0)
+        with self.assertRaises(ValueError):
+            ht.save_compressed(data, self.COMPRESSED_OUT_PATH, chunk_rows=0)
+        with self.assertRaises(ValueError):
+            ht.save_compressed(data, self.COMPRESSED_OUT_PATH, codec="foo")
+        with self.assertRaises(TypeError):
+            ht.load_compressed(1)
+        with self.assertRaises(TypeError):
+            ht.load_compressed(self.COMPRESSED_OUT_PATH, split=1.0)
+        with self.assertRaises(ValueError):
+            ht.load_compressed(self.CSV_PATH)
+
     def test_load_hdf5(self):
         # HDF5 support is optional
         if not ht.io.supports_hdf5():
@@ -275,6 +652,51 @@ class TestIO(unittest.TestCase):
         self.assertEqual(iris.dtype, ht.int8)
         self.assertEqual(iris._DNDarray__array.dtype, torch.int8)
 
+        # sub-selection of the dataset
+        iris = ht.load_hdf5(
+            self.HDF5_PATH,
+            self.HDF5_DATASET,
+            split=0,
+            device=ht_device,
+            selection=(slice(10, 100, 3), [0, 2]),
+        )
+        self.assertEqual(iris.shape, (30, 2))
+        _, _, slices = iris.comm.chunk(iris.shape, 0)
+        self.assertTrue((self.IRIS[10:100:3][:, [0, 2]][slices] == iris._DNDarray__array).all())
+
+        iris = ht.load_hdf5(
+            self.HDF5_PATH, self.HDF5_DATASET, split=1, device=ht_device, selection=slice(20, 30)
+        )
+        self.assertEqual(iris.shape, (10, 4))
+        self.assertTrue(ht.equal(iris, ht.array(self.IRIS[20:30], device=ht_device)))
+
+        # split boundaries aligned with the chunks of the dataset
+        if ht.MPI_WORLD.rank == 0:
+            with ht.io.h5py.File(self.HDF5_OUT_PATH, "w") as handle:
+                handle.create_dataset(
+                    self.HDF5_DATASET, data=np.arange(400).reshape(100, 4), chunks=(7, 4)
+                )
+        ht.MPI_WORLD.Barrier()
+        for selection in [None, slice(3, 90)]:
+            data = ht.load_hdf5(
+                self.HDF5_OUT_PATH,
+                self.HDF5_DATASET,
+                dtype=ht.int64,
+                split=0,
+                device=ht_device,
+                selection=selection,
+                chunk_aligned=True,
+            )
+            start = 0 if selection is None else 3
+            comparison = np.arange(400).reshape(100, 4)[start : 100 if selection is None else 90]
+            self.assertEqual(data.shape, comparison.shape)
+            offset = data.comm.exscan(data.lshape[0])
+            offset = offset if offset is not None else 0
+            if offset > 0 and data.lshape[0] > 0:
+                self.assertEqual((offset + start) % 7, 0)
+            data.balance_()
+            self.assertTrue(ht.equal(data, ht.array(comparison, device=ht_device)))
+
     def test_load_hdf5_exception(self):
         # HDF5 support is optional
         if not ht.io.supports_hdf5():
@@ -287,6 +709,20 @@ class TestIO(unittest.TestCase):
             ht.load_hdf5("iris.h5", 1, device=ht_device)
         with self.assertRaises(TypeError):
             ht.load_hdf5("iris.h5", dataset="data", split=1.0, device=ht_device)
+        with self.assertRaises(TypeError):
+            ht.load_hdf5(self.HDF5_PATH, self.HDF5_DATASET, chunk_aligned=1)
+        with self.assertRaises(TypeError):
+            ht.load_hdf5(self.HDF5_PATH, self.HDF5_DATASET, selection=1)
+
+        # improper selections
+        with self.assertRaises(ValueError):
+            ht.load_hdf5(self.HDF5_PATH, self.HDF5_DATASET, selection=slice(None, None, -1))
+        with self.assertRaises(ValueError):
+            ht.load_hdf5(self.HDF5_PATH, self.HDF5_DATASET, selection=(slice(3), [2, 1]))
+        with self.assertRaises(ValueError):
+            ht.load_hdf5(self.HDF5_PATH, self.HDF5_DATASET, selection=(slice(3), [1], [0]))
+        with self.assertRaises(IndexError):
+            ht.load_hdf5(self.HDF5_PATH, self.HDF5_DATASET, selection=(slice(3), [1, 4]))
 
         # file or dataset does not exist
         with self.assertRaises(IOError):
@@ -319,6 +755,19 @@ class TestIO(unittest.TestCase):
                 )
             self.assertTrue((local_data._DNDarray__array == comparison).all())
 
+        # distributed data gathered on aggregating processes
+        expected = torch.arange(60, dtype=torch.int32, device=device).reshape(3, 4, 5)
+        split_data = ht.array(expected, split=1, device=ht_device)
+        for aggregators in [1, 2, split_data.comm.size + 1]:
+            ht.save_hdf5(split_data, self.HDF5_OUT_PATH, self.HDF5_DATASET, aggregators=aggregators)
+            if split_data.comm.rank == 0:
+                with ht.io.h5py.File(self.HDF5_OUT_PATH, "r") as handle:
+                    comparison = torch.tensor(
+                        handle[self.HDF5_DATASET], dtype=torch.int32, device=device
+                    )
+                self.assertTrue((expected == comparison).all())
+            ht.MPI_WORLD.Barrier()
+
     def test_save_hdf5_exception(self):
         # HDF5 support is optional
         if not ht.io.supports_hdf5():
@@ -333,6 +782,10 @@ class TestIO(unittest.TestCase):
             ht.save_hdf5(data, 1, self.HDF5_DATASET)
         with self.assertRaises(TypeError):
             ht.save_hdf5(data, self.HDF5_OUT_PATH, 1)
+        with self.assertRaises(TypeError):
+            ht.save_hdf5(data, self.HDF5_OUT_PATH, self.HDF5_DATASET, aggregators=1.0)
+        with self.assertRaises(ValueError):
+            ht.save_hdf5(data, self.HDF5_OUT_PATH, self.HDF5_DATASET, aggregators=0)
 
     def test_load_netcdf(self):
         # netcdf support is optional
@@ -418,6 +871,21 @@ class TestIO(unittest.TestCase):
                 )
             self.assertTrue((local_data._DNDarray__array == comparison).all())
 
+        # distributed data gathered on aggregating processes
+        expected = torch.arange(60, dtype=torch.int32, device=device).reshape(3, 4, 5)
+        split_data = ht.array(expected, split=1, device=ht_device)
+        for aggregators in [1, 2, split_data.comm.size + 1]:
+            split_data.save_netcdf(
+                self.NETCDF_OUT_PATH, self.NETCDF_VARIABLE, aggregators=aggregators
+            )
+            if split_data.comm.rank == 0:
+                with ht.io.nc.Dataset(self.NETCDF_OUT_PATH, "r") as handle:
+                    comparison = torch.tensor(
+                        handle[self.NETCDF_VARIABLE][:], dtype=torch.int32, device=device
+                    )
+                self.assertTrue((expected == comparison).all())
+            ht.MPI_WORLD.Barrier()
+
     def test_save_netcdf_exception(self):
         # netcdf support is optional
         if not ht.io.supports_netcdf():
@@ -432,3 +900,7 @@ class TestIO(unittest.TestCase):
             ht.save_netcdf(data, 1, self.NETCDF_VARIABLE)
         with self.assertRaises(TypeError):
             ht.save_netcdf(data, self.NETCDF_PATH, 1)
+        with self.assertRaises(TypeError):
+            ht.save_netcdf(data, self.NETCDF_PATH, self.NETCDF_VARIABLE, aggregators=1.0)
+        with self.assertRaises(ValueError):
+            ht.save_netcdf(data, self.NETCDF_PATH, self.NETCDF_VARIABLE, aggregators=0)
@@ -274,6 +274,10 @@ class TestLogical(unittest.TestCase):
             )
         )
 
+        out = ht.empty((2, 2), dtype=ht.bool, split=0)
+        self.assertIs(ht.logical_and(first_tensor, second_tensor, out=out), out)
+        self.assertTrue(ht.equal(out, result_tensor))
+
     def test_logical_not(self):
         first_tensor = ht.array([[True, True], [False, False]])
         second_tensor = ht.array([[True, False], [True, False]])
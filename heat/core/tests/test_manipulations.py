@@ -1146,6 +1146,58 @@ class TestManipulations(BasicTest):
         res, inv = ht.unique(data_split_zero, return_inverse=True, sorted=True)
         self.assertTrue(torch.equal(inv, exp_inv.to(dtype=inv.dtype)))
 
+        data_split_one = ht.array(torch_array, split=1, device=ht_device)
+        res, inv = ht.unique(data_split_one, return_inverse=True, sorted=True)
+        self.assertTrue(torch.equal(inv, exp_inv.to(dtype=inv.dtype)))
+
+        # the inverse indices stay distributed like the input
+        res, inv = ht.unique(data_split_zero, return_inverse=True, sorted=True, distributed_inverse=True)
+        self.assertIsInstance(inv, ht.DNDarray)
+        self.assertEqual(inv.split, 0)
+        self.assertEqual(inv.shape, data_split_zero.shape)
+        self.assertEqual(inv.lshape, data_split_zero.lshape)
+        self.assertTrue(torch.equal(inv.resplit_(None)._DNDarray__array, exp_inv))
+
+        torch_array = torch.randint(0, 10, (size * 20,), device=device)
+        data = ht.array(torch_array, split=0, device=ht_device)
+        exp_res, exp_inv = torch_array.unique(return_inverse=True, sorted=True)
+        res, inv = data.unique(sorted=True, return_inverse=True)
+        self.assertTrue(torch.equal(res.resplit_(None)._DNDarray__array, exp_res))
+        self.assertTrue(torch.equal(inv, exp_inv))
+        res, inv = data.unique(sorted=True, return_inverse=True, distributed_inverse=True)
+        self.assertEqual(inv.split, 0)
+        self.assertTrue(torch.equal(inv.resplit_(None)._DNDarray__array, exp_inv))
+
+        # hash partitioned unique elements are distributed, each one is owned by exactly one process
+        exp_res, exp_counts = torch_array.unique(sorted=True, return_counts=True)
+        res, counts = data.unique(sorted=True, partitioned=True, return_counts=True)
+        self.assertEqual(res.split, 0)
+        self.assertEqual(res.dtype, data.dtype)
+        self.assertEqual(counts.lshape, res.lshape)
+        res.balance_()
+        counts.balance_()
+        gathered, order = res.resplit_(None)._DNDarray__array.sort()
+        self.assertTrue(torch.equal(gathered, exp_res))
+        self.assertTrue(torch.equal(counts.resplit_(None)._DNDarray__array[order], exp_counts))
+
+        floats = ht.array(torch_array.double() - 4.5, split=0, device=ht_device)
+        res = ht.unique(floats, partitioned=True)
+        self.assertEqual(res.shape, exp_res.shape)
+        res.balance_()
+        self.assertTrue(torch.equal(res.resplit_(None)._DNDarray__array.sort()[0], exp_res - 4.5))
+
+        res, counts = ht.unique(data_split_none, partitioned=True, return_counts=True)
+        exp_res, exp_counts = data_split_none._DNDarray__array.unique(return_counts=True)
+        self.assertIsNone(res.split)
+        self.assertTrue(torch.equal(counts._DNDarray__array, exp_counts))
+
+        with self.assertRaises(NotImplementedError):
+            ht.unique(data, partitioned=True, return_inverse=True)
+        with self.assertRaises(NotImplementedError):
+            ht.unique(data, partitioned=True, axis=0)
+        with self.assertRaises(NotImplementedError):
+            ht.unique(data, return_counts=True)
+
     def test_resplit(self):
         # resplitting with same axis, should leave everything unchanged
         shape = (ht.MPI_WORLD.size, ht.MPI_WORLD.size)
@@ -83,10 +83,99 @@ class TestOperations(unittest.TestCase):
         result = right_tensor & left_tensor
         self.assertEqual(result.shape, (4, 1, 3, 3, 2))
 
+        # broadcast with different splits
+        left_tensor = ht.ones((1, 2), dtype=ht.int32, split=0, device=ht_device)
+        right_tensor = ht.ones((1, 2), dtype=ht.int32, split=1, device=ht_device)
+        result = ht.bitwise_or(left_tensor, right_tensor)
+        self.assertEqual(result.shape, (1, 2))
+        self.assertTrue(ht.equal(result, ht.ones((1, 2), dtype=ht.int32, device=ht_device)))
+
         with self.assertRaises(TypeError):
             ht.bitwise_and(ht.ones((1, 2), device=ht_device), "wrong type")
-        with self.assertRaises(NotImplementedError):
-            ht.bitwise_or(
-                ht.ones((1, 2), dtype=ht.int32, split=0, device=ht_device),
-                ht.ones((1, 2), dtype=ht.int32, split=1, device=ht_device),
-            )
+
+    def test___binary_op_different_splits(self):
+        size = ht.MPI_WORLD.size
+        data = torch.arange(size * 12, dtype=torch.float32, device=device).reshape(size * 4, 3)
+        data_t = data.t().contiguous()
+
+        # equally sized operands, the second one is redistributed
+        a = ht.array(data, split=0, device=ht_device)
+        b = ht.array(data, split=1, device=ht_device)
+        result = a + b
+        self.assertEqual(result.split, 0)
+        self.assertEqual(result.lshape, a.lshape)
+        self.assertTrue(ht.equal(result, ht.array(2 * data, device=ht_device)))
+        self.assertEqual(b.split, 1)
+        self.assertEqual(b.lshape, ht.array(data, split=1, device=ht_device).lshape)
+        result = b - a
+        self.assertEqual(result.split, 1)
+        self.assertTrue(ht.equal(result, ht.zeros(result.shape, device=ht_device)))
+
+        # the smaller operand is moved, the larger one keeps its distribution
+        row = ht.array(data[:1], split=0, device=ht_device)
+        columns = ht.array(data, split=1, device=ht_device)
+        result = row * columns
+        self.assertEqual(result.split, 1)
+        self.assertEqual(result.lshape, columns.lshape)
+        self.assertTrue(ht.equal(result, ht.array(data[:1] * data, device=ht_device)))
+        self.assertEqual(row.lshape, ht.array(data[:1], split=0, device=ht_device).lshape)
+
+        # operands of different dimensionality
+        vector = ht.array(data[:, 0], split=0, device=ht_device)
+        result = ht.array(data_t, split=1, device=ht_device) - vector
+        self.assertEqual(result.split, 1)
+        self.assertTrue(ht.equal(result, ht.array(data_t - data[:, 0], device=ht_device)))
+        result = ht.array(data_t, split=0, device=ht_device) - vector
+        self.assertTrue(ht.equal(result, ht.array(data_t - data[:, 0], device=ht_device)))
+
+        # operands that are broadcast along the split axis of the other one
+        column = ht.array(data[:, :1], split=1, device=ht_device)
+        result = ht.array(data, split=0, device=ht_device) / (column + 1)
+        self.assertEqual(result.split, 0)
+        self.assertTrue(ht.allclose(result, ht.array(data / (data[:, :1] + 1), device=ht_device)))
+        result = ht.array(data, device=ht_device) >= ht.array(data[:1], split=0, device=ht_device)
+        self.assertEqual(result.split, 0)
+        self.assertEqual(result.lshape, ht.array(data, split=0, device=ht_device).lshape)
+        self.assertTrue(ht.equal(result, ht.array(data >= data[:1], device=ht_device)))
+
+        # operands of size one along the common split axis are broadcast, also into an output buffer
+        first = ht.array(data[:1], split=0, device=ht_device)
+        result = ht.array(data, split=0, device=ht_device) - first
+        self.assertEqual(result.split, 0)
+        self.assertEqual(result.lshape, ht.array(data, split=0, device=ht_device).lshape)
+        self.assertTrue(ht.equal(result, ht.array(data - data[:1], device=ht_device)))
+        self.assertEqual(first.lshape, ht.array(data[:1], split=0, device=ht_device).lshape)
+        result = ht.array(data, split=0, device=ht_device)
+        result += first
+        self.assertTrue(ht.equal(result, ht.array(data + data[:1], device=ht_device)))
+        result = ht.array(data_t, split=1, device=ht_device)
+        result *= ht.array(data_t[:, :1], split=1, device=ht_device)
+        self.assertEqual(result.split, 1)
+        self.assertTrue(ht.equal(result, ht.array(data_t * data_t[:, :1], device=ht_device)))
+
+    def test___binary_op_scalar(self):
+        int_tensor = ht.array([[1, 2], [3, 4]], split=0, device=ht_device)
+        float_tensor = ht.array([[1.0, 2.0], [3.0, 4.0]], split=1, device=ht_device)
+
+        # scalars are cast to the type of the tensor
+        result = int_tensor + 1.5
+        self.assertEqual(result.dtype, ht.int64)
+        self.assertEqual(result.split, 0)
+        self.assertTrue(ht.equal(result, ht.array([[2, 3], [4, 5]], device=ht_device)))
+        result = 10 - float_tensor
+        self.assertEqual(result.dtype, ht.float32)
+        self.assertEqual(result.split, 1)
+        self.assertTrue(ht.equal(result, ht.array([[9.0, 8.0], [7.0, 6.0]], device=ht_device)))
+        result = ht.lt(ht.np.float64(2.0), float_tensor)
+        self.assertEqual(result.dtype, ht.bool)
+        self.assertEqual(result.shape, (2, 2))
+
+        # equally distributed tensors of different types
+        result = int_tensor * ht.array([[0.5, 0.5], [2.5, 2.5]], split=0, device=ht_device)
+        self.assertEqual(result.dtype, ht.int64)
+        self.assertTrue(ht.equal(result, ht.array([[0, 0], [6, 8]], device=ht_device)))
+
+        with self.assertRaises(TypeError):
+            int_tensor + "wrong type"
+        with self.assertRaises(TypeError):
+            "wrong type" - float_tensor
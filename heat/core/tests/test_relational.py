@@ -42,6 +42,11 @@ class TestRelational(unittest.TestCase):
         self.assertTrue(ht.equal(ht.eq(self.a_tensor, self.an_int_scalar), result))
         self.assertTrue(ht.equal(ht.eq(self.a_split_tensor, self.a_tensor), result))
 
+        out = ht.empty((2, 2), dtype=ht.bool, split=1, device=ht_device)
+        self.assertIs(ht.eq(self.a_split_tensor, self.a_tensor, out=out), out)
+        self.assertEqual(out.split, 1)
+        self.assertTrue(ht.equal(out, result))
+
         with self.assertRaises(ValueError):
             ht.eq(self.a_tensor, self.another_vector)
         with self.assertRaises(TypeError):
@@ -201,6 +201,61 @@ class TestStatistics(unittest.TestCase):
         with self.assertRaises(ValueError):
             ht.argmin(data, axis=-4)
 
+    def test_bincount(self):
+        np_data = np.array([3, 0, 1, 1, 7, 3, 3, 0, 2], dtype=np.int64)
+        np_weights = np.linspace(0.0, 2.0, np_data.size)
+        for split in [None, 0]:
+            x = ht.array(np_data, split=split, device=ht_device)
+            counts = ht.bincount(x)
+            self.assertIsInstance(counts, ht.DNDarray)
+            self.assertIsNone(counts.split)
+            self.assertEqual(counts.dtype, ht.int64)
+            self.assertTrue((counts.numpy() == np.bincount(np_data)).all())
+
+            counts = ht.bincount(x, minlength=12)
+            self.assertTrue((counts.numpy() == np.bincount(np_data, minlength=12)).all())
+
+            weights = ht.array(np_weights, split=split, device=ht_device)
+            counts = ht.bincount(x, weights=weights)
+            self.assertEqual(counts.dtype, ht.float64)
+            self.assertTrue(np.allclose(counts.numpy(), np.bincount(np_data, weights=np_weights)))
+
+        # empty local chunks and empty tensors
+        x = ht.arange(2, split=0, device=ht_device)
+        self.assertTrue((ht.bincount(x).numpy() == [1, 1]).all())
+        x = ht.zeros((0,), dtype=ht.int32, split=0, device=ht_device)
+        self.assertEqual(ht.bincount(x).shape, (0,))
+        self.assertEqual(ht.bincount(x, minlength=3).shape, (3,))
+
+        x = ht.array([1, 2, 3], device=ht_device)
+        with self.assertRaises(TypeError):
+            ht.bincount(ht.array([1.0, 2.0], device=ht_device))
+        with self.assertRaises(TypeError):
+            ht.bincount(x, minlength=1.0)
+        with self.assertRaises(TypeError):
+            ht.bincount(x, weights=np.ones(3))
+        with self.assertRaises(ValueError):
+            ht.bincount(ht.array([[1, 2]], device=ht_device))
+        with self.assertRaises(ValueError):
+            ht.bincount(ht.array([1, -2], split=0, device=ht_device))
+        with self.assertRaises(ValueError):
+            ht.bincount(x, minlength=-1)
+        with self.assertRaises(ValueError):
+            ht.bincount(x, weights=ht.ones(4, device=ht_device))
+
+        # weights distributed differently on some processes only are rejected on all of them
+        if ht.MPI_WORLD.size > 1:
+            x = ht.arange(4 * ht.MPI_WORLD.size, split=0, device=ht_device)
+            weights = ht.ones(x.shape, split=0, device=ht_device)
+            target_map = weights.create_lshape_map()
+            target_map[0, 0] -= 1
+            target_map[1, 0] += 1
+            weights.redistribute_(target_map=target_map)
+            with self.assertRaises(ValueError):
+                ht.bincount(x, weights=weights)
+            with self.assertRaises(ValueError):
+                ht.histogram(x, weights=weights)
+
     def test_cov(self):
         x = ht.array([[0, 2], [1, 1], [2, 0]], dtype=ht.float, split=1, device=ht_device).T
         if x.comm.size < 3:
@@ -401,8 +456,11 @@ class TestStatistics(unittest.TestCase):
         with self.assertRaises(ZeroDivisionError):
             ht.average(random_5d, weights=zero_weights, axis=axis)
         weights_5d_split_mismatch = ht.ones(random_5d.gshape, split=-1, device=ht_device)
-        with self.assertRaises(NotImplementedError):
-            ht.average(random_5d, weights=weights_5d_split_mismatch, axis=axis)
+        avg_5d_split_mismatch = ht.average(random_5d, weights=weights_5d_split_mismatch, axis=axis)
+        self.assertEqual(avg_5d_split_mismatch.gshape, (2, 3, 4, 5))
+        weights_5d_split_match = ht.ones(random_5d.gshape, split=0, device=ht_device)
+        avg_5d_split_match = ht.average(random_5d, weights=weights_5d_split_match, axis=axis)
+        self.assertTrue(ht.allclose(avg_5d_split_mismatch, avg_5d_split_match))
 
         with self.assertRaises(TypeError):
             ht_array.average(axis=1.1)
@@ -411,6 +469,131 @@ class TestStatistics(unittest.TestCase):
         with self.assertRaises(ValueError):
             ht.average(ht_array, axis=-4)
 
+    def test_describe(self):
+        np_data = np.arange(7 * 5 * 3, dtype=np.float32).reshape(7, 5, 3) % 11 - 4.0
+        for split in [None, 0, 1, 2]:
+            x = ht.array(np_data, split=split, device=ht_device)
+            for axis in [None, 0, 2, (0, 1), [1, 2]]:
+                np_axis = tuple(axis) if isinstance(axis, list) else axis
+                stats = ht.describe(x, axis=axis, ddof=1)
+                self.assertEqual(
+                    list(stats.keys()),
+                    ["count", "sum", "sumsq", "min", "max", "mean", "var", "std"],
+                )
+                total = np.sum(np_data, axis=np_axis)
+                expected = {
+                    "count": np.full(np.shape(total), np_data.size // np.size(total)),
+                    "sum": total,
+                    "sumsq": np.sum(np_data ** 2, axis=np_axis),
+                    "min": np.min(np_data, axis=np_axis),
+                    "max": np.max(np_data, axis=np_axis),
+                    "mean": np.mean(np_data, axis=np_axis),
+                    "var": np.var(np_data, axis=np_axis, ddof=1),
+                    "std": np.std(np_data, axis=np_axis, ddof=1),
+                }
+                for name, value in stats.items():
+                    self.assertIsInstance(value, ht.DNDarray)
+                    self.assertEqual(value.shape, np.shape(expected[name]))
+                    self.assertTrue(np.allclose(value.numpy(), expected[name], rtol=1e-4))
+                self.assertEqual(stats["count"].dtype, ht.int64)
+                self.assertEqual(stats["min"].dtype, ht.float32)
+                self.assertEqual(stats["mean"].dtype, ht.float32)
+
+        # subsets of statistics, integer data and empty local chunks
+        x = ht.arange(3, split=0, device=ht_device)
+        stats = ht.describe(x, stats=["max", "count"])
+        self.assertEqual(list(stats.keys()), ["max", "count"])
+        self.assertEqual(stats["max"].item(), 2)
+        self.assertEqual(stats["max"].dtype, x.dtype)
+        self.assertEqual(stats["count"].item(), 3)
+        stats = ht.describe(x, stats=("sum", "mean"))
+        self.assertEqual(stats["sum"].item(), 3)
+        self.assertEqual(stats["sum"].dtype, ht.int64)
+        self.assertAlmostEqual(stats["mean"].item(), 1.0)
+
+        # sums of squares of small integer types do not overflow
+        x = ht.full((4 * ht.MPI_WORLD.size, 3), 100, dtype=ht.int8, split=0, device=ht_device)
+        stats = ht.describe(x, axis=0, stats=["sumsq", "min"])
+        self.assertEqual(stats["sumsq"].dtype, ht.int64)
+        self.assertTrue((stats["sumsq"].numpy() == 4 * ht.MPI_WORLD.size * 100 ** 2).all())
+        self.assertEqual(stats["min"].dtype, ht.int8)
+
+        # empty reductions have no minimum or maximum
+        x = ht.zeros((0, 3), dtype=ht.int32, split=0, device=ht_device)
+        self.assertEqual(ht.describe(x, stats=["count"])["count"].item(), 0)
+        with self.assertRaises(ValueError):
+            ht.describe(x, stats=["max"])
+        with self.assertRaises(ValueError):
+            ht.describe(x, axis=0)
+
+        x = ht.zeros((2, 3, 4), device=ht_device)
+        with self.assertRaises(TypeError):
+            ht.describe(x, stats="min")
+        with self.assertRaises(ValueError):
+            ht.describe(x, stats=["min", "median"])
+        with self.assertRaises(TypeError):
+            ht.describe(x, ddof=1.0)
+        with self.assertRaises(NotImplementedError):
+            ht.describe(x, ddof=2)
+        with self.assertRaises(ValueError):
+            ht.describe(x, axis=(1, 1))
+        with self.assertRaises(ValueError):
+            ht.describe(x, axis=3)
+
+    def test_histogram(self):
+        np_data = (np.arange(6 * 7, dtype=np.float32).reshape(6, 7) * 7 % 13) / 3.0 - 1.0
+        np_weights = np.arange(6 * 7, dtype=np.float32).reshape(6, 7)
+        for split in [None, 0, 1]:
+            x = ht.array(np_data, split=split, device=ht_device)
+            hist, bin_edges = ht.histogram(x, bins=5)
+            np_hist, np_bin_edges = np.histogram(np_data, bins=5)
+            self.assertIsNone(hist.split)
+            self.assertIsNone(bin_edges.split)
+            self.assertEqual(hist.dtype, ht.int64)
+            self.assertEqual(bin_edges.dtype, ht.float32)
+            self.assertTrue((hist.numpy() == np_hist).all())
+            self.assertTrue(np.allclose(bin_edges.numpy(), np_bin_edges))
+
+            hist, bin_edges = ht.histogram(x, bins=4, range=(0.0, 2.0), density=True)
+            np_hist, np_bin_edges = np.histogram(np_data, bins=4, range=(0.0, 2.0), density=True)
+            self.assertEqual(hist.dtype, ht.float32)
+            self.assertTrue(np.allclose(hist.numpy(), np_hist))
+            self.assertTrue(np.allclose(bin_edges.numpy(), np_bin_edges))
+
+            weights = ht.array(np_weights, split=split, device=ht_device)
+            hist, _ = ht.histogram(x, bins=4, weights=weights)
+            np_hist, _ = np.histogram(np_data, bins=4, weights=np_weights)
+            self.assertEqual(hist.dtype, ht.float32)
+            self.assertTrue(np.allclose(hist.numpy(), np_hist))
+
+            hist = ht.histc(x, bins=8, min=-1, max=3)
+            self.assertEqual(hist.dtype, ht.float32)
+            self.assertTrue((hist.numpy() == np.histogram(np_data, bins=8, range=(-1, 3))[0]).all())
+            hist = ht.histc(x, bins=8)
+            self.assertTrue((hist.numpy() == np.histogram(np_data, bins=8)[0]).all())
+
+        # integer data, a single distinct value and empty local chunks
+        x = ht.array([2, 2], split=0, device=ht_device)
+        hist, bin_edges = ht.histogram(x, bins=2)
+        self.assertTrue((hist.numpy() == [0, 2]).all())
+        self.assertTrue(np.allclose(bin_edges.numpy(), [1.5, 2.0, 2.5]))
+        x = ht.zeros((0,), split=0, device=ht_device)
+        hist, bin_edges = ht.histogram(x, bins=2)
+        self.assertTrue((hist.numpy() == [0, 0]).all())
+        self.assertTrue(np.allclose(bin_edges.numpy(), [0.0, 0.5, 1.0]))
+
+        x = ht.array([1.0, 2.0], device=ht_device)
+        with self.assertRaises(TypeError):
+            ht.histogram(x, bins=[0.0, 1.0])
+        with self.assertRaises(ValueError):
+            ht.histogram(x, bins=0)
+        with self.assertRaises(ValueError):
+            ht.histogram(x, range=(2.0, 1.0))
+        with self.assertRaises(ValueError):
+            ht.histogram(x, weights=ht.ones(3, device=ht_device))
+        with self.assertRaises(ValueError):
+            ht.histogram(ht.array([1.0, float("inf")], split=0, device=ht_device))
+
     def test_max(self):
         data = [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12]]
 
@@ -689,6 +872,77 @@ class TestStatistics(unittest.TestCase):
             self.assertTrue(ht.allclose(ht.mean(iris), 3.46366666666667))
             self.assertTrue(ht.allclose(ht.mean(iris, axis=0), ax0))
 
+    def test_mean_var(self):
+        np_data = np.arange(7 * 5 * 3, dtype=np.float64).reshape(7, 5, 3) ** 1.5
+        for split in [None, 0, 1, 2]:
+            x = ht.array(np_data, split=split, device=ht_device)
+            for axis in [None, 0, 1, 2, (0, 2), [1, 2], -1]:
+                np_axis = tuple(axis) if isinstance(axis, list) else axis
+                for ddof in [0, 1]:
+                    mu, var = ht.mean_var(x, axis=axis, ddof=ddof)
+                    self.assertIsInstance(mu, ht.DNDarray)
+                    self.assertIsInstance(var, ht.DNDarray)
+                    self.assertEqual(mu.dtype, ht.float64)
+                    self.assertEqual(mu.shape, np.mean(np_data, axis=np_axis).shape)
+                    self.assertTrue(np.allclose(mu.numpy(), np.mean(np_data, axis=np_axis)))
+                    self.assertTrue(
+                        np.allclose(var.numpy(), np.var(np_data, axis=np_axis, ddof=ddof))
+                    )
+
+                # the single collective merge in mean and var agrees with numpy as well
+                self.assertTrue(np.allclose(ht.mean(x, axis).numpy(), np.mean(np_data, np_axis)))
+                self.assertTrue(np.allclose(ht.var(x, axis).numpy(), np.var(np_data, np_axis)))
+
+        # integer input and empty local chunks
+        x = ht.arange(2, split=0, device=ht_device)
+        mu, var = ht.mean_var(x)
+        self.assertEqual(mu.item(), 0.5)
+        self.assertEqual(var.item(), 0.25)
+        self.assertAlmostEqual(ht.mean(x).item(), 0.5)
+        self.assertAlmostEqual(ht.var(x, ddof=1).item(), 0.5)
+
+        x = ht.zeros((2, 3, 4), device=ht_device)
+        with self.assertRaises(TypeError):
+            ht.mean_var(x, ddof=1.0)
+        with self.assertRaises(NotImplementedError):
+            ht.mean_var(x, ddof=2)
+        with self.assertRaises(ValueError):
+            ht.mean_var(x, ddof=-1)
+        with self.assertRaises(ValueError):
+            ht.mean_var(x, axis=3)
+        with self.assertRaises(ValueError):
+            ht.mean_var(x, axis=(0, 0))
+        with self.assertRaises(TypeError):
+            ht.mean_var(x, axis="01")
+
+    def test_median(self):
+        np_data = np.random.RandomState(17).randn(9, 4, 5).astype(np.float32)
+        for split in [None, 0, 1, 2]:
+            x = ht.array(np_data, split=split, device=ht_device)
+            for axis in [None, 0, 1, (0, 2)]:
+                res = ht.median(x, axis=axis)
+                self.assertIsInstance(res, ht.DNDarray)
+                self.assertEqual(res.dtype, ht.float32)
+                self.assertTrue(np.allclose(res.numpy(), np.median(np_data, axis=axis)))
+
+        x = ht.array([[10.0, 7.0, 4.0], [3.0, 2.0, 1.0]], split=1, device=ht_device)
+        self.assertEqual(ht.median(x).item(), 3.5)
+        res = ht.median(x, axis=0, sketch_size=8)
+        self.assertTrue(np.allclose(res.numpy(), [6.5, 4.5, 2.5]))
+
+        # processes without data along the reduced split axis
+        size = ht.MPI_WORLD.size
+        np_data = np.arange(2 * 3, dtype=np.float32).reshape(2, 3) * 3 % 5
+        for split in [0, 1]:
+            x = ht.array(np_data, split=split, device=ht_device)
+            self.assertAlmostEqual(ht.median(x).item(), np.median(np_data))
+            res = ht.median(x, axis=split)
+            self.assertTrue(np.allclose(res.numpy(), np.median(np_data, axis=split)))
+            res = ht.median(x, axis=split, sketch_size=4)
+            self.assertTrue(np.allclose(res.numpy(), np.median(np_data, axis=split)))
+        x = ht.zeros((size + 1,), split=0, device=ht_device)[:1] + 5.0
+        self.assertEqual(ht.median(x).item(), 5.0)
+
     def test_min(self):
         data = [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12]]
 
@@ -888,6 +1142,93 @@ class TestStatistics(unittest.TestCase):
         with self.assertRaises(ValueError):
             ht.minimum(random_volume_1, random_volume_2, out=output)
 
+    def test_percentile(self):
+        # duplicates and unevenly sized local chunks
+        np_data = (np.arange(13 * 6, dtype=np.float64).reshape(13, 6) * 7) % 23
+        q = [0, 12.5, 50, 90, 100]
+        for split in [None, 0, 1]:
+            x = ht.array(np_data, split=split, device=ht_device)
+            for axis in [None, 0, 1, -1]:
+                res = ht.percentile(x, q, axis=axis)
+                expected = np.percentile(np_data, q, axis=axis)
+                self.assertEqual(res.shape, expected.shape)
+                self.assertEqual(res.dtype, ht.float64)
+                self.assertTrue(np.allclose(res.numpy(), expected))
+
+                res = ht.percentile(x, 37.5, axis=axis)
+                self.assertEqual(res.shape, np.percentile(np_data, 37.5, axis=axis).shape)
+                self.assertTrue(np.allclose(res.numpy(), np.percentile(np_data, 37.5, axis=axis)))
+
+                res = ht.quantile(x, ht.array([0.25, 0.75]), axis=axis)
+                expected = np.percentile(np_data, [25, 75], axis=axis)
+                self.assertTrue(np.allclose(res.numpy(), expected))
+
+        # interpolation between the data points 2 and 3 of 1, 2, 3, 4
+        x = ht.array([4, 2, 1, 3], split=0, device=ht_device)
+        expected = {"linear": 2.5, "lower": 2, "higher": 3, "midpoint": 2.5, "nearest": 3}
+        for interpolation, value in expected.items():
+            res = ht.percentile(x, 50, interpolation=interpolation)
+            self.assertEqual(res.item(), value)
+            if interpolation in ("lower", "higher", "nearest"):
+                self.assertEqual(res.dtype, x.dtype)
+            else:
+                self.assertEqual(res.dtype, ht.float32)
+        self.assertEqual(ht.percentile(x, 100 / 3, interpolation="nearest").item(), 2)
+
+        # integers beyond the float64 precision are selected exactly, also with empty local chunks
+        values = [2 ** 60 + 3, 2 ** 60 + 1, 2 ** 60 + 4, 2 ** 60 + 2]
+        for x in (
+            ht.array(values, split=0, device=ht_device),
+            ht.array(values * ht.MPI_WORLD.size, split=0, device=ht_device)[:4],
+        ):
+            res = ht.percentile(x, [0, 50, 100], interpolation="lower")
+            self.assertEqual(res.dtype, ht.int64)
+            self.assertEqual(res.numpy().tolist(), [2 ** 60 + 1, 2 ** 60 + 2, 2 ** 60 + 4])
+            self.assertEqual(ht.percentile(x, 50, interpolation="higher").item(), 2 ** 60 + 3)
+
+        # values containing NaN have NaN quantiles, like in numpy
+        np_data = np.arange(12 * ht.MPI_WORLD.size, dtype=np.float32).reshape(-1, 3)
+        np_data[1::2, 1] = np.nan
+        np_data[-1, 2] = np.nan
+        for split in [None, 0, 1]:
+            x = ht.array(np_data, split=split, device=ht_device)
+            for axis in [None, 0, 1]:
+                res = ht.percentile(x, [0, 50, 100], axis=axis)
+                expected = np.percentile(np_data, [0, 50, 100], axis=axis)
+                self.assertTrue(np.allclose(res.numpy(), expected, equal_nan=True))
+                expected = np.isnan(np.median(np_data, axis=axis))
+                res = ht.median(x, axis=axis, sketch_size=10)
+                self.assertTrue(np.array_equal(np.isnan(res.numpy()), expected))
+                res = ht.percentile(x, 50, axis=axis, interpolation="lower")
+                self.assertTrue(np.array_equal(np.isnan(res.numpy()), expected))
+
+        # approximation by quantile sketches, exact if they hold all values
+        x = ht.arange(1000, dtype=ht.float32, split=0, device=ht_device)
+        res = ht.percentile(x, [10, 50, 90], sketch_size=1000)
+        self.assertTrue(np.allclose(res.numpy(), np.percentile(np.arange(1000), [10, 50, 90])))
+        res = ht.percentile(x, [10, 50, 90], sketch_size=50)
+        self.assertTrue(np.allclose(res.numpy(), [99.9, 499.5, 899.1], atol=2 * 1000 / 50))
+
+        x = ht.zeros((2, 3), device=ht_device)
+        with self.assertRaises(ValueError):
+            ht.percentile(x, 101)
+        with self.assertRaises(ValueError):
+            ht.percentile(x, [-1, 50])
+        with self.assertRaises(ValueError):
+            ht.percentile(x, [[10, 50]])
+        with self.assertRaises(ValueError):
+            ht.quantile(x, 1.5)
+        with self.assertRaises(ValueError):
+            ht.percentile(x, 50, interpolation="cubic")
+        with self.assertRaises(TypeError):
+            ht.percentile(x, 50, sketch_size=1.5)
+        with self.assertRaises(ValueError):
+            ht.percentile(x, 50, sketch_size=0)
+        with self.assertRaises(ValueError):
+            ht.percentile(x, 50, axis=(0, 0))
+        with self.assertRaises(ValueError):
+            ht.percentile(ht.zeros((0, 3), device=ht_device), 50, axis=0)
+
     def test_std(self):
         # test basics
         a = ht.arange(1, 5, device=ht_device)
@@ -521,6 +521,9 @@ for i, operand_a in enumerate(__type_codes.keys()):
                 __type_promotions[i][j] = target
                 break
 
+# cache of already resolved promotions, keyed on the passed type specifiers
+__promotion_cache = {}
+
 
 def promote_types(type1, type2):
     """
@@ -548,10 +551,21 @@ def promote_types(type1, type2):
     >>> ht.promote_types('i8', 'f4')
     ht.float64
     """
+    try:
+        return __promotion_cache[type1, type2]
+    except KeyError:
+        cacheable = True
+    except TypeError:
+        cacheable = False
+
     typecode_type1 = __type_codes[canonical_heat_type(type1)]
     typecode_type2 = __type_codes[canonical_heat_type(type2)]
+    promoted = __type_promotions[typecode_type1][typecode_type2]
+
+    if cacheable:
+        __promotion_cache[type1, type2] = promoted
 
-    return __type_promotions[typecode_type1][typecode_type2]
+    return promoted
 
 
 class finfo: